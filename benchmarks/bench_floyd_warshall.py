@@ -0,0 +1,80 @@
+"""
+Benchmark all-pairs shortest paths on a random routing-style matrix graph:
+vectorized and blocked Floyd-Warshall against the naive triple loop.
+
+Run from the repository root:
+    python -m benchmarks.bench_floyd_warshall --vertices 5000 --workers 8
+"""
+import argparse
+import os
+import random
+import time
+
+import numpy as np
+
+from src.algorithms.floyd_warshall import blocked_floyd_warshall, floyd_warshall
+from src.data_structures.graphs.directed.directed_matrix_graph import DirectedMatrixGraph
+
+
+def random_graph(num_vertices, degree, seed):
+    """Random matrix graph with about `degree` outgoing edges per vertex."""
+    rng = random.Random(seed)
+    graph = DirectedMatrixGraph(num_vertices)
+    for u in range(num_vertices):
+        for _ in range(degree):
+            graph.add_edge(u, rng.randrange(num_vertices), rng.randint(1, 100))
+    return graph
+
+
+def naive_floyd_warshall(graph):
+    """Pure-Python O(V³) triple loop, used as the baseline."""
+    n = graph.num_vertices
+    dist = [[0 if u == v else (w if w is not None else float('inf'))
+             for v, w in enumerate(row)] for u, row in enumerate(graph.matrix)]
+    for k in range(n):
+        row_k = dist[k]
+        for i in range(n):
+            d_ik = dist[i][k]
+            row_i = dist[i]
+            for j in range(n):
+                if d_ik + row_k[j] < row_i[j]:
+                    row_i[j] = d_ik + row_k[j]
+    return dist
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<32} {(time.perf_counter() - start) * 1000:12.2f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vertices', type=int, default=1_000)
+    parser.add_argument('--degree', type=int, default=8)
+    parser.add_argument('--block-size', type=int, default=256)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2)
+    parser.add_argument('--naive-max', type=int, default=400,
+                        help="skip the naive loop above this many vertices")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    graph = random_graph(args.vertices, args.degree, args.seed)
+    print(f"{graph!r}, ~{args.degree} edges per vertex")
+
+    expected = timed("floyd_warshall", lambda: floyd_warshall(graph))
+    blocked = timed(f"blocked (block={args.block_size})",
+                    lambda: blocked_floyd_warshall(graph, args.block_size))
+    parallel = timed(f"blocked (workers={args.workers})",
+                     lambda: blocked_floyd_warshall(graph, args.block_size, args.workers))
+    assert np.array_equal(blocked.distances, expected.distances)
+    assert np.array_equal(parallel.distances, expected.distances)
+
+    if args.vertices <= args.naive_max:
+        naive = timed("naive triple loop", lambda: naive_floyd_warshall(graph))
+        assert np.array_equal(np.array(naive), expected.distances)
+
+
+if __name__ == '__main__':
+    main()
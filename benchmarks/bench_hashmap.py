@@ -0,0 +1,93 @@
+"""
+Benchmark the chaining HashMap against OpenAddressingHashMap: memory per
+entry (measured with tracemalloc, excluding the key and value objects
+themselves) and put/get throughput.
+
+Run from the repository root:
+    python -m benchmarks.bench_hashmap --sizes 1000000 10000000
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from src.data_structures.hashtables.hashmap.hashmap import HashMap
+from src.data_structures.hashtables.hashmap.open_addressing_hashmap import OpenAddressingHashMap
+
+MAPS = [("HashMap (chaining)", HashMap),
+        ("OpenAddressingHashMap", OpenAddressingHashMap)]
+
+
+def bytes_per_entry(cls, keys):
+    """Bytes the map allocates per entry; keys are reused as values."""
+    gc.collect()
+    tracemalloc.start()
+    hash_map = cls()
+    for key in keys:
+        hash_map.put(key, key)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return used / len(keys)
+
+
+def throughput(label, count, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<22} {count / elapsed / 1e6:8.3f} M ops/s")
+
+
+def run(cls, keys, missing):
+    hash_map = cls()
+    put, get, contains = hash_map.put, hash_map.get, hash_map.contains
+
+    def insert():
+        for key in keys:
+            put(key, key)
+
+    def update():
+        for key in keys:
+            put(key, 0)
+
+    def lookup():
+        for key in keys:
+            get(key)
+
+    def miss():
+        for key in missing:
+            contains(key)
+
+    n = len(keys)
+    throughput("put (insert)", n, insert)
+    throughput("put (update)", n, update)
+    throughput("get (hit)", n, lookup)
+    throughput("contains (miss)", len(missing), miss)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--skip-memory', action='store_true',
+                        help="skip the (slow) tracemalloc runs")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    for size in args.sizes:
+        # Random 62-bit ints: allocated objects, with well-spread hashes
+        keys = [rng.getrandbits(62) for _ in range(size)]
+        rng.shuffle(keys)
+        missing = [-key - 1 for key in keys[:size // 10 or 1]]
+
+        print(f"\n{size:,} keys")
+        for name, cls in MAPS:
+            print(name)
+            if not args.skip_memory:
+                print(f"  {'memory':<22} {bytes_per_entry(cls, keys):8.1f} bytes/entry")
+            run(cls, keys, missing)
+
+
+if __name__ == '__main__':
+    main()
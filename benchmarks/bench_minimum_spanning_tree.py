@@ -0,0 +1,77 @@
+"""
+Benchmark the minimum spanning tree algorithms on a sparse adjacency list
+graph and a dense adjacency matrix graph.
+
+Run from the repository root:
+    python -m benchmarks.bench_minimum_spanning_tree --vertices 100000 --edges 400000
+"""
+import argparse
+import os
+import random
+import time
+
+from src.algorithms.minimum_spanning_tree import (
+    boruvka, kruskal, prim_eager, prim_lazy
+)
+from src.data_structures.graphs.undirected.undirected_graph import UndirectedGraph
+from src.data_structures.graphs.undirected.undirected_matrix_graph import UndirectedMatrixGraph
+
+
+def sparse_graph(num_vertices, num_edges, seed):
+    """Random adjacency list graph with integer weights in [1, 1000]."""
+    rng = random.Random(seed)
+    edges = ((rng.randrange(num_vertices), rng.randrange(num_vertices),
+              rng.randint(1, 1000)) for _ in range(num_edges))
+    graph = UndirectedGraph.from_edge_list(edges)
+    for vertex in range(num_vertices):
+        graph.add_vertex(vertex)
+    return graph
+
+
+def dense_graph(num_vertices, density, seed):
+    """Random adjacency matrix graph with each edge present with probability density."""
+    rng = random.Random(seed)
+    graph = UndirectedMatrixGraph(num_vertices)
+    for u in range(num_vertices):
+        for v in range(u + 1, num_vertices):
+            if rng.random() < density:
+                graph.add_edge(u, v, rng.randint(1, 1000))
+    return graph
+
+
+def compare(label, graph, workers):
+    print(f"\n{label}")
+    algorithms = [
+        ("kruskal", kruskal),
+        ("prim_lazy", prim_lazy),
+        ("prim_eager", prim_eager),
+        ("boruvka", boruvka),
+        (f"boruvka (workers={workers})", lambda g: boruvka(g, workers=workers)),
+    ]
+
+    for name, mst in algorithms:
+        start = time.perf_counter()
+        forest = mst(graph)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<24} {elapsed * 1000:10.2f} ms   weight={forest.total_weight}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vertices', type=int, default=50_000)
+    parser.add_argument('--edges', type=int, default=200_000)
+    parser.add_argument('--dense-vertices', type=int, default=1_000)
+    parser.add_argument('--density', type=float, default=0.5)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    sparse = sparse_graph(args.vertices, args.edges, args.seed)
+    compare(f"sparse: {sparse!r}", sparse, args.workers)
+
+    dense = dense_graph(args.dense_vertices, args.density, args.seed)
+    compare(f"dense: {dense!r}, density={args.density}", dense, args.workers)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark the shortest-path algorithms on large random directed graphs.
+
+Run from the repository root:
+    python -m benchmarks.bench_shortest_paths --vertices 100000 --edges 500000
+"""
+import argparse
+import random
+import time
+
+from src.algorithms.shortest_paths import (
+    bellman_ford, bidirectional_dijkstra, dijkstra, dijkstra_path
+)
+from src.data_structures.graphs.directed.directed_graph import IndexedDirectedGraph
+
+
+def random_graph(num_vertices, num_edges, seed):
+    """Random directed graph with integer weights in [1, 100]."""
+    rng = random.Random(seed)
+    edges = ((rng.randrange(num_vertices), rng.randrange(num_vertices),
+              rng.randint(1, 100)) for _ in range(num_edges))
+    graph = IndexedDirectedGraph.from_edge_list(edges)
+    for vertex in range(num_vertices):
+        graph.add_vertex(vertex)
+    return graph
+
+
+def timed(label, func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<32} {elapsed * 1000:10.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vertices', type=int, default=50_000)
+    parser.add_argument('--edges', type=int, default=250_000)
+    parser.add_argument('--queries', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    graph = random_graph(args.vertices, args.edges, args.seed)
+    print(f"built {graph!r} in {time.perf_counter() - start:.2f} s")
+
+    rng = random.Random(args.seed + 1)
+    pairs = [(rng.randrange(args.vertices), rng.randrange(args.vertices))
+             for _ in range(args.queries)]
+    pair_iter = iter(pairs * 2)
+
+    timed("dijkstra (single source)", lambda: dijkstra(graph, 0), 1)
+    timed("dijkstra_path (early exit)",
+          lambda: dijkstra_path(graph, *next(pair_iter)), args.queries)
+    timed("bidirectional_dijkstra",
+          lambda: bidirectional_dijkstra(graph, *next(pair_iter)), args.queries)
+
+    small = random_graph(args.vertices // 20, args.edges // 20, args.seed)
+    timed(f"bellman_ford (V={args.vertices // 20})",
+          lambda: bellman_ford(small, 0), 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,13 @@
+from typing import Any
+
+
+def is_undirected(graph: Any) -> bool:
+    """
+    Check if a graph is undirected. Every graph class in
+    src.data_structures.graphs declares a directed class attribute; a graph
+    without one is treated as directed, so an unknown class never slips
+    through a check that needs an undirected graph.
+
+    Time Complexity: O(1)
+    """
+    return getattr(graph, 'directed', True) is False
@@ -0,0 +1,172 @@
+from __future__ import annotations
+from array import array
+from typing import Any, Dict, Generic, Hashable, List, Sequence, Tuple, TypeVar
+
+from src.algorithms.graph_utils import is_undirected
+
+V = TypeVar('V', bound=Hashable)
+
+
+def _to_csr(graph: Any) -> Tuple[Sequence, Sequence[int], Sequence[int]]:
+    """
+    Integer CSR view of an undirected graph as (labels, offsets, targets).
+    Snapshots (FrozenUndirectedGraph) are used as-is; adjacency list graphs
+    are converted through get_vertices()/get_neighbors() and matrix graphs
+    through get_neighbors() over 0..num_vertices-1. Self-loops are dropped.
+
+    Time Complexity: O(V + E), O(V²) for matrix graphs
+
+    Raises:
+        ValueError: If graph is not undirected
+    """
+    if not is_undirected(graph):
+        raise ValueError("Core decomposition requires an undirected graph")
+
+    if hasattr(graph, 'offsets') and hasattr(graph, 'targets'):
+        return graph.vertices, graph.offsets, graph.targets
+
+    if hasattr(graph, 'get_vertices'):
+        labels = list(graph.get_vertices())
+    else:
+        labels = list(range(graph.num_vertices))
+
+    index = {vertex: i for i, vertex in enumerate(labels)}
+    offsets = array('q', [0])
+    targets = array('q')
+
+    for i, vertex in enumerate(labels):
+        targets.extend([index[neighbor] for neighbor, _ in graph.get_neighbors(vertex)
+                        if index[neighbor] != i])
+        offsets.append(len(targets))
+
+    return labels, offsets, targets
+
+
+class CoreDecomposition(Generic[V]):
+    """
+    Core numbers of every vertex plus a degeneracy ordering. The k-core is
+    the largest subgraph in which every vertex has degree at least k; a
+    vertex's core number is the largest k whose k-core contains it.
+    """
+
+    def __init__(self, labels: Sequence[V], cores: Sequence[int],
+                 order: Sequence[int]) -> None:
+        """
+        Wrap per-id core numbers and the removal order of vertex ids.
+
+        Time Complexity: O(V)
+        """
+        self.core_numbers: Dict[V, int] = {
+            labels[i]: cores[i] for i in range(len(labels))}
+        # Vertices in the order they were peeled off (smallest degree first)
+        self.order: List[V] = [labels[i] for i in order]
+        self.degeneracy: int = max(cores, default=0)
+
+    def core_number(self, vertex: V) -> int:
+        """
+        Get the core number of vertex.
+
+        Time Complexity: O(1)
+
+        Raises:
+            ValueError: If vertex not in graph
+        """
+        if vertex not in self.core_numbers:
+            raise ValueError(f"Vertex {vertex} not in graph")
+
+        return self.core_numbers[vertex]
+
+    def k_core(self, k: int) -> List[V]:
+        """
+        Get the vertices of the k-core (every vertex with core number >= k),
+        in degeneracy order. Removing all other vertices from the graph
+        prunes it to the k-core.
+
+        Time Complexity: O(V)
+        """
+        return [vertex for vertex in self.order if self.core_numbers[vertex] >= k]
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __repr__(self) -> str:
+        return (f"CoreDecomposition(vertices={len(self.order)}, "
+                f"degeneracy={self.degeneracy})")
+
+
+def core_decomposition(graph: Any) -> CoreDecomposition:
+    """
+    Batagelj-Zaversnik k-core decomposition. Vertices are kept in an array
+    sorted by current degree, with buckets[d] pointing at the first vertex of
+    degree d; repeatedly taking the next vertex and decrementing the degree
+    of its unprocessed neighbors moves each of them one bucket down in O(1).
+
+    Works on UndirectedGraph, CompactUndirectedGraph, UndirectedMatrixGraph
+    and directly on the CSR arrays of a FrozenUndirectedGraph.
+
+    Time Complexity: O(V + E)
+
+    Raises:
+        ValueError: If graph is not undirected
+    """
+    labels, offsets, targets = _to_csr(graph)
+    n = len(labels)
+
+    degree = array('q', [offsets[i + 1] - offsets[i] for i in range(n)])
+    max_degree = max(degree, default=0)
+
+    # Counting sort of vertices by degree: vert is the sorted order, pos[v]
+    # is v's position in it and buckets[d] the start of the degree-d bucket
+    buckets = array('q', [0]) * (max_degree + 1)
+    for d in degree:
+        buckets[d] += 1
+
+    start = 0
+    for d in range(max_degree + 1):
+        buckets[d], start = start, start + buckets[d]
+
+    pos = array('q', [0]) * n
+    vert = array('q', [0]) * n
+    for v in range(n):
+        pos[v] = buckets[degree[v]]
+        vert[pos[v]] = v
+        buckets[degree[v]] += 1
+
+    # Restore bucket starts, shifted up by the counting pass
+    for d in range(max_degree, 0, -1):
+        buckets[d] = buckets[d - 1]
+    buckets[0] = 0
+
+    for i in range(n):
+        v = vert[i]
+        dv = degree[v]
+
+        for k in range(offsets[v], offsets[v + 1]):
+            u = targets[k]
+            du = degree[u]
+
+            if du > dv:
+                # Swap u with the first vertex of its bucket, then shrink
+                # the bucket so u falls into the one below
+                pu, pw = pos[u], buckets[du]
+                w = vert[pw]
+                if u != w:
+                    vert[pu], vert[pw] = w, u
+                    pos[u], pos[w] = pw, pu
+                buckets[du] += 1
+                degree[u] = du - 1
+
+    return CoreDecomposition(labels, degree, vert)
+
+
+def degeneracy_ordering(graph: Any) -> List:
+    """
+    Order the vertices so each has at most degeneracy(graph) neighbors
+    later in the order (smallest-last ordering).
+
+    Time Complexity: O(V + E)
+
+    Raises:
+        ValueError: If graph is not undirected
+    """
+    return core_decomposition(graph).order
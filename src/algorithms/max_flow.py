@@ -0,0 +1,473 @@
+from __future__ import annotations
+from array import array
+from collections import deque
+from typing import Any, Dict, Generic, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
+
+V = TypeVar('V', bound=Hashable)
+
+
+class _Residual:
+    """
+    Residual network over dense integer ids. Edge k of the input becomes arc
+    2k (forward, full capacity) and arc 2k + 1 (reverse, capacity 0), so the
+    partner of arc a is a ^ 1. The arcs leaving vertex v are
+    arcs[offsets[v]:offsets[v + 1]].
+    """
+
+    def __init__(self, graph: Any) -> None:
+        """
+        Build the residual arrays from get_neighbors() of every vertex.
+        Capacities are stored as int64 when all weights are ints, float64
+        otherwise.
+
+        Time Complexity: O(V + E)
+
+        Raises:
+            ValueError: If a capacity is negative
+        """
+        if hasattr(graph, 'get_vertices'):
+            self.labels = list(graph.get_vertices())
+        else:
+            self.labels = list(range(graph.num_vertices))
+
+        self.index = {vertex: i for i, vertex in enumerate(self.labels)}
+        n = len(self.labels)
+        heads: List[int] = []
+        capacities: List[Any] = []
+        out_arcs = [0] * n
+
+        for u, vertex in enumerate(self.labels):
+            for neighbor, capacity in graph.get_neighbors(vertex):
+                if capacity < 0:
+                    raise ValueError(
+                        f"Edge {vertex} -> {neighbor} has negative capacity {capacity}")
+
+                v = self.index[neighbor]
+                heads += (v, u)
+                capacities += (capacity, 0)
+                out_arcs[u] += 1
+                out_arcs[v] += 1
+
+        self.head = array('q', heads)
+        typecode = 'q' if all(type(c) is int for c in capacities) else 'd'
+        self.cap = array(typecode, capacities)
+        self.original = array(typecode, capacities)
+
+        # Bucket every arc under its tail (the head of its partner)
+        self.offsets = array('q', [0]) * (n + 1)
+        for v in range(n):
+            self.offsets[v + 1] = self.offsets[v] + out_arcs[v]
+
+        fill = array('q', self.offsets[:-1])
+        self.arcs = array('q', [0]) * len(heads)
+        for a in range(len(heads)):
+            tail = heads[a ^ 1]
+            self.arcs[fill[tail]] = a
+            fill[tail] += 1
+
+    def ids(self, source: Any, sink: Any) -> Tuple[int, int]:
+        """
+        Ids of the source and sink.
+
+        Raises:
+            ValueError: If either is missing or they are the same vertex
+        """
+        for vertex in (source, sink):
+            if vertex not in self.index:
+                raise ValueError(f"Vertex {vertex} not in graph")
+
+        if source == sink:
+            raise ValueError("Source and sink must be different vertices")
+
+        return self.index[source], self.index[sink]
+
+    def reachable(self, s: int) -> bytearray:
+        """
+        Mark the vertices reachable from s along arcs with spare capacity.
+
+        Time Complexity: O(V + E)
+        """
+        seen = bytearray(len(self.labels))
+        seen[s] = 1
+        queue = deque([s])
+
+        while queue:
+            u = queue.popleft()
+            for k in range(self.offsets[u], self.offsets[u + 1]):
+                a = self.arcs[k]
+                v = self.head[a]
+                if self.cap[a] > 0 and not seen[v]:
+                    seen[v] = 1
+                    queue.append(v)
+
+        return seen
+
+    def result(self, s: int, value: Any) -> 'MaxFlow':
+        """
+        Package the flow on every forward arc and the source side of the
+        minimum cut.
+        """
+        labels, head = self.labels, self.head
+        flows = {}
+
+        for a in range(0, len(head), 2):
+            flow = self.original[a] - self.cap[a]
+            if flow > 0:
+                flows[(labels[head[a ^ 1]], labels[head[a]])] = flow
+
+        seen = self.reachable(s)
+        source_side = {labels[v] for v in range(len(labels)) if seen[v]}
+        cut = [(labels[head[a ^ 1]], labels[head[a]], self.original[a])
+               for a in range(0, len(head), 2)
+               if seen[head[a ^ 1]] and not seen[head[a]] and self.original[a] > 0]
+
+        return MaxFlow(value, flows, source_side, cut)
+
+
+class MaxFlow(Generic[V]):
+    """
+    A maximum flow: its value, the flow on each edge that carries any, and
+    the minimum cut found from the final residual network.
+    """
+
+    def __init__(self, value: Any, flows: Dict[Tuple[V, V], Any],
+                 source_side: Set[V], cut: List[Tuple[V, V, Any]]) -> None:
+        """
+        Wrap the results of a max-flow computation.
+
+        Time Complexity: O(1)
+        """
+        self.value = value
+        self.flows = flows
+        # Vertices still reachable from the source in the residual network
+        self.source_side = source_side
+        self.cut = cut
+
+    def flow(self, from_vertex: V, to_vertex: V) -> Any:
+        """
+        Get the flow on the edge from from_vertex to to_vertex (0 if none).
+
+        Time Complexity: O(1)
+        """
+        return self.flows.get((from_vertex, to_vertex), 0)
+
+    def min_cut(self) -> List[Tuple[V, V, Any]]:
+        """
+        Get the (from, to, capacity) edges of a minimum cut. Their total
+        capacity equals the flow value.
+
+        Time Complexity: O(1)
+        """
+        return self.cut
+
+    def __repr__(self) -> str:
+        return f"MaxFlow(value={self.value!r}, cut_edges={len(self.cut)})"
+
+
+def dinic(graph: Any, source: V, sink: V) -> MaxFlow[V]:
+    """
+    Dinic's algorithm: build a BFS level graph from the source, then send a
+    blocking flow along strictly level-increasing arcs with an iterative DFS
+    that keeps a current-arc pointer per vertex, and repeat.
+
+    Capacities are the edge weights of any directed graph (undirected
+    graphs give each edge capacity in both directions).
+
+    Time Complexity: O(V² E), O(E sqrt(V)) on unit-capacity networks
+
+    Raises:
+        ValueError: If source or sink is missing, they are equal, or a
+        capacity is negative
+    """
+    net = _Residual(graph)
+    s, t = net.ids(source, sink)
+    n = len(net.labels)
+    head, cap, arcs, offsets = net.head, net.cap, net.arcs, net.offsets
+    total = 0
+
+    while True:
+        # Level graph
+        level = array('q', [-1]) * n
+        level[s] = 0
+        queue = deque([s])
+        while queue:
+            u = queue.popleft()
+            for k in range(offsets[u], offsets[u + 1]):
+                a = arcs[k]
+                v = head[a]
+                if cap[a] > 0 and level[v] < 0:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+
+        if level[t] < 0:
+            break
+
+        # Blocking flow: grow a path of arcs from s, augmenting at t
+        current = array('q', offsets[:-1])
+        path: List[int] = []
+        u = s
+
+        while True:
+            if u == t:
+                pushed = min(cap[a] for a in path)
+                for a in path:
+                    cap[a] -= pushed
+                    cap[a ^ 1] += pushed
+                total += pushed
+
+                # Retreat to the tail of the first saturated arc
+                first = next(i for i, a in enumerate(path) if cap[a] == 0)
+                del path[first:]
+                u = head[path[-1]] if path else s
+                continue
+
+            end = offsets[u + 1]
+            k = current[u]
+            while k < end:
+                a = arcs[k]
+                if cap[a] > 0 and level[head[a]] == level[u] + 1:
+                    break
+                k += 1
+            current[u] = k
+
+            if k < end:
+                path.append(arcs[k])
+                u = head[arcs[k]]
+            elif u == s:
+                break
+            else:
+                # Dead end: drop u from the level graph and back up
+                level[u] = -1
+                path.pop()
+                u = head[path[-1]] if path else s
+
+    return net.result(s, total)
+
+
+def push_relabel(graph: Any, source: V, sink: V) -> MaxFlow[V]:
+    """
+    Goldberg-Tarjan push-relabel with the highest-label selection rule and
+    the gap heuristic. Active vertices are kept in buckets by height and the
+    highest one is discharged first; when no vertex is left at some height
+    below V, every vertex above it is lifted past V at once, since none of
+    them can reach the sink any more. Excess that cannot reach the sink is
+    then pushed back to the source, so the result is a valid flow.
+
+    Time Complexity: O(V² sqrt(E))
+
+    Raises:
+        ValueError: If source or sink is missing, they are equal, or a
+        capacity is negative
+    """
+    net = _Residual(graph)
+    s, t = net.ids(source, sink)
+    n = len(net.labels)
+    head, cap, arcs, offsets = net.head, net.cap, net.arcs, net.offsets
+
+    height = array('q', [0]) * n
+    excess = [0] * n
+    current = array('q', offsets[:-1])
+    # Heights never exceed 2V - 1
+    count = array('q', [0]) * (2 * n + 1)
+    buckets: List[List[int]] = [[] for _ in range(2 * n + 1)]
+    height[s] = n
+    count[0] = n - 1
+    count[n] = 1
+    highest = 0
+
+    # Saturate every arc out of the source
+    for k in range(offsets[s], offsets[s + 1]):
+        a = arcs[k]
+        v = head[a]
+        if cap[a] > 0:
+            if excess[v] == 0 and v != t:
+                buckets[0].append(v)
+            excess[v] += cap[a]
+            excess[s] -= cap[a]
+            cap[a ^ 1] += cap[a]
+            cap[a] = 0
+
+    while True:
+        while highest >= 0 and not buckets[highest]:
+            highest -= 1
+        if highest < 0:
+            break
+
+        u = buckets[highest].pop()
+
+        # Discharge u
+        while excess[u] > 0:
+            k = current[u]
+
+            if k == offsets[u + 1]:
+                # Relabel to one above the lowest residual neighbor
+                old = height[u]
+                new = 2 * n
+                for j in range(offsets[u], offsets[u + 1]):
+                    a = arcs[j]
+                    if cap[a] > 0 and height[head[a]] + 1 < new:
+                        new = height[head[a]] + 1
+                current[u] = offsets[u]
+                count[old] -= 1
+
+                if count[old] == 0 and old < n:
+                    # Gap: nothing between here and the sink any more
+                    for v in range(n):
+                        if old < height[v] < n:
+                            count[height[v]] -= 1
+                            height[v] = n + 1
+                            count[n + 1] += 1
+                            current[v] = offsets[v]
+                    for h in range(old + 1, n):
+                        buckets[n + 1].extend(buckets[h])
+                        buckets[h].clear()
+                    new = max(new, n + 1)
+                    highest = max(highest, n + 1)
+
+                height[u] = new
+                count[new] += 1
+                continue
+
+            a = arcs[k]
+            v = head[a]
+            if cap[a] > 0 and height[u] == height[v] + 1:
+                pushed = min(excess[u], cap[a])
+                cap[a] -= pushed
+                cap[a ^ 1] += pushed
+                excess[u] -= pushed
+
+                if excess[v] == 0 and v != s and v != t:
+                    buckets[height[v]].append(v)
+                    highest = max(highest, height[v])
+                excess[v] += pushed
+            else:
+                current[u] = k + 1
+
+    return net.result(s, excess[t])
+
+
+def hopcroft_karp(graph: Any, left: Optional[Iterable[V]] = None) -> List[Tuple[V, V]]:
+    """
+    Hopcroft-Karp maximum bipartite matching. Each phase finds the shortest
+    augmenting path length with a BFS from all free left vertices, then
+    augments along a maximal set of vertex-disjoint shortest paths with an
+    iterative DFS, over integer adjacency arrays.
+
+    If left is not given the graph is 2-colored, taking the first vertex of
+    each component as a left vertex.
+
+    Time Complexity: O(E sqrt(V))
+
+    Returns:
+        List of (left vertex, right vertex) matched pairs
+
+    Raises:
+        ValueError: If the graph is not bipartite (or left is not one side)
+    """
+    labels = list(graph.get_vertices())
+    index = {vertex: i for i, vertex in enumerate(labels)}
+    n = len(labels)
+    neighbors = [[index[v] for v, _ in graph.get_neighbors(u)] for u in labels]
+
+    side = bytearray(n)
+    if left is not None:
+        for vertex in left:
+            side[index[vertex]] = 1
+        for u in range(n):
+            if any(side[u] == side[v] for v in neighbors[u]):
+                raise ValueError("Graph is not bipartite with the given left side")
+    else:
+        colored = bytearray(n)
+        for start in range(n):
+            if colored[start]:
+                continue
+            colored[start] = 1
+            side[start] = 1
+            stack = [start]
+            while stack:
+                u = stack.pop()
+                for v in neighbors[u]:
+                    if not colored[v]:
+                        colored[v] = 1
+                        side[v] = 1 - side[u]
+                        stack.append(v)
+                    elif side[v] == side[u]:
+                        raise ValueError("Graph is not bipartite")
+
+    lefts = [u for u in range(n) if side[u]]
+    # Left-side CSR adjacency into right ids
+    offsets = array('q', [0])
+    targets = array('q')
+    for u in lefts:
+        targets.extend(neighbors[u])
+        offsets.append(len(targets))
+
+    free = -1
+    mate_left = array('q', [free]) * len(lefts)
+    mate_right = array('q', [free]) * n
+    unmatched = len(lefts)
+
+    while True:
+        # BFS layers over left positions, from every free left vertex
+        dist = array('q', [-1]) * len(lefts)
+        queue = deque(i for i in range(len(lefts)) if mate_left[i] == free)
+        for i in queue:
+            dist[i] = 0
+        found = False
+
+        while queue:
+            i = queue.popleft()
+            for k in range(offsets[i], offsets[i + 1]):
+                j = mate_right[targets[k]]
+                if j == free:
+                    found = True
+                elif dist[j] < 0:
+                    dist[j] = dist[i] + 1
+                    queue.append(j)
+
+        if not found:
+            break
+
+        # Vertex-disjoint shortest augmenting paths
+        current = array('q', offsets[:-1])
+        for root in range(len(lefts)):
+            if mate_left[root] != free:
+                continue
+
+            stack = [root]
+            while stack:
+                i = stack[-1]
+                advanced = False
+
+                while current[i] < offsets[i + 1]:
+                    r = targets[current[i]]
+                    current[i] += 1
+                    j = mate_right[r]
+
+                    if j == free:
+                        # Flip the path: each stacked left vertex takes the
+                        # right vertex its successor was matched to
+                        while stack:
+                            i = stack.pop()
+                            previous = mate_left[i]
+                            mate_left[i] = r
+                            mate_right[r] = i
+                            r = previous
+                        unmatched -= 1
+                        advanced = True
+                        break
+
+                    if dist[j] == dist[i] + 1:
+                        stack.append(j)
+                        advanced = True
+                        break
+
+                if not advanced:
+                    dist[i] = -1
+                    stack.pop()
+
+        if unmatched == 0:
+            break
+
+    return [(labels[lefts[i]], labels[mate_left[i]])
+            for i in range(len(lefts)) if mate_left[i] != free]
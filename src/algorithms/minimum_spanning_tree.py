@@ -0,0 +1,328 @@
+from __future__ import annotations
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Generic, Hashable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+from src.algorithms.graph_utils import is_undirected
+from src.data_structures.priority_queue.priority_queue import PriorityQueue
+from src.data_structures.union_find.union_find import UnionFind
+
+V = TypeVar('V', bound=Hashable)
+
+# Worker-side copy of the edge arrays, set by _attach()
+_us: Optional[array] = None
+_vs: Optional[array] = None
+_ws: Optional[List] = None
+
+
+class SpanningForest(Generic[V]):
+    """
+    A minimum spanning forest: one minimum spanning tree per connected
+    component, as a list of (vertex1, vertex2, weight) edges.
+    """
+
+    def __init__(self, edges: List[Tuple[V, V, Any]], total_weight: Any,
+                 num_vertices: int) -> None:
+        """
+        Wrap the edges chosen for a graph with num_vertices vertices.
+
+        Time Complexity: O(1)
+        """
+        self.edges = edges
+        self.total_weight = total_weight
+        self.num_vertices = num_vertices
+
+    @property
+    def num_trees(self) -> int:
+        """
+        Number of trees in the forest (the graph's connected components).
+
+        Time Complexity: O(1)
+        """
+        return self.num_vertices - len(self.edges)
+
+    def is_tree(self) -> bool:
+        """
+        Check if the forest is a single spanning tree, i.e. the graph is
+        connected.
+
+        Time Complexity: O(1)
+        """
+        return self.num_trees <= 1
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def __iter__(self) -> Iterator[Tuple[V, V, Any]]:
+        return iter(self.edges)
+
+    def __repr__(self) -> str:
+        return (f"SpanningForest(edges={len(self.edges)}, "
+                f"total_weight={self.total_weight!r}, trees={self.num_trees})")
+
+
+def _check_undirected(graph: Any) -> None:
+    """
+    Spanning trees are only defined here for undirected graphs.
+
+    Raises:
+        ValueError: If graph is not undirected
+    """
+    if not is_undirected(graph):
+        raise ValueError("Minimum spanning trees require an undirected graph")
+
+
+def _vertices(graph: Any) -> List:
+    """
+    All vertices of a graph. Adjacency list graphs expose get_vertices(),
+    matrix graphs are indexed 0..num_vertices-1.
+    """
+    if hasattr(graph, 'get_vertices'):
+        return list(graph.get_vertices())
+
+    return list(range(graph.num_vertices))
+
+
+def _edge_arrays(graph: Any) -> Tuple[List, array, array, List]:
+    """
+    Intern the vertices to dense ids and list every edge once as parallel
+    (us, vs, ws) arrays. Self-loops (possible in matrix graphs) are dropped
+    since they never belong to a spanning tree.
+
+    Time Complexity: O(V + E), O(V²) for matrix graphs
+    """
+    _check_undirected(graph)
+    labels = _vertices(graph)
+    index = {vertex: i for i, vertex in enumerate(labels)}
+    us, vs, ws = array('q'), array('q'), []
+
+    for u, v, weight in graph.get_edges():
+        if u != v:
+            us.append(index[u])
+            vs.append(index[v])
+            ws.append(weight)
+
+    return labels, us, vs, ws
+
+
+def _forest(labels: List, us: array, vs: array, ws: List,
+            chosen: List[int]) -> SpanningForest:
+    """
+    Build the result from the indexes of the chosen edges.
+    """
+    edges = [(labels[us[i]], labels[vs[i]], ws[i]) for i in chosen]
+
+    return SpanningForest(edges, sum(ws[i] for i in chosen), len(labels))
+
+
+def kruskal(graph: Any) -> SpanningForest:
+    """
+    Kruskal's algorithm: scan the edges by increasing weight and keep each
+    one that joins two different trees, tracked with the project's
+    UnionFind. Stops once V - 1 edges have been kept.
+
+    Time Complexity: O(E log E)
+
+    Raises:
+        ValueError: If graph is not undirected
+    """
+    labels, us, vs, ws = _edge_arrays(graph)
+    trees = UnionFind(len(labels))
+    chosen: List[int] = []
+
+    for i in sorted(range(len(ws)), key=ws.__getitem__):
+        if trees.union(us[i], vs[i]):
+            chosen.append(i)
+
+            if len(chosen) == len(labels) - 1:
+                break
+
+    return _forest(labels, us, vs, ws, chosen)
+
+
+def prim_lazy(graph: Any) -> SpanningForest:
+    """
+    Lazy Prim's algorithm: grow each tree from an arbitrary root, keeping
+    every edge leaving the tree in a PriorityQueue and discarding edges
+    whose far end has been reached in the meantime when they are popped.
+
+    Time Complexity: O(E log E)
+
+    Raises:
+        ValueError: If graph is not undirected
+    """
+    _check_undirected(graph)
+    labels = _vertices(graph)
+    visited: Set = set()
+    edges: List[Tuple] = []
+    total = 0
+    queue: PriorityQueue[Tuple] = PriorityQueue()
+
+    def visit(u: Any) -> None:
+        visited.add(u)
+        for v, weight in graph.get_neighbors(u):
+            if v not in visited:
+                queue.push((u, v, weight), weight)
+
+    for root in labels:
+        if root in visited:
+            continue
+
+        visit(root)
+        while queue:
+            u, v, weight = queue.pop()
+
+            # Stale edge: both ends are already in the tree
+            if v in visited:
+                continue
+
+            edges.append((u, v, weight))
+            total += weight
+            visit(v)
+
+    return SpanningForest(edges, total, len(labels))
+
+
+def prim_eager(graph: Any) -> SpanningForest:
+    """
+    Eager Prim's algorithm: keep only the cheapest known edge into each
+    vertex outside the tree, lowering its priority with update_priority()
+    when a cheaper edge is found, so the queue holds at most V entries.
+
+    Time Complexity: O(E log V)
+
+    Raises:
+        ValueError: If graph is not undirected
+    """
+    _check_undirected(graph)
+    labels = _vertices(graph)
+    visited: Set = set()
+    # best[v] is the cheapest known (tree vertex, weight) edge into v
+    best: Dict[Any, Tuple[Any, Any]] = {}
+    edges: List[Tuple] = []
+    total = 0
+    queue: PriorityQueue[Any] = PriorityQueue()
+
+    def visit(u: Any) -> None:
+        visited.add(u)
+        for v, weight in graph.get_neighbors(u):
+            if v not in visited and (v not in best or weight < best[v][1]):
+                best[v] = (u, weight)
+                queue.update_priority(v, weight)
+
+    for root in labels:
+        if root in visited:
+            continue
+
+        visit(root)
+        while queue:
+            v = queue.pop()
+            u, weight = best.pop(v)
+            edges.append((u, v, weight))
+            total += weight
+            visit(v)
+
+    return SpanningForest(edges, total, len(labels))
+
+
+def _cheapest(us: array, vs: array, ws: List, trees: List[int],
+              lo: int, hi: int) -> Dict[int, int]:
+    """
+    For edges lo..hi-1, find the cheapest edge leaving each tree, where
+    trees[i] is the root of vertex i. Ties are broken by edge index so
+    every round agrees on a single cheapest edge and never closes a cycle.
+
+    Time Complexity: O(hi - lo)
+
+    Returns:
+        Dict mapping a tree root to the index of its cheapest outgoing edge
+    """
+    cheapest: Dict[int, int] = {}
+
+    for i in range(lo, hi):
+        a, b = trees[us[i]], trees[vs[i]]
+        if a == b:
+            continue
+
+        weight = ws[i]
+        for root in (a, b):
+            j = cheapest.get(root)
+            if j is None or weight < ws[j] or (weight == ws[j] and i < j):
+                cheapest[root] = i
+
+    return cheapest
+
+
+def _attach(us: array, vs: array, ws: List) -> None:
+    """
+    Worker initializer: keep one copy of the edge arrays per process, so
+    each round only ships the tree labels.
+    """
+    global _us, _vs, _ws
+    _us, _vs, _ws = us, vs, ws
+
+
+def _cheapest_chunk(lo: int, hi: int, trees: List[int]) -> Dict[int, int]:
+    """
+    Worker task: _cheapest() over the worker's copy of the edges.
+    """
+    return _cheapest(_us, _vs, _ws, trees, lo, hi)
+
+
+def boruvka(graph: Any, workers: int = 1) -> SpanningForest:
+    """
+    Borůvka's algorithm: in each round every tree picks its cheapest
+    outgoing edge and all of them are added at once, at least halving the
+    number of trees. Trees are tracked with the project's UnionFind.
+
+    Each round's scan is independent per edge, so with workers > 1 the
+    edges are split into chunks scanned by a process pool and the per-chunk
+    results are merged. This only pays off on graphs with millions of edges.
+
+    Time Complexity: O(E log V)
+
+    Raises:
+        ValueError: If graph is not undirected or workers < 1
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    labels, us, vs, ws = _edge_arrays(graph)
+    n, m = len(labels), len(ws)
+    trees = UnionFind(n)
+    chosen: List[int] = []
+    pool = None
+
+    if workers > 1 and m > 0:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                   initargs=(us, vs, ws))
+    bounds = [m * k // workers for k in range(workers + 1)]
+
+    try:
+        while trees.components > 1:
+            roots = [trees.find(i) for i in range(n)]
+
+            if pool is None:
+                cheapest = _cheapest(us, vs, ws, roots, 0, m)
+            else:
+                cheapest = {}
+                parts = pool.map(_cheapest_chunk, bounds[:-1], bounds[1:],
+                                 [roots] * workers)
+                for part in parts:
+                    for root, i in part.items():
+                        j = cheapest.get(root)
+                        if j is None or (ws[i], i) < (ws[j], j):
+                            cheapest[root] = i
+
+            # No edge leaves any tree: the remaining trees are components
+            if not cheapest:
+                break
+
+            for i in cheapest.values():
+                if trees.union(us[i], vs[i]):
+                    chosen.append(i)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return _forest(labels, us, vs, ws, chosen)
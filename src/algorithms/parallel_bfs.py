@@ -0,0 +1,209 @@
+from __future__ import annotations
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.algorithms.shortest_paths import ShortestPaths
+
+# Below this many edges the sequential BFS is faster than shipping
+# frontiers between processes
+PARALLEL_THRESHOLD = 2_000_000
+
+# Worker-side views of the shared CSR arrays, set by _attach()
+_offsets: Optional[memoryview] = None
+_targets: Optional[memoryview] = None
+_distances: Optional[memoryview] = None
+_segments: List[shared_memory.SharedMemory] = []
+
+
+def _to_csr(graph: Any) -> Tuple[List, array, array]:
+    """
+    Integer CSR view of a graph as (labels, offsets, targets). Snapshots are
+    used as-is, DirectedGraph is frozen, anything else with get_vertices()
+    and get_neighbors() is converted directly.
+
+    Time Complexity: O(V + E)
+    """
+    if hasattr(graph, 'offsets') and hasattr(graph, 'targets'):
+        return graph.vertices, graph.offsets, graph.targets
+
+    if hasattr(graph, 'freeze'):
+        return _to_csr(graph.freeze())
+
+    labels = list(graph.get_vertices())
+    index = {vertex: i for i, vertex in enumerate(labels)}
+    offsets = array('q', [0])
+    targets = array('q')
+
+    for vertex in labels:
+        targets.extend([index[neighbor]
+                       for neighbor, _ in graph.get_neighbors(vertex)])
+        offsets.append(len(targets))
+
+    return labels, offsets, targets
+
+
+def _sequential(offsets: array, targets: array, source: int) -> Tuple[array, array]:
+    """
+    Plain queue-based BFS over CSR arrays.
+
+    Time Complexity: O(V + E)
+    """
+    n = len(offsets) - 1
+    distances = array('q', [-1]) * n
+    parents = array('q', [-1]) * n
+    distances[source] = 0
+    queue = [source]
+
+    # The queue list is consumed by index instead of popping
+    head = 0
+    while head < len(queue):
+        u = queue[head]
+        head += 1
+        next_distance = distances[u] + 1
+
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if distances[v] == -1:
+                distances[v] = next_distance
+                parents[v] = u
+                queue.append(v)
+
+    return distances, parents
+
+
+def _share(values: array) -> shared_memory.SharedMemory:
+    """
+    Copy an int64 array into a new shared memory segment.
+    """
+    segment = shared_memory.SharedMemory(
+        create=True, size=max(values.itemsize * len(values), values.itemsize))
+    segment.buf[:values.itemsize * len(values)] = values.tobytes()
+
+    return segment
+
+
+def _attach(offsets_name: str, targets_name: str, distances_name: str,
+            n: int, m: int) -> None:
+    """
+    Worker initializer: map the shared segments created by the parent.
+    """
+    global _offsets, _targets, _distances
+
+    views = []
+    for name, length in ((offsets_name, n + 1), (targets_name, m),
+                         (distances_name, n)):
+        # Workers share the parent's resource tracker, which unlinks the
+        # segment once when the parent does
+        segment = shared_memory.SharedMemory(name=name)
+        _segments.append(segment)
+        views.append(segment.buf.cast('q')[:length])
+
+    _offsets, _targets, _distances = views
+
+
+def _expand(frontier: List[int]) -> List[Tuple[int, int]]:
+    """
+    Worker task: (vertex, parent) pairs for the unvisited neighbors of a
+    slice of the frontier, deduplicated within the slice.
+    """
+    offsets, targets, distances = _offsets, _targets, _distances
+    found: Dict[int, int] = {}
+
+    for u in frontier:
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            if distances[v] == -1 and v not in found:
+                found[v] = u
+
+    return list(found.items())
+
+
+def _parallel(offsets: array, targets: array, source: int,
+              workers: int) -> Tuple[array, array]:
+    """
+    Level-synchronous BFS: each frontier is split across worker processes
+    that read the CSR arrays and the distance array from shared memory.
+    Only the parent writes distances, between levels.
+
+    Time Complexity: O(V + E) work, O(diameter) synchronisation rounds
+    """
+    n = len(offsets) - 1
+    parents = array('q', [-1]) * n
+    initial = array('q', [-1]) * n
+    initial[source] = 0
+
+    segments = [_share(offsets), _share(targets), _share(initial)]
+    shared = segments[2].buf.cast('q')
+    distances = shared[:n]
+    try:
+        with ProcessPoolExecutor(
+                max_workers=workers, initializer=_attach,
+                initargs=(segments[0].name, segments[1].name,
+                          segments[2].name, n, len(targets))) as pool:
+            frontier = [source]
+            level = 0
+
+            while frontier:
+                level += 1
+                # A few chunks per worker keeps the pool balanced
+                size = max(1, -(-len(frontier) // (workers * 4)))
+                chunks = [frontier[i:i + size]
+                          for i in range(0, len(frontier), size)]
+                frontier = []
+
+                for found in pool.map(_expand, chunks):
+                    for v, u in found:
+                        if distances[v] == -1:
+                            distances[v] = level
+                            parents[v] = u
+                            frontier.append(v)
+
+        result = array('q', distances)
+    finally:
+        distances.release()
+        shared.release()
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+    return result, parents
+
+
+def parallel_bfs(graph: Any, source: Any, workers: Optional[int] = None,
+                 threshold: int = PARALLEL_THRESHOLD) -> ShortestPaths:
+    """
+    Breadth-first search returning hop distances and BFS-tree parents for
+    every vertex reachable from source.
+
+    Graphs with at least threshold edges are searched level by level with
+    the frontier sharded across a ProcessPoolExecutor over a shared-memory
+    integer adjacency; smaller graphs (or workers=1) use a sequential BFS.
+
+    Time Complexity: O(V + E)
+
+    Raises:
+        ValueError: If source not in graph
+    """
+    labels, offsets, targets = _to_csr(graph)
+    index = {vertex: i for i, vertex in enumerate(labels)}
+
+    if source not in index:
+        raise ValueError(f"Vertex {source} not in graph")
+
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(targets) < threshold:
+        distances, parents = _sequential(offsets, targets, index[source])
+    else:
+        distances, parents = _parallel(offsets, targets, index[source], workers)
+
+    hop_counts: Dict[Any, int] = {}
+    tree: Dict[Any, Optional[Any]] = {}
+    for i, distance in enumerate(distances):
+        if distance != -1:
+            hop_counts[labels[i]] = distance
+            tree[labels[i]] = labels[parents[i]] if parents[i] != -1 else None
+
+    return ShortestPaths(source, hop_counts, tree)
@@ -0,0 +1,297 @@
+from __future__ import annotations
+import math
+from typing import (
+    Any, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Set,
+    Tuple, TypeVar
+)
+
+from src.algorithms.graph_utils import is_undirected
+from src.data_structures.priority_queue.priority_queue import PriorityQueue
+
+V = TypeVar('V', bound=Hashable)
+
+INF = math.inf
+
+
+def _vertices(graph: Any) -> Iterable:
+    """
+    All vertices of a graph. Adjacency list graphs expose get_vertices(),
+    matrix graphs are indexed 0..num_vertices-1.
+    """
+    if hasattr(graph, 'get_vertices'):
+        return graph.get_vertices()
+
+    return range(graph.num_vertices)
+
+
+def _reverse_neighbors(graph: Any) -> Callable[[Any], List[Tuple[Any, Any]]]:
+    """
+    Return a function mapping a vertex to its (predecessor, weight) pairs.
+
+    Undirected graphs are their own reverse. Indexed directed graphs and
+    matrix graphs answer from their own storage; any other graph gets a
+    reversed adjacency built once from get_edges() in O(V + E).
+    """
+    if is_undirected(graph):
+        return graph.get_neighbors
+
+    if hasattr(graph, 'predecessors') and hasattr(graph, 'edge_index'):
+        return lambda v: [(u, graph.get_edge_weight(u, v))
+                          for u in graph.predecessors[v]]
+
+    if hasattr(graph, 'matrix'):
+        matrix = graph.matrix
+        return lambda v: [(u, row[v]) for u, row in enumerate(matrix)
+                          if row[v] is not None]
+
+    reverse: Dict[Any, List[Tuple[Any, Any]]] = {}
+    for from_vertex, to_vertex, weight in graph.get_edges():
+        reverse.setdefault(to_vertex, []).append((from_vertex, weight))
+
+    return lambda v: reverse.get(v, [])
+
+
+class ShortestPaths(Generic[V]):
+    """
+    Single-source shortest path results: distances plus a parent tree.
+    Paths are only reconstructed when asked for.
+    """
+
+    def __init__(self, source: V, distances: Dict[V, float],
+                 parents: Dict[V, Optional[V]]) -> None:
+        """
+        Wrap distance and parent maps produced by a search from source.
+
+        Time Complexity: O(1)
+        """
+        self.source = source
+        self.distances = distances
+        self.parents = parents
+
+    def distance(self, vertex: V) -> float:
+        """
+        Get the shortest distance to vertex, or infinity if unreachable.
+
+        Time Complexity: O(1)
+        """
+        return self.distances.get(vertex, INF)
+
+    def has_path_to(self, vertex: V) -> bool:
+        """
+        Check if vertex was reached from the source.
+
+        Time Complexity: O(1)
+        """
+        return vertex in self.distances
+
+    def path_to(self, vertex: V) -> List[V] | None:
+        """
+        Reconstruct the shortest path from the source to vertex by walking
+        the parent tree.
+
+        Time Complexity: O(L) where L is the number of vertices on the path
+
+        Returns:
+            List of vertices from source to vertex, or None if unreachable
+        """
+        if vertex not in self.distances:
+            return None
+
+        path = [vertex]
+        while path[-1] != self.source:
+            path.append(self.parents[path[-1]])
+
+        path.reverse()
+        return path
+
+    def __repr__(self) -> str:
+        return f"ShortestPaths(source={self.source!r}, reached={len(self.distances)})"
+
+
+def dijkstra(graph: Any, source: V,
+             targets: Optional[Iterable[V]] = None) -> ShortestPaths[V]:
+    """
+    Dijkstra's algorithm from source using the project's PriorityQueue and
+    its update_priority() for decrease-key.
+
+    If targets is given, the search stops as soon as every target has been
+    settled, so distances are final only for settled vertices.
+
+    Time Complexity: O((V + E) log V)
+
+    Raises:
+        ValueError: If a negative edge weight is encountered
+    """
+    distances: Dict[V, float] = {source: 0}
+    parents: Dict[V, Optional[V]] = {source: None}
+    settled: Set[V] = set()
+    remaining = set(targets) if targets is not None else None
+
+    queue: PriorityQueue[V] = PriorityQueue()
+    queue.push(source, 0)
+
+    while not queue.is_empty():
+        u = queue.pop()
+        settled.add(u)
+
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
+
+        dist_u = distances[u]
+        for v, weight in graph.get_neighbors(u):
+            if weight < 0:
+                raise ValueError(
+                    "Dijkstra's algorithm requires non-negative edge weights")
+
+            candidate = dist_u + weight
+            if v not in settled and candidate < distances.get(v, INF):
+                distances[v] = candidate
+                parents[v] = u
+                queue.update_priority(v, candidate)
+
+    return ShortestPaths(source, distances, parents)
+
+
+def dijkstra_path(graph: Any, source: V, target: V) -> Tuple[float, List[V] | None]:
+    """
+    Shortest path between two vertices, stopping once target is settled.
+
+    Time Complexity: O((V + E) log V) worst case
+
+    Returns:
+        (distance, path) or (inf, None) if target is unreachable
+    """
+    result = dijkstra(graph, source, targets=[target])
+
+    return result.distance(target), result.path_to(target)
+
+
+def bidirectional_dijkstra(graph: Any, source: V, target: V) -> Tuple[float, List[V] | None]:
+    """
+    Bidirectional Dijkstra: searches forward from source and backward from
+    target, expanding the side with the smaller frontier distance, and stops
+    once the two frontiers cannot improve the best meeting point.
+
+    Directed graphs need predecessor lookups; see _reverse_neighbors().
+
+    Time Complexity: O((V + E) log V) worst case, usually far less
+
+    Returns:
+        (distance, path) or (inf, None) if target is unreachable
+
+    Raises:
+        ValueError: If a negative edge weight is encountered
+    """
+    if source == target:
+        return 0, [source]
+
+    distances = ({source: 0}, {target: 0})
+    parents: Tuple[Dict[V, Optional[V]], Dict[V, Optional[V]]] = (
+        {source: None}, {target: None})
+    settled: Tuple[Set[V], Set[V]] = (set(), set())
+    neighbors = (graph.get_neighbors, _reverse_neighbors(graph))
+    queues: Tuple[PriorityQueue[V], PriorityQueue[V]] = (
+        PriorityQueue(), PriorityQueue())
+    queues[0].push(source, 0)
+    queues[1].push(target, 0)
+
+    best = INF
+    # Best meeting edge (a, b): source ~> a forward, a -> b, b ~> target
+    meeting: Optional[Tuple[V, V]] = None
+
+    while queues[0] and queues[1]:
+        top_forward = distances[0][queues[0].peek()]
+        top_backward = distances[1][queues[1].peek()]
+
+        # No remaining pair of frontier vertices can beat the best path
+        if top_forward + top_backward >= best:
+            break
+
+        side = 0 if top_forward <= top_backward else 1
+        dist, other_dist = distances[side], distances[1 - side]
+
+        u = queues[side].pop()
+        settled[side].add(u)
+
+        for v, weight in neighbors[side](u):
+            if weight < 0:
+                raise ValueError(
+                    "Dijkstra's algorithm requires non-negative edge weights")
+
+            candidate = dist[u] + weight
+            if v not in settled[side] and candidate < dist.get(v, INF):
+                dist[v] = candidate
+                parents[side][v] = u
+                queues[side].update_priority(v, candidate)
+
+            if v in other_dist and candidate + other_dist[v] < best:
+                best = candidate + other_dist[v]
+                meeting = (u, v) if side == 0 else (v, u)
+
+    if meeting is None:
+        return INF, None
+
+    return best, _join_paths(parents, meeting)
+
+
+def _join_paths(parents: Tuple[Dict, Dict], meeting: Tuple[Any, Any]) -> List:
+    """
+    Join the forward parent chain ending at meeting[0] with the backward
+    parent chain starting at meeting[1].
+    """
+    path = []
+    current = meeting[0]
+    while current is not None:
+        path.append(current)
+        current = parents[0][current]
+    path.reverse()
+
+    current = meeting[1]
+    while current is not None:
+        path.append(current)
+        current = parents[1][current]
+
+    return path
+
+
+def bellman_ford(graph: Any, source: V) -> ShortestPaths[V]:
+    """
+    Bellman-Ford single-source shortest paths, supporting negative edge
+    weights. Stops early once a full pass makes no improvement.
+
+    Time Complexity: O(V * E)
+
+    Raises:
+        ValueError: If a negative-weight cycle is reachable from source
+        ValueError: If source not in graph
+    """
+    vertices = list(_vertices(graph))
+    if source not in set(vertices):
+        raise ValueError(f"Vertex {source} not in graph")
+
+    edges = [(u, v, weight) for u in vertices
+             for v, weight in graph.get_neighbors(u)]
+    distances: Dict[V, float] = {source: 0}
+    parents: Dict[V, Optional[V]] = {source: None}
+
+    for _ in range(len(vertices) - 1):
+        updated = False
+
+        for u, v, weight in edges:
+            if u in distances and distances[u] + weight < distances.get(v, INF):
+                distances[v] = distances[u] + weight
+                parents[v] = u
+                updated = True
+
+        if not updated:
+            break
+    else:
+        # Any further improvement means a negative cycle
+        for u, v, weight in edges:
+            if u in distances and distances[u] + weight < distances.get(v, INF):
+                raise ValueError(
+                    "Graph contains a negative-weight cycle reachable from source")
+
+    return ShortestPaths(source, distances, parents)
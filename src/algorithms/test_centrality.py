@@ -0,0 +1,166 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.algorithms.centrality import (  # noqa: E402
+    CentralityResult, degree_centrality, eigenvector_centrality, pagerank
+)
+from src.data_structures.graphs.directed.directed_graph import DirectedGraph  # noqa: E402
+from src.data_structures.graphs.directed.directed_matrix_graph import DirectedMatrixGraph  # noqa: E402
+
+
+def reference_pagerank(graph, damping=0.85, iterations=200):
+    """Dense, loop-based PageRank used as an oracle."""
+    vertices = graph.get_vertices()
+    n = len(vertices)
+    rank = {v: 1.0 / n for v in vertices}
+    for _ in range(iterations):
+        dangling = sum(rank[v] for v in vertices if graph.out_degree(v) == 0)
+        new_rank = {v: (1 - damping) / n + damping * dangling / n for v in vertices}
+        for u in vertices:
+            for v, _ in graph.get_neighbors(u):
+                new_rank[v] += damping * rank[u] / graph.out_degree(u)
+        rank = new_rank
+    return rank
+
+
+def sample_graph():
+    g = DirectedGraph()
+    for u, v in [('A', 'B'), ('B', 'C'), ('C', 'A'), ('A', 'C'), ('D', 'C'),
+                 ('C', 'E')]:
+        g.add_edge(u, v)
+    return g
+
+
+class TestPageRank:
+    """Tests for vectorized PageRank."""
+
+    def test_matches_reference(self):
+        """Test against a loop-based implementation, including a dangling vertex."""
+        g = sample_graph()
+
+        result = pagerank(g, tol=1e-12, max_iter=500)
+        expected = reference_pagerank(g)
+
+        assert isinstance(result, CentralityResult)
+        assert result.converged
+        assert result.iterations > 1
+        assert result.error < 1e-12
+        for vertex, score in result.scores.items():
+            assert score == pytest.approx(expected[vertex], abs=1e-9)
+        assert sum(result.scores.values()) == pytest.approx(1.0)
+
+    def test_iteration_limit(self):
+        """Test that hitting max_iter is reported, not raised."""
+        result = pagerank(sample_graph(), tol=1e-15, max_iter=2)
+
+        assert not result.converged
+        assert result.iterations == 2
+
+    def test_personalization(self):
+        """Test that personalization biases rank toward chosen vertices."""
+        g = sample_graph()
+
+        plain = pagerank(g).scores
+        biased = pagerank(g, personalization={'D': 1.0}).scores
+
+        assert biased['D'] > plain['D']
+
+        with pytest.raises(ValueError):
+            pagerank(g, personalization={'D': 0.0})
+
+    def test_weighted(self):
+        """Test that edge weights split rank proportionally."""
+        g = DirectedGraph()
+        g.add_edge('S', 'A', 1)
+        g.add_edge('S', 'B', 9)
+
+        scores = pagerank(g, weighted=True).scores
+
+        assert scores['B'] > scores['A']
+
+    def test_matrix_graph_matches_list_graph(self):
+        """Test that matrix graphs and adjacency lists give the same ranks."""
+        matrix = DirectedMatrixGraph(4)
+        g = DirectedGraph()
+        for v in range(4):
+            g.add_vertex(v)
+        for u, v in [(0, 1), (1, 2), (2, 0), (3, 2)]:
+            matrix.add_edge(u, v)
+            g.add_edge(u, v)
+
+        assert pagerank(matrix).values == pytest.approx(pagerank(g).values)
+
+    def test_matrix_graph_skips_removed_vertices(self):
+        """Test that removed matrix ids get no score or teleport mass."""
+        matrix = DirectedMatrixGraph(5)
+        g = DirectedGraph()
+        for v in (0, 2, 3, 4):
+            g.add_vertex(v)
+        for u, v in [(0, 1), (1, 2), (0, 2), (2, 0), (3, 2), (4, 3)]:
+            matrix.add_edge(u, v)
+            if 1 not in (u, v):
+                g.add_edge(u, v)
+        matrix.remove_vertex(1)
+
+        result = pagerank(matrix)
+
+        assert result.labels == [0, 2, 3, 4]
+        assert result.values == pytest.approx(pagerank(g).values)
+        assert sum(result.values) == pytest.approx(1.0)
+        assert 1 not in degree_centrality(matrix)
+
+    def test_empty_graph(self):
+        """Test that an empty graph has no scores."""
+        assert pagerank(DirectedGraph()).scores == {}
+
+    def test_top(self):
+        """Test the top-k helper."""
+        result = pagerank(sample_graph())
+
+        top = result.top(2)
+
+        assert top[0][0] == 'C'
+        assert top[0][1] >= top[1][1]
+        assert result.top(0) == []
+
+
+class TestEigenvectorAndDegreeCentrality:
+    """Tests for eigenvector and degree centrality."""
+
+    def test_eigenvector_star(self):
+        """Test that the hub of an in-star is most central."""
+        g = DirectedGraph()
+        for leaf in 'ABCD':
+            g.add_edge(leaf, 'H')
+        g.add_edge('H', 'A')
+
+        result = eigenvector_centrality(g, tol=1e-10, max_iter=1000)
+
+        assert result.converged
+        assert result.top(1)[0][0] == 'H'
+        assert np.linalg.norm(result.values) == pytest.approx(1.0)
+
+    def test_eigenvector_tolerance_not_scaled(self):
+        """Test that a large graph stops at the requested tolerance."""
+        g = DirectedGraph()
+        n = 2000
+        for i in range(n):
+            g.add_edge(i, (i + 1) % n)
+            g.add_edge(i, (i * 7 + 3) % n)
+
+        result = eigenvector_centrality(g, tol=1e-6, max_iter=1000)
+
+        assert result.converged
+        assert result.error < 1e-6
+
+    def test_degree_centrality(self):
+        """Test in, out and total degree centrality."""
+        g = sample_graph()
+
+        assert degree_centrality(g, 'in')['C'] == pytest.approx(3 / 4)
+        assert degree_centrality(g, 'out')['A'] == pytest.approx(2 / 4)
+        assert degree_centrality(g)['C'] == pytest.approx(5 / 4)
+
+        with pytest.raises(ValueError):
+            degree_centrality(g, 'sideways')
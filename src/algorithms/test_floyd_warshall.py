@@ -0,0 +1,158 @@
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.algorithms.floyd_warshall import (  # noqa: E402
+    AllPairsShortestPaths, blocked_floyd_warshall, floyd_warshall
+)
+from src.algorithms.shortest_paths import bellman_ford, dijkstra  # noqa: E402
+from src.data_structures.graphs.directed.directed_matrix_graph import DirectedMatrixGraph  # noqa: E402
+from src.data_structures.graphs.directed.directed_numpy_graph import DirectedNumpyGraph  # noqa: E402
+from src.data_structures.graphs.undirected.undirected_matrix_graph import UndirectedMatrixGraph  # noqa: E402
+
+
+def blocked_small(graph):
+    return blocked_floyd_warshall(graph, block_size=3)
+
+
+def blocked_parallel(graph):
+    return blocked_floyd_warshall(graph, block_size=4, workers=2)
+
+
+ALL_PAIRS = [floyd_warshall, blocked_small, blocked_parallel]
+
+
+def random_graph(cls, n, density, seed, low=1, high=20):
+    rng = random.Random(seed)
+    graph = cls(n)
+    for u in range(n):
+        for v in range(n):
+            if u != v and rng.random() < density:
+                graph.add_edge(u, v, rng.randint(low, high))
+    return graph
+
+
+def path_weight(graph, path):
+    return sum(graph.get_weight(u, v) for u, v in zip(path, path[1:]))
+
+
+def check_against(graph, result, single_source):
+    for u in range(graph.num_vertices):
+        expected = single_source(graph, u)
+        for v in range(graph.num_vertices):
+            assert result.distance(u, v) == pytest.approx(expected.distance(v))
+            path = result.path(u, v)
+            if math.isinf(expected.distance(v)):
+                assert path is None
+            else:
+                assert path[0] == u and path[-1] == v
+                assert path_weight(graph, path) == pytest.approx(result.distance(u, v))
+
+
+@pytest.mark.parametrize("all_pairs", ALL_PAIRS)
+class TestFloydWarshall:
+    def test_matches_dijkstra_directed(self, all_pairs):
+        graph = random_graph(DirectedMatrixGraph, 13, 0.25, seed=1)
+        check_against(graph, all_pairs(graph), dijkstra)
+
+    def test_matches_dijkstra_undirected(self, all_pairs):
+        graph = random_graph(UndirectedMatrixGraph, 11, 0.2, seed=2)
+        check_against(graph, all_pairs(graph), dijkstra)
+
+    def test_negative_weights_match_bellman_ford(self, all_pairs):
+        # Forward edges only, so negative weights cannot form a cycle
+        rng = random.Random(3)
+        graph = DirectedMatrixGraph(10)
+        for u in range(10):
+            for v in range(u + 1, 10):
+                if rng.random() < 0.4:
+                    graph.add_edge(u, v, rng.randint(-5, 10))
+        check_against(graph, all_pairs(graph), bellman_ford)
+
+    def test_numpy_graph(self, all_pairs):
+        matrix = random_graph(DirectedMatrixGraph, 9, 0.3, seed=4)
+        graph = DirectedNumpyGraph(9)
+        for u in range(9):
+            for v, w in matrix.get_neighbors(u):
+                graph.add_edge(u, v, w)
+        assert np.array_equal(all_pairs(graph).distances,
+                              all_pairs(matrix).distances)
+
+    def test_path_reconstruction(self, all_pairs):
+        graph = DirectedMatrixGraph(4)
+        graph.add_edge(0, 1, 1)
+        graph.add_edge(1, 2, 1)
+        graph.add_edge(2, 3, 1)
+        graph.add_edge(0, 3, 10)
+        result = all_pairs(graph)
+        assert result.distance(0, 3) == 3
+        assert result.path(0, 3) == [0, 1, 2, 3]
+        assert result.path(2, 2) == [2]
+
+    def test_unreachable(self, all_pairs):
+        graph = DirectedMatrixGraph(3)
+        graph.add_edge(0, 1, 2)
+        result = all_pairs(graph)
+        assert result.distance(1, 0) == math.inf
+        assert result.path(1, 0) is None
+        assert result.path(0, 2) is None
+
+    def test_removed_vertex(self, all_pairs):
+        graph = DirectedMatrixGraph(4)
+        graph.add_edge(0, 1, 1)
+        graph.add_edge(1, 2, 1)
+        graph.add_edge(0, 2, 5)
+        graph.add_edge(2, 3, 1)
+        graph.remove_vertex(1)
+        result = all_pairs(graph)
+        assert result.distance(0, 3) == 6
+        assert result.path(0, 3) == [0, 2, 3]
+        assert result.distance(1, 1) == math.inf
+        assert result.path(1, 1) is None
+        assert result.path(0, 1) is None
+
+    def test_negative_cycle(self, all_pairs):
+        graph = DirectedMatrixGraph(6)
+        graph.add_edge(0, 1, 1)
+        graph.add_edge(1, 2, -3)
+        graph.add_edge(2, 1, 1)
+        with pytest.raises(ValueError, match="negative-weight cycle"):
+            all_pairs(graph)
+
+    def test_single_vertex(self, all_pairs):
+        result = all_pairs(DirectedMatrixGraph(1))
+        assert result.distance(0, 0) == 0
+        assert result.path(0, 0) == [0]
+
+
+class TestBlocked:
+    def test_block_sizes_agree(self):
+        graph = random_graph(DirectedMatrixGraph, 20, 0.15, seed=5)
+        expected = floyd_warshall(graph)
+        for block_size in (1, 6, 7, 20, 64):
+            result = blocked_floyd_warshall(graph, block_size=block_size)
+            assert np.array_equal(result.distances, expected.distances)
+
+    def test_parallel_matches_sequential(self):
+        graph = random_graph(DirectedMatrixGraph, 30, 0.1, seed=6)
+        sequential = blocked_floyd_warshall(graph, block_size=8)
+        parallel = blocked_floyd_warshall(graph, block_size=8, workers=3)
+        assert np.array_equal(parallel.distances, sequential.distances)
+        for u in range(30):
+            for v in range(30):
+                assert parallel.path(u, v) == sequential.path(u, v)
+
+    def test_invalid_arguments(self):
+        graph = DirectedMatrixGraph(3)
+        with pytest.raises(ValueError):
+            blocked_floyd_warshall(graph, block_size=0)
+        with pytest.raises(ValueError):
+            blocked_floyd_warshall(graph, workers=0)
+
+    def test_repr(self):
+        result = floyd_warshall(DirectedMatrixGraph(3))
+        assert isinstance(result, AllPairsShortestPaths)
+        assert repr(result) == "AllPairsShortestPaths(num_vertices=3)"
@@ -0,0 +1,53 @@
+import pytest
+
+from src.algorithms.graph_utils import is_undirected
+from src.algorithms.k_core import core_decomposition
+from src.algorithms.minimum_spanning_tree import kruskal
+from src.data_structures.graphs.directed.adaptive_directed_graph import AdaptiveDirectedGraph
+from src.data_structures.graphs.directed.directed_bit_graph import DirectedBitGraph
+from src.data_structures.graphs.directed.directed_graph import (
+    DirectedGraph, DynamicTopologicalGraph, IndexedDirectedGraph
+)
+from src.data_structures.graphs.directed.directed_matrix_graph import DirectedMatrixGraph
+from src.data_structures.graphs.undirected.compact_undirected_graph import CompactUndirectedGraph
+from src.data_structures.graphs.undirected.connected_undirected_graph import ConnectedUndirectedGraph
+from src.data_structures.graphs.undirected.undirected_bit_graph import UndirectedBitGraph
+from src.data_structures.graphs.undirected.undirected_graph import UndirectedGraph
+from src.data_structures.graphs.undirected.undirected_matrix_graph import UndirectedMatrixGraph
+
+
+class DirectedGraphWithDegree(DirectedGraph):
+    """A directed graph that happens to have an undirected-style degree()."""
+
+    def degree(self, vertex):
+        return self.in_degree(vertex) + self.out_degree(vertex)
+
+
+class TestIsUndirected:
+    """Tests for the shared undirected-graph check."""
+
+    @pytest.mark.parametrize("graph", [
+        UndirectedGraph(), ConnectedUndirectedGraph(), CompactUndirectedGraph(),
+        UndirectedMatrixGraph(2), UndirectedBitGraph(2), UndirectedGraph().freeze(),
+    ])
+    def test_undirected_graphs(self, graph):
+        assert is_undirected(graph)
+
+    @pytest.mark.parametrize("graph", [
+        DirectedGraph(), IndexedDirectedGraph(), DynamicTopologicalGraph(),
+        DirectedMatrixGraph(2), DirectedBitGraph(2), AdaptiveDirectedGraph(2),
+        DirectedGraph().freeze(), object(),
+    ])
+    def test_directed_and_unknown_graphs(self, graph):
+        assert not is_undirected(graph)
+
+    def test_degree_method_is_not_enough(self):
+        """Test that a directed class with degree() is still rejected."""
+        g = DirectedGraphWithDegree()
+        g.add_edge('A', 'B')
+
+        assert not is_undirected(g)
+        with pytest.raises(ValueError, match="undirected"):
+            kruskal(g)
+        with pytest.raises(ValueError, match="undirected"):
+            core_decomposition(g)
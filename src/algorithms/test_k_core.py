@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+from src.algorithms.k_core import CoreDecomposition, core_decomposition, degeneracy_ordering
+from src.data_structures.graphs.directed.directed_graph import DirectedGraph
+from src.data_structures.graphs.undirected.compact_undirected_graph import CompactUndirectedGraph
+from src.data_structures.graphs.undirected.undirected_graph import UndirectedGraph
+from src.data_structures.graphs.undirected.undirected_matrix_graph import UndirectedMatrixGraph
+
+# A 4-clique (3-core) with a triangle hanging off it (2-core) and a tail
+SAMPLE_EDGES = [
+    ('A', 'B'), ('A', 'C'), ('A', 'D'), ('B', 'C'), ('B', 'D'), ('C', 'D'),
+    ('D', 'E'), ('E', 'F'), ('F', 'D'), ('F', 'G'), ('G', 'H'),
+]
+
+EXPECTED_CORES = {'A': 3, 'B': 3, 'C': 3, 'D': 3, 'E': 2, 'F': 2, 'G': 1, 'H': 1}
+
+
+def naive_cores(graph):
+    """Peel vertices of degree < k for increasing k."""
+    adjacency = {v: {n for n, _ in graph.get_neighbors(v)} for v in graph.get_vertices()}
+    cores = {}
+    k = 0
+    while adjacency:
+        low = [v for v, ns in adjacency.items() if len(ns) <= k]
+        if not low:
+            k += 1
+            continue
+        for v in low:
+            cores[v] = k
+            for n in adjacency.pop(v):
+                if n in adjacency:
+                    adjacency[n].discard(v)
+    return cores
+
+
+class TestCoreDecomposition:
+    """Test core numbers and degeneracy ordering."""
+
+    def test_sample_graph(self):
+        """Test a clique with attached triangle and tail."""
+        graph = UndirectedGraph.from_edge_list(SAMPLE_EDGES)
+
+        result = core_decomposition(graph)
+
+        assert isinstance(result, CoreDecomposition)
+        assert result.core_numbers == EXPECTED_CORES
+        assert result.degeneracy == 3
+        assert sorted(result.k_core(3)) == ['A', 'B', 'C', 'D']
+        assert sorted(result.k_core(2)) == ['A', 'B', 'C', 'D', 'E', 'F']
+        assert len(result.k_core(0)) == 8
+        assert result.k_core(4) == []
+        assert repr(result) == "CoreDecomposition(vertices=8, degeneracy=3)"
+
+    def test_degeneracy_ordering_property(self):
+        """Test that each vertex has at most degeneracy later neighbors."""
+        graph = UndirectedGraph.from_edge_list(SAMPLE_EDGES)
+
+        order = degeneracy_ordering(graph)
+        position = {v: i for i, v in enumerate(order)}
+
+        assert sorted(order) == sorted(graph.get_vertices())
+        for v in order:
+            later = sum(1 for n, _ in graph.get_neighbors(v) if position[n] > position[v])
+            assert later <= 3
+
+    def test_isolated_and_empty(self):
+        """Test isolated vertices and the empty graph."""
+        graph = UndirectedGraph()
+        assert core_decomposition(graph).degeneracy == 0
+        assert degeneracy_ordering(graph) == []
+
+        graph.add_vertex('X')
+        graph.add_edge('Y', 'Z')
+        result = core_decomposition(graph)
+
+        assert result.core_number('X') == 0
+        assert result.core_number('Y') == 1
+
+        with pytest.raises(ValueError, match="not in graph"):
+            result.core_number('missing')
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_matches_naive_peeling(self, seed):
+        """Test against repeated peeling on random graphs."""
+        rng = random.Random(seed)
+        graph = UndirectedGraph.from_edge_list(
+            (rng.randrange(80), rng.randrange(80)) for _ in range(300))
+
+        assert core_decomposition(graph).core_numbers == naive_cores(graph)
+
+    def test_frozen_snapshot(self):
+        """Test that the CSR snapshot is used directly."""
+        graph = UndirectedGraph.from_edge_list(SAMPLE_EDGES)
+
+        assert core_decomposition(graph.freeze()).core_numbers == EXPECTED_CORES
+
+    def test_compact_and_matrix_graphs(self):
+        """Test the other undirected representations."""
+        compact = CompactUndirectedGraph.from_edge_list(SAMPLE_EDGES)
+        assert core_decomposition(compact).core_numbers == EXPECTED_CORES
+
+        matrix = UndirectedMatrixGraph(4)
+        for u, v in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 3)]:
+            matrix.add_edge(u, v)
+        assert core_decomposition(matrix).core_numbers == {0: 2, 1: 2, 2: 2, 3: 1}
+
+    def test_directed_graph_rejected(self):
+        """Test that directed graphs raise ValueError."""
+        graph = DirectedGraph()
+        graph.add_edge('A', 'B')
+
+        with pytest.raises(ValueError, match="undirected"):
+            core_decomposition(graph)
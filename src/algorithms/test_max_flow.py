@@ -0,0 +1,182 @@
+import random
+
+import pytest
+
+from src.algorithms.max_flow import MaxFlow, dinic, hopcroft_karp, push_relabel
+from src.data_structures.graphs.directed.directed_graph import DirectedGraph
+from src.data_structures.graphs.directed.directed_matrix_graph import DirectedMatrixGraph
+from src.data_structures.graphs.undirected.undirected_graph import UndirectedGraph
+
+MAX_FLOW = [dinic, push_relabel]
+
+# CLRS figure 26.1: maximum flow 23
+CLRS_EDGES = [
+    ('s', 'v1', 16), ('s', 'v2', 13), ('v1', 'v3', 12), ('v2', 'v1', 4),
+    ('v2', 'v4', 14), ('v3', 'v2', 9), ('v3', 't', 20), ('v4', 'v3', 7),
+    ('v4', 't', 4),
+]
+
+
+def build(edges):
+    graph = DirectedGraph()
+    for u, v, w in edges:
+        graph.add_edge(u, v, w)
+    return graph
+
+
+def check_flow(graph, result, source, sink):
+    """Check capacity limits, conservation and the max-flow/min-cut equality."""
+    balance = {v: 0 for v in graph.get_vertices()}
+    for (u, v), flow in result.flows.items():
+        assert 0 < flow <= graph.get_edge_weight(u, v)
+        balance[u] -= flow
+        balance[v] += flow
+
+    for vertex, net in balance.items():
+        if vertex not in (source, sink):
+            assert net == 0
+    assert balance[sink] == result.value
+    assert sum(c for _, _, c in result.min_cut()) == result.value
+    assert source in result.source_side and sink not in result.source_side
+
+
+@pytest.mark.parametrize("max_flow", MAX_FLOW)
+class TestMaxFlow:
+    """Test both max-flow algorithms on the same networks."""
+
+    def test_clrs_network(self, max_flow):
+        """Test the textbook network."""
+        graph = build(CLRS_EDGES)
+
+        result = max_flow(graph, 's', 't')
+
+        assert isinstance(result, MaxFlow)
+        assert result.value == 23
+        check_flow(graph, result, 's', 't')
+        assert result.flow('v4', 't') == 4
+        assert result.flow('t', 's') == 0
+
+    def test_disconnected_sink(self, max_flow):
+        """Test that an unreachable sink gives zero flow and an empty cut."""
+        graph = build([('s', 'a', 5), ('t', 'b', 1)])
+
+        result = max_flow(graph, 's', 't')
+
+        assert result.value == 0
+        assert result.flows == {}
+        assert result.min_cut() == []
+        assert result.source_side == {'s', 'a'}
+
+    def test_float_capacities(self, max_flow):
+        """Test fractional capacities."""
+        graph = build([('s', 'a', 1.5), ('a', 't', 2.5), ('s', 't', 0.25)])
+
+        assert max_flow(graph, 's', 't').value == pytest.approx(1.75)
+
+    def test_matrix_graph(self, max_flow):
+        """Test DirectedMatrixGraph input."""
+        graph = DirectedMatrixGraph(4)
+        graph.add_edge(0, 1, 3)
+        graph.add_edge(0, 2, 2)
+        graph.add_edge(1, 2, 5)
+        graph.add_edge(1, 3, 2)
+        graph.add_edge(2, 3, 3)
+
+        assert max_flow(graph, 0, 3).value == 5
+
+    def test_undirected_graph(self, max_flow):
+        """Test that undirected edges carry flow either way."""
+        graph = UndirectedGraph.from_edge_list(
+            [('s', 'a', 3), ('a', 'b', 2), ('b', 't', 4), ('s', 'b', 1)])
+
+        assert max_flow(graph, 's', 't').value == 3
+
+    @pytest.mark.parametrize("seed", range(6))
+    def test_random_networks_agree(self, max_flow, seed):
+        """Test random networks against the other algorithm."""
+        rng = random.Random(seed)
+        edges = [(rng.randrange(25), rng.randrange(25), rng.randint(0, 9))
+                 for _ in range(120)]
+        graph = build([(u, v, w) for u, v, w in edges if u != v])
+        graph.add_vertex(0)
+        graph.add_vertex(24)
+
+        result = max_flow(graph, 0, 24)
+
+        check_flow(graph, result, 0, 24)
+        assert result.value == dinic(graph, 0, 24).value
+
+    def test_errors(self, max_flow):
+        """Test invalid terminals and capacities."""
+        graph = build([('s', 't', 1)])
+
+        with pytest.raises(ValueError, match="not in graph"):
+            max_flow(graph, 's', 'x')
+
+        with pytest.raises(ValueError, match="different"):
+            max_flow(graph, 's', 's')
+
+        graph.add_edge('t', 'u', -1)
+        with pytest.raises(ValueError, match="negative capacity"):
+            max_flow(graph, 's', 't')
+
+
+class TestHopcroftKarp:
+    """Test maximum bipartite matching."""
+
+    def check_matching(self, graph, matching):
+        used = set()
+        for a, b in matching:
+            assert graph.has_edge(a, b)
+            assert a not in used and b not in used
+            used.update((a, b))
+
+    def test_perfect_matching(self):
+        """Test a graph where the greedy choice must be undone."""
+        graph = UndirectedGraph.from_edge_list(
+            [('w1', 'j1'), ('w1', 'j2'), ('w2', 'j1'), ('w3', 'j2'), ('w3', 'j3')])
+
+        matching = hopcroft_karp(graph, left=['w1', 'w2', 'w3'])
+
+        self.check_matching(graph, matching)
+        assert len(matching) == 3
+        assert dict(matching) == {'w1': 'j2', 'w2': 'j1', 'w3': 'j3'}
+
+    def test_inferred_sides(self):
+        """Test that sides are found by 2-coloring when not given."""
+        graph = UndirectedGraph.from_edge_list([(1, 2), (2, 3), (3, 4), (5, 6)])
+
+        matching = hopcroft_karp(graph)
+
+        self.check_matching(graph, matching)
+        assert len(matching) == 3
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_matches_max_flow(self, seed):
+        """Test the matching size against a unit-capacity max flow."""
+        rng = random.Random(seed)
+        pairs = {(f"L{rng.randrange(30)}", f"R{rng.randrange(30)}") for _ in range(80)}
+        graph = UndirectedGraph.from_edge_list(pairs)
+        network = build([('s', u, 1) for u, _ in pairs]
+                        + [(u, v, 1) for u, v in pairs]
+                        + [(v, 't', 1) for _, v in pairs])
+
+        matching = hopcroft_karp(graph, left={u for u, _ in pairs})
+
+        self.check_matching(graph, matching)
+        assert len(matching) == dinic(network, 's', 't').value
+
+    def test_not_bipartite(self):
+        """Test that odd cycles and wrong sides raise ValueError."""
+        triangle = UndirectedGraph.from_edge_list([(1, 2), (2, 3), (3, 1)])
+
+        with pytest.raises(ValueError, match="not bipartite"):
+            hopcroft_karp(triangle)
+
+        path = UndirectedGraph.from_edge_list([(1, 2), (2, 3)])
+        with pytest.raises(ValueError, match="not bipartite"):
+            hopcroft_karp(path, left=[1, 2])
+
+    def test_empty_graph(self):
+        """Test the empty graph."""
+        assert hopcroft_karp(UndirectedGraph()) == []
@@ -0,0 +1,160 @@
+import random
+
+import pytest
+
+from src.algorithms.minimum_spanning_tree import (
+    SpanningForest, boruvka, kruskal, prim_eager, prim_lazy
+)
+from src.data_structures.graphs.directed.directed_graph import DirectedGraph
+from src.data_structures.graphs.undirected.undirected_graph import UndirectedGraph
+from src.data_structures.graphs.undirected.undirected_matrix_graph import UndirectedMatrixGraph
+
+ALGORITHMS = [kruskal, prim_lazy, prim_eager, boruvka]
+
+SAMPLE_EDGES = [
+    ('A', 'B', 4), ('A', 'H', 8), ('B', 'C', 8), ('B', 'H', 11),
+    ('C', 'D', 7), ('C', 'F', 4), ('C', 'I', 2), ('D', 'E', 9),
+    ('D', 'F', 14), ('E', 'F', 10), ('F', 'G', 2), ('G', 'H', 1),
+    ('G', 'I', 6), ('H', 'I', 7),
+]
+
+
+def random_graph(n, m, seed):
+    rng = random.Random(seed)
+    graph = UndirectedGraph()
+    for v in range(n):
+        graph.add_vertex(v)
+    for _ in range(m):
+        graph.add_edge(rng.randrange(n), rng.randrange(n), rng.randint(1, 50))
+    return graph
+
+
+def is_forest(forest, vertices):
+    parent = {v: v for v in vertices}
+
+    def find(v):
+        while parent[v] != v:
+            v = parent[v]
+        return v
+
+    for u, v, _ in forest:
+        ru, rv = find(u), find(v)
+        if ru == rv:
+            return False
+        parent[ru] = rv
+    return True
+
+
+@pytest.mark.parametrize("mst", ALGORITHMS)
+class TestMinimumSpanningTree:
+    """Test every MST algorithm on the same inputs."""
+
+    def test_classic_example(self, mst):
+        """Test the textbook 9-vertex graph (total weight 37)."""
+        graph = UndirectedGraph.from_edge_list(SAMPLE_EDGES)
+
+        forest = mst(graph)
+
+        assert isinstance(forest, SpanningForest)
+        assert forest.total_weight == 37
+        assert len(forest) == 8
+        assert forest.is_tree()
+        assert is_forest(forest, graph.get_vertices())
+        for u, v, weight in forest:
+            assert graph.get_edge_weight(u, v) == weight
+
+    def test_disconnected_graph_gives_forest(self, mst):
+        """Test that each component gets its own tree."""
+        graph = UndirectedGraph.from_edge_list(
+            [(1, 2, 3), (2, 3, 1), (1, 3, 2), (4, 5, 7)])
+        graph.add_vertex(6)
+
+        forest = mst(graph)
+
+        assert forest.total_weight == 10
+        assert forest.num_trees == 3
+        assert not forest.is_tree()
+
+    def test_empty_and_single_vertex(self, mst):
+        """Test trivial graphs."""
+        graph = UndirectedGraph()
+        assert mst(graph).total_weight == 0
+        assert len(mst(graph)) == 0
+
+        graph.add_vertex('A')
+        forest = mst(graph)
+        assert len(forest) == 0
+        assert forest.is_tree()
+
+    def test_equal_weights(self, mst):
+        """Test that ties never produce a cycle."""
+        graph = UndirectedGraph.from_edge_list(
+            [(u, v, 1) for u in range(6) for v in range(u + 1, 6)])
+
+        forest = mst(graph)
+
+        assert len(forest) == 5
+        assert forest.total_weight == 5
+        assert is_forest(forest, range(6))
+
+    def test_negative_and_float_weights(self, mst):
+        """Test that weights need only be comparable numbers."""
+        graph = UndirectedGraph.from_edge_list(
+            [('a', 'b', -2.5), ('b', 'c', 1.5), ('a', 'c', -1.0)])
+
+        assert mst(graph).total_weight == -3.5
+
+    def test_matrix_graph(self, mst):
+        """Test UndirectedMatrixGraph input, ignoring self-loops."""
+        graph = UndirectedMatrixGraph(4)
+        graph.add_edge(0, 1, 5)
+        graph.add_edge(1, 2, 1)
+        graph.add_edge(0, 2, 2)
+        graph.add_edge(2, 3, 4)
+        graph.add_edge(3, 3, -10)
+
+        forest = mst(graph)
+
+        assert forest.total_weight == 7
+        assert sorted(sorted(edge[:2]) for edge in forest) == [[0, 2], [1, 2], [2, 3]]
+
+    def test_directed_graph_rejected(self, mst):
+        """Test that directed graphs raise ValueError."""
+        graph = DirectedGraph()
+        graph.add_edge('A', 'B')
+
+        with pytest.raises(ValueError, match="undirected"):
+            mst(graph)
+
+
+class TestAgreement:
+    """Test that all algorithms find the same total weight."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_graphs(self, seed):
+        """Test random sparse graphs, some disconnected."""
+        graph = random_graph(60, 90, seed)
+
+        results = [mst(graph) for mst in ALGORITHMS]
+
+        assert len({forest.total_weight for forest in results}) == 1
+        assert len({len(forest) for forest in results}) == 1
+        assert all(is_forest(forest, range(60)) for forest in results)
+
+    def test_parallel_boruvka(self):
+        """Test that a process pool gives the same forest weight."""
+        graph = random_graph(200, 600, 42)
+
+        assert (boruvka(graph, workers=2).total_weight
+                == kruskal(graph).total_weight)
+
+    def test_invalid_workers(self):
+        """Test that workers must be positive."""
+        with pytest.raises(ValueError, match="workers"):
+            boruvka(UndirectedGraph(), workers=0)
+
+    def test_repr(self):
+        """Test SpanningForest __repr__."""
+        graph = UndirectedGraph.from_edge_list([(1, 2, 3)])
+
+        assert repr(kruskal(graph)) == "SpanningForest(edges=1, total_weight=3, trees=1)"
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from src.algorithms.parallel_bfs import parallel_bfs
+from src.data_structures.graphs.directed.directed_graph import DirectedGraph
+from src.data_structures.graphs.undirected.undirected_graph import UndirectedGraph
+
+
+def random_graph(cls, n, m, seed):
+    rng = random.Random(seed)
+    graph = cls.from_edge_list(
+        (rng.randrange(n), rng.randrange(n)) for _ in range(m))
+    for v in range(n):
+        graph.add_vertex(v)
+    return graph
+
+
+def bfs_levels(graph, source):
+    levels = {source: 0}
+    frontier = [source]
+    while frontier:
+        next_frontier = []
+        for u in frontier:
+            for v, _ in graph.get_neighbors(u):
+                if v not in levels:
+                    levels[v] = levels[u] + 1
+                    next_frontier.append(v)
+        frontier = next_frontier
+    return levels
+
+
+class TestParallelBFS:
+    """Tests for the level-synchronous parallel BFS."""
+
+    def test_sequential_small_graph(self):
+        """Test the sequential path on a small graph."""
+        g = DirectedGraph()
+        g.add_edge('A', 'B')
+        g.add_edge('B', 'C')
+        g.add_edge('A', 'C')
+        g.add_vertex('D')
+
+        result = parallel_bfs(g, 'A')
+
+        assert result.distances == {'A': 0, 'B': 1, 'C': 1}
+        assert result.path_to('C') == ['A', 'C']
+        assert result.path_to('D') is None
+
+    def test_unknown_source(self):
+        """Test that an unknown source raises ValueError."""
+        with pytest.raises(ValueError, match="not in graph"):
+            parallel_bfs(DirectedGraph(), 'A')
+
+    @pytest.mark.parametrize("cls", [DirectedGraph, UndirectedGraph])
+    def test_parallel_matches_sequential(self, cls):
+        """Test that the process-parallel path gives the same hop distances."""
+        graph = random_graph(cls, 300, 900, seed=2)
+
+        parallel = parallel_bfs(graph, 0, workers=2, threshold=0)
+        sequential = parallel_bfs(graph, 0, workers=1)
+
+        assert parallel.distances == sequential.distances == bfs_levels(graph, 0)
+
+        for vertex, parent in parallel.parents.items():
+            if parent is not None:
+                assert parallel.distances[parent] + 1 == parallel.distances[vertex]
+                assert any(v == vertex for v, _ in graph.get_neighbors(parent))
+
+    def test_parallel_on_snapshot(self):
+        """Test that a frozen snapshot is used directly."""
+        graph = random_graph(DirectedGraph, 100, 300, seed=4)
+
+        result = parallel_bfs(graph.freeze(), 0, workers=2, threshold=0)
+
+        assert result.distances == bfs_levels(graph, 0)
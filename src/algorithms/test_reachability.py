@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from src.algorithms.reachability import ReachabilityIndex
+from src.data_structures.graphs.directed.directed_graph import DirectedGraph
+
+
+def random_graph(n, m, seed):
+    rng = random.Random(seed)
+    graph = DirectedGraph.from_edge_list(
+        (rng.randrange(n), rng.randrange(n)) for _ in range(m))
+    for vertex in range(n):
+        graph.add_vertex(vertex)
+    return graph
+
+
+class TestReachabilityIndex:
+    """Tests for the SCC-condensed bitset reachability index."""
+
+    def test_small_graph(self):
+        """Test queries on a graph with a cycle and a sink."""
+        g = DirectedGraph()
+        g.add_edge('A', 'B')
+        g.add_edge('B', 'C')
+        g.add_edge('C', 'A')
+        g.add_edge('C', 'D')
+        g.add_vertex('E')
+
+        index = ReachabilityIndex(g)
+
+        assert index.num_components == 3
+        assert index.reachable('A', 'D')
+        assert index.reachable('C', 'B')
+        assert not index.reachable('D', 'A')
+        assert index.reachable('E', 'E')
+        assert not index.reachable('E', 'A')
+        assert len(index) == 5
+
+    def test_unknown_vertex(self):
+        """Test that unknown vertices raise ValueError."""
+        g = DirectedGraph()
+        g.add_edge('A', 'B')
+
+        with pytest.raises(ValueError, match="not in index"):
+            ReachabilityIndex(g).reachable('A', 'Z')
+
+    def test_matches_dfs_on_random_graphs(self):
+        """Test every pair against a DFS on random graphs."""
+        g = random_graph(60, 90, seed=1)
+        index = ReachabilityIndex(g)
+
+        for u in range(60):
+            reached = set(g.dfs(u))
+            for v in range(60):
+                assert index.reachable(u, v) == (v in reached)
+
+    def test_works_on_snapshot(self):
+        """Test building from a frozen snapshot."""
+        g = random_graph(30, 40, seed=2)
+        index = ReachabilityIndex(g.freeze())
+
+        assert all(index.reachable(0, v) for v in g.dfs(0))
+
+    def test_incremental_edge_added(self):
+        """Test incremental updates, cycle merges and new vertices."""
+        g = random_graph(40, 45, seed=3)
+        index = ReachabilityIndex(g)
+        rng = random.Random(4)
+
+        for _ in range(60):
+            u, v = rng.randrange(45), rng.randrange(45)
+            g.add_edge(u, v)
+            index.edge_added(u, v)
+
+        for u in g.get_vertices():
+            reached = set(g.dfs(u))
+            for v in g.get_vertices():
+                assert index.reachable(u, v) == (v in reached)
+
+    def test_rebuild_after_removal(self):
+        """Test that rebuild() reflects removed edges."""
+        g = DirectedGraph()
+        g.add_edge('A', 'B')
+        index = ReachabilityIndex(g)
+
+        g.remove_edge('A', 'B')
+        index.rebuild()
+
+        assert not index.reachable('A', 'B')
+
+    def test_memory_footprint(self):
+        """Test that the footprint grows with the number of components."""
+        small = ReachabilityIndex(random_graph(10, 5, seed=5))
+        large = ReachabilityIndex(random_graph(500, 250, seed=5))
+
+        assert small.memory_footprint()['total'] < large.memory_footprint()['total']
+        footprint = large.memory_footprint()
+        assert footprint['total'] == footprint['bitsets'] + footprint['components']
@@ -0,0 +1,179 @@
+import math
+import random
+
+import pytest
+
+from src.algorithms.shortest_paths import (
+    ShortestPaths, bellman_ford, bidirectional_dijkstra, dijkstra,
+    dijkstra_path
+)
+from src.data_structures.graphs.directed.directed_graph import (
+    DirectedGraph, IndexedDirectedGraph
+)
+from src.data_structures.graphs.directed.directed_matrix_graph import DirectedMatrixGraph
+from src.data_structures.graphs.undirected.undirected_graph import UndirectedGraph
+
+
+def build_directed(edges, cls=DirectedGraph):
+    graph = cls()
+    for u, v, w in edges:
+        graph.add_edge(u, v, w)
+    return graph
+
+
+SAMPLE_EDGES = [
+    ('A', 'B', 4), ('A', 'C', 1), ('C', 'B', 2), ('B', 'D', 1),
+    ('C', 'D', 5), ('D', 'E', 3),
+]
+
+
+def random_graph(n, m, seed, cls=DirectedGraph):
+    rng = random.Random(seed)
+    graph = cls()
+    for v in range(n):
+        graph.add_vertex(v)
+    for _ in range(m):
+        graph.add_edge(rng.randrange(n), rng.randrange(n), rng.randint(0, 20))
+    return graph
+
+
+class TestDijkstra:
+    """Tests for single-source and targeted Dijkstra."""
+
+    def test_distances(self):
+        """Test distances on a small directed graph."""
+        result = dijkstra(build_directed(SAMPLE_EDGES), 'A')
+
+        assert isinstance(result, ShortestPaths)
+        assert result.distances == {'A': 0, 'B': 3, 'C': 1, 'D': 4, 'E': 7}
+        assert result.path_to('E') == ['A', 'C', 'B', 'D', 'E']
+        assert result.path_to('A') == ['A']
+
+    def test_unreachable(self):
+        """Test that unreachable vertices report infinity and no path."""
+        graph = build_directed(SAMPLE_EDGES)
+        graph.add_vertex('Z')
+
+        result = dijkstra(graph, 'A')
+
+        assert result.distance('Z') == math.inf
+        assert not result.has_path_to('Z')
+        assert result.path_to('Z') is None
+
+    def test_early_exit_single_target(self):
+        """Test that the single-target search stops early."""
+        graph = build_directed(SAMPLE_EDGES)
+
+        result = dijkstra(graph, 'A', targets=['C'])
+
+        assert result.distance('C') == 1
+        assert 'E' not in result.distances
+        assert dijkstra_path(graph, 'A', 'D') == (4, ['A', 'C', 'B', 'D'])
+        assert dijkstra_path(graph, 'E', 'A') == (math.inf, None)
+
+    def test_multi_target(self):
+        """Test that a multi-target search settles every target."""
+        graph = build_directed(SAMPLE_EDGES)
+
+        result = dijkstra(graph, 'A', targets=['B', 'D'])
+
+        assert result.distance('B') == 3
+        assert result.distance('D') == 4
+
+    def test_negative_weight_raises(self):
+        """Test that negative weights are rejected."""
+        graph = build_directed([('A', 'B', -1)])
+
+        with pytest.raises(ValueError, match="non-negative"):
+            dijkstra(graph, 'A')
+
+    def test_undirected_and_matrix_graphs(self):
+        """Test that Dijkstra works on undirected and matrix graphs."""
+        undirected = UndirectedGraph()
+        for u, v, w in SAMPLE_EDGES:
+            undirected.add_edge(u, v, w)
+
+        assert dijkstra(undirected, 'E').distance('A') == 7
+
+        matrix = DirectedMatrixGraph(4)
+        matrix.add_edge(0, 1, 5)
+        matrix.add_edge(0, 2, 1)
+        matrix.add_edge(2, 1, 1)
+        matrix.add_edge(1, 3, 1)
+
+        assert dijkstra_path(matrix, 0, 3) == (3, [0, 2, 1, 3])
+
+
+class TestBidirectionalDijkstra:
+    """Tests for bidirectional Dijkstra."""
+
+    def test_sample_graph(self):
+        """Test a simple query and the trivial same-vertex query."""
+        graph = build_directed(SAMPLE_EDGES)
+
+        assert bidirectional_dijkstra(graph, 'A', 'E') == (
+            7, ['A', 'C', 'B', 'D', 'E'])
+        assert bidirectional_dijkstra(graph, 'B', 'B') == (0, ['B'])
+        assert bidirectional_dijkstra(graph, 'E', 'A') == (math.inf, None)
+
+    @pytest.mark.parametrize("cls", [DirectedGraph, IndexedDirectedGraph])
+    def test_matches_dijkstra_on_random_graphs(self, cls):
+        """Test agreement with plain Dijkstra on random graphs."""
+        graph = random_graph(60, 240, seed=3, cls=cls)
+
+        for source in range(0, 60, 7):
+            expected = dijkstra(graph, source)
+            for target in range(60):
+                distance, path = bidirectional_dijkstra(graph, source, target)
+                assert distance == expected.distance(target)
+                if path is not None:
+                    assert path[0] == source and path[-1] == target
+                    assert sum(graph.get_edge_weight(a, b)
+                               for a, b in zip(path, path[1:])) == distance
+
+    def test_undirected_and_matrix_graphs(self):
+        """Test bidirectional search on undirected and matrix graphs."""
+        undirected = UndirectedGraph()
+        for u, v, w in SAMPLE_EDGES:
+            undirected.add_edge(u, v, w)
+
+        assert bidirectional_dijkstra(undirected, 'E', 'A')[0] == 7
+
+        matrix = DirectedMatrixGraph(3)
+        matrix.add_edge(0, 1, 2)
+        matrix.add_edge(1, 2, 2)
+        matrix.add_edge(0, 2, 5)
+
+        assert bidirectional_dijkstra(matrix, 0, 2) == (4, [0, 1, 2])
+
+
+class TestBellmanFord:
+    """Tests for Bellman-Ford."""
+
+    def test_negative_weights(self):
+        """Test shortest paths with negative edge weights."""
+        graph = build_directed([('S', 'A', 4), ('S', 'B', 2), ('B', 'A', -3),
+                                ('A', 'C', 1)])
+
+        result = bellman_ford(graph, 'S')
+
+        assert result.distances == {'S': 0, 'A': -1, 'B': 2, 'C': 0}
+        assert result.path_to('C') == ['S', 'B', 'A', 'C']
+
+    def test_negative_cycle_raises(self):
+        """Test that a reachable negative cycle is reported."""
+        graph = build_directed([('S', 'A', 1), ('A', 'B', -2), ('B', 'A', 1)])
+
+        with pytest.raises(ValueError, match="negative-weight cycle"):
+            bellman_ford(graph, 'S')
+
+    def test_unknown_source_raises(self):
+        """Test that an unknown source raises ValueError."""
+        with pytest.raises(ValueError, match="not in graph"):
+            bellman_ford(build_directed(SAMPLE_EDGES), 'Z')
+
+    def test_matches_dijkstra_on_random_graphs(self):
+        """Test agreement with Dijkstra on non-negative weights."""
+        graph = random_graph(50, 200, seed=11)
+
+        assert bellman_ford(graph, 0).distances == dijkstra(graph, 0).distances
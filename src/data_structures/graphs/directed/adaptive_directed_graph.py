@@ -0,0 +1,444 @@
+from __future__ import annotations
+import logging
+import time
+from typing import Any, Iterable, Iterator, List, Tuple
+
+from src.data_structures.graphs.directed.directed_graph import DirectedGraph
+from src.data_structures.graphs.directed.directed_matrix_graph import DirectedMatrixGraph
+
+logger = logging.getLogger(__name__)
+
+LIST = 'list'
+MATRIX = 'matrix'
+
+
+class AdaptiveDirectedGraph:
+    """
+      A directed weighted graph on vertices 0..num_vertices-1 that picks its
+      own storage. It keeps an edge count, and when the density
+      E / V² rises above to_matrix_density the edges move into a
+      DirectedMatrixGraph; when it falls below to_list_density they move
+      back into a DirectedGraph. The gap between the two thresholds stops
+      a graph hovering around one of them from migrating on every edit.
+
+      Both storages sit behind one API, which accepts the method names of
+      either class (in_degree / get_in_degree, get_edge_weight / get_weight).
+      Each migration is logged at INFO level on this module's logger with
+      the number of edges moved and the time it took.
+
+      Traversals (dfs, bfs, has_cycle, topological_sort and the connected
+      components) run on the list storage; in matrix storage they first
+      copy the edges into a DirectedGraph. The vertex set is fixed: there
+      is no add_vertex/remove_vertex, and vertices are the ints
+      0..num_vertices-1 rather than arbitrary labels.
+    """
+
+    directed = True
+
+    def __init__(self, num_vertices: int, to_matrix_density: float = 0.25,
+                 to_list_density: float = 0.0625, storage: str = LIST) -> None:
+        """
+        Initialize a graph with num_vertices vertices and no edges.
+
+        Time Complexity: O(V), or O(V²) if starting in matrix storage
+
+        Raises:
+            ValueError: If num_vertices is not positive, the thresholds are
+            not 0 <= to_list_density < to_matrix_density <= 1, or storage
+            is not 'list' or 'matrix'
+        """
+        if num_vertices <= 0:
+            raise ValueError("Number of vertices must be positive")
+        if not 0 <= to_list_density < to_matrix_density <= 1:
+            raise ValueError(
+                "Thresholds must satisfy 0 <= to_list_density < to_matrix_density <= 1")
+        if storage not in (LIST, MATRIX):
+            raise ValueError(f"Storage must be '{LIST}' or '{MATRIX}'")
+
+        self.num_vertices = num_vertices
+        self.to_matrix_density = to_matrix_density
+        self.to_list_density = to_list_density
+        self.migrations = 0
+        self._num_edges = 0
+        self._backend = self._empty(storage)
+        self._storage = storage
+
+    @property
+    def storage(self) -> str:
+        """The current storage, 'list' or 'matrix'."""
+        return self._storage
+
+    def _empty(self, storage: str) -> DirectedGraph | DirectedMatrixGraph:
+        """
+        An empty backend of the given storage holding every vertex.
+
+        Time Complexity: O(V) for list storage, O(V²) for matrix storage
+        """
+        if storage == MATRIX:
+            return DirectedMatrixGraph(self.num_vertices)
+
+        backend = DirectedGraph()
+        for vertex in range(self.num_vertices):
+            backend.add_vertex(vertex)
+        return backend
+
+    def density(self) -> float:
+        """
+        Returns the fraction of the V² possible edges that are present.
+
+        Time Complexity: O(1)
+        """
+        return self._num_edges / (self.num_vertices * self.num_vertices)
+
+    def migrate(self, storage: str) -> None:
+        """
+        Move every edge into the given storage. Automatic migrations go
+        through here; calling it directly pins nothing, so the next edit
+        may migrate back if the density says so.
+
+        Time Complexity: O(V + E) into list storage, O(V² + E) into matrix storage
+
+        Raises:
+            ValueError: If storage is not 'list' or 'matrix'
+        """
+        if storage not in (LIST, MATRIX):
+            raise ValueError(f"Storage must be '{LIST}' or '{MATRIX}'")
+        if storage == self._storage:
+            return
+
+        start = time.perf_counter()
+        backend = self._empty(storage)
+
+        if storage == MATRIX:
+            for u in range(self.num_vertices):
+                row = backend.matrix[u]
+                for v, weight in self._backend.get_neighbors(u):
+                    row[v] = weight
+        else:
+            # add_edges_from() checks duplicates with a set per source
+            # instead of scanning the adjacency list for every edge
+            backend.add_edges_from(self.get_edges())
+
+        elapsed = time.perf_counter() - start
+        logger.info("%r migrated %s -> %s storage at density %.4f: "
+                    "moved %d edges in %.3f ms", self, self._storage, storage,
+                    self.density(), self._num_edges, elapsed * 1000)
+
+        self._backend = backend
+        self._storage = storage
+        self.migrations += 1
+
+    def _rebalance(self) -> None:
+        """
+        Migrate if the density has crossed the threshold for the current
+        storage.
+
+        Time Complexity: O(1) unless a migration happens
+        """
+        density = self.density()
+
+        if self._storage == LIST and density > self.to_matrix_density:
+            self.migrate(MATRIX)
+        elif self._storage == MATRIX and density < self.to_list_density:
+            self.migrate(LIST)
+
+    def add_edge(self, u: int, v: int, weight: Any = 1) -> bool:
+        """
+        Adds a weighted edge FROM u TO v. An existing edge is left as it
+        is; use update_edge_weight() to change its weight.
+
+        Time Complexity: O(1) in matrix storage, O(out-degree of u) in list
+        storage, plus an occasional migration
+
+        Returns: True if the edge was added, False if it already existed
+        """
+        self._validate_vertices(u, v)
+
+        if self._storage == MATRIX:
+            if self._backend.matrix[u][v] is not None:
+                return False
+            self._backend.matrix[u][v] = weight
+        elif not self._backend.add_edge(u, v, weight):
+            return False
+
+        self._num_edges += 1
+        self._rebalance()
+        return True
+
+    def add_edges_from(self, edges: Iterable[Tuple]) -> int:
+        """
+        Add many (u, v) or (u, v, weight) edges, checking the density only
+        once at the end so a bulk load migrates at most once. In list
+        storage the batch goes through DirectedGraph.add_edges_from(),
+        which checks duplicates with a set per source.
+
+        Time Complexity: O(k) for k edges in matrix storage, O(k + sum of
+        out-degrees of touched sources) in list storage, plus at most one
+        migration
+
+        Returns: Number of edges actually added
+        """
+        if self._storage == LIST:
+            try:
+                added = self._backend.add_edges_from(self._checked(edges))
+            except Exception:
+                # Keep the count right even if a bad edge stops the batch
+                self._num_edges = sum(self._backend.out_degree(u)
+                                      for u in range(self.num_vertices))
+                raise
+            self._num_edges += added
+            self._rebalance()
+            return added
+
+        added = 0
+        matrix = self._backend.matrix
+
+        try:
+            for u, v, weight in self._checked(edges):
+                if matrix[u][v] is not None:
+                    continue
+                matrix[u][v] = weight
+                added += 1
+        finally:
+            # Keep the count right even if a bad edge stops the batch
+            self._num_edges += added
+
+        self._rebalance()
+        return added
+
+    def _checked(self, edges: Iterable[Tuple]) -> Iterator[Tuple[int, int, Any]]:
+        """
+        Lazily yield each edge as (u, v, weight), validating both ends.
+
+        Raises:
+            IndexError: If an edge has a vertex out of bounds
+        """
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            self._validate_vertices(u, v)
+            yield u, v, edge[2] if len(edge) > 2 else 1
+
+    def remove_edge(self, u: int, v: int) -> bool:
+        """
+        Removes the edge FROM u TO v.
+
+        Time Complexity: O(1) in matrix storage, O(out-degree of u) in list
+        storage, plus an occasional migration
+
+        Returns: True if edge was removed, False if no edge existed
+        """
+        self._validate_vertices(u, v)
+
+        if not self._backend.remove_edge(u, v):
+            return False
+
+        self._num_edges -= 1
+        self._rebalance()
+        return True
+
+    def has_edge(self, u: int, v: int) -> bool:
+        """
+        Checks if a directed edge exists FROM u TO v.
+
+        Time Complexity: O(1) in matrix storage, O(out-degree of u) in list storage
+        """
+        self._validate_vertices(u, v)
+        return self._backend.has_edge(u, v)
+
+    def get_edge_weight(self, u: int, v: int) -> Any:
+        """
+        Returns the weight of edge (u, v), or None if no edge exists.
+
+        Time Complexity: O(1) in matrix storage, O(out-degree of u) in list storage
+        """
+        self._validate_vertices(u, v)
+
+        if self._storage == MATRIX:
+            return self._backend.get_weight(u, v)
+        return self._backend.get_edge_weight(u, v)
+
+    get_weight = get_edge_weight
+
+    def update_edge_weight(self, u: int, v: int, new_weight: Any) -> bool:
+        """
+        Update the weight of an existing edge.
+
+        Time Complexity: O(1) in matrix storage, O(out-degree of u) in list storage
+
+        Returns: True if edge was updated, False if edge doesn't exist
+        """
+        self._validate_vertices(u, v)
+
+        if self._storage == MATRIX:
+            if self._backend.matrix[u][v] is None:
+                return False
+            self._backend.matrix[u][v] = new_weight
+            return True
+        return self._backend.update_edge_weight(u, v, new_weight)
+
+    def get_neighbors(self, u: int) -> List[Tuple[int, Any]]:
+        """
+        Returns a list of (vertex, weight) tuples for all outgoing edges
+        from u. Neighbor order follows the current storage (insertion order
+        for list storage, ascending for matrix storage).
+
+        Time Complexity: O(out-degree of u) in list storage, O(V) in matrix storage
+        """
+        self._validate_vertex(u)
+        return list(self._backend.get_neighbors(u))
+
+    def get_vertices(self) -> List[int]:
+        """
+        Returns all vertices, 0..num_vertices-1.
+
+        Time Complexity: O(V)
+        """
+        return list(range(self.num_vertices))
+
+    def get_edges(self) -> List[Tuple[int, int, Any]]:
+        """
+        Returns a list of all edges as (u, v, weight) tuples.
+
+        Time Complexity: O(V + E) in list storage, O(V²) in matrix storage
+        """
+        return [(u, v, weight) for u in range(self.num_vertices)
+                for v, weight in self._backend.get_neighbors(u)]
+
+    def num_edges(self) -> int:
+        """
+        Returns the number of edges.
+
+        Time Complexity: O(1)
+        """
+        return self._num_edges
+
+    def in_degree(self, v: int) -> int:
+        """
+        Returns the number of incoming edges to vertex v.
+
+        Time Complexity: O(1) in list storage, O(V) in matrix storage
+        """
+        self._validate_vertex(v)
+
+        if self._storage == MATRIX:
+            return self._backend.get_in_degree(v)
+        return self._backend.in_degree(v)
+
+    def out_degree(self, u: int) -> int:
+        """
+        Returns the number of outgoing edges from vertex u.
+
+        Time Complexity: O(1) in list storage, O(V) in matrix storage
+        """
+        self._validate_vertex(u)
+
+        if self._storage == MATRIX:
+            return self._backend.get_out_degree(u)
+        return self._backend.out_degree(u)
+
+    get_in_degree = in_degree
+    get_out_degree = out_degree
+
+    def _as_list(self) -> DirectedGraph:
+        """
+        The edges as a DirectedGraph: the backend itself in list storage, a
+        fresh copy with neighbors in ascending order in matrix storage.
+
+        Time Complexity: O(1) in list storage, O(V²) in matrix storage
+        """
+        if self._storage == LIST:
+            return self._backend
+
+        graph = self._empty(LIST)
+        graph.add_edges_from(self.get_edges())
+        return graph
+
+    def dfs(self, start_vertex: int) -> List[int]:
+        """
+        Depth-First Search traversal starting from start_vertex, visiting
+        neighbors in get_neighbors() order.
+
+        Time Complexity: O(V + E) in list storage, O(V²) in matrix storage
+
+        Raises:
+            IndexError: If start_vertex is out of bounds
+        """
+        self._validate_vertex(start_vertex)
+        return self._as_list().dfs(start_vertex)
+
+    def bfs(self, start_vertex: int) -> List[int]:
+        """
+        Breadth-First Search traversal starting from start_vertex, visiting
+        neighbors in get_neighbors() order.
+
+        Time Complexity: O(V + E) in list storage, O(V²) in matrix storage
+
+        Raises:
+            IndexError: If start_vertex is out of bounds
+        """
+        self._validate_vertex(start_vertex)
+        return self._as_list().bfs(start_vertex)
+
+    def has_cycle(self) -> bool:
+        """
+        Check if the graph has a cycle.
+
+        Time Complexity: O(V + E) in list storage, O(V²) in matrix storage
+        """
+        return self._as_list().has_cycle()
+
+    def topological_sort(self) -> List[int] | None:
+        """
+        Return a topological ordering of the vertices if the graph is acyclic.
+
+        Time Complexity: O(V + E) in list storage, O(V²) in matrix storage
+
+        Returns:
+            List of vertices in topological order, or None if graph has a cycle
+        """
+        return self._as_list().topological_sort()
+
+    def weakly_connected_components(self) -> List[List[int]]:
+        """
+        Find all weakly connected components.
+
+        Time Complexity: O(V + E) in list storage, O(V²) in matrix storage
+        """
+        return self._as_list().weakly_connected_components()
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """
+        Find all Strongly Connected Components, in topological order.
+
+        Time Complexity: O(V + E) in list storage, O(V²) in matrix storage
+        """
+        return self._as_list().strongly_connected_components()
+
+    def _validate_vertex(self, v: int) -> None:
+        """Validates a single vertex index."""
+        if not (0 <= v < self.num_vertices):
+            raise IndexError(
+                f"Vertex {v} out of bounds [0, {self.num_vertices})")
+
+    def _validate_vertices(self, u: int, v: int) -> None:
+        """Validates two vertex indices."""
+        self._validate_vertex(u)
+        self._validate_vertex(v)
+
+    def __contains__(self, vertex: Any) -> bool:
+        return isinstance(vertex, int) and 0 <= vertex < self.num_vertices
+
+    def __len__(self) -> int:
+        return self.num_vertices
+
+    def __str__(self) -> str:
+        """String representation showing edge list."""
+        edges = [f"{u} --({w})--> {v}" for u, v, w in self.get_edges()]
+        header = (f"AdaptiveDirectedGraph({self.num_vertices} vertices, "
+                  f"{len(edges)} edges, {self._storage} storage)")
+
+        return header + "\n" + "\n".join(edges) if edges else header
+
+    def __repr__(self) -> str:
+        return (f"AdaptiveDirectedGraph(num_vertices={self.num_vertices}, "
+                f"edges={self._num_edges}, storage={self._storage!r})")
@@ -1,3 +1,6 @@
+import heapq
+
+
 class DirectedMatrixGraph:
     """
       Implements a Directed Weighted Graph using an Adjacency Matrix.
@@ -5,6 +8,8 @@ class DirectedMatrixGraph:
       Uses None to represent absence of edges (allowing zero-weight edges).
     """
 
+    directed = True
+
     def __init__(self, num_vertices):
         """
         Initialize a directed weighted graph with num_vertices vertices.
@@ -18,6 +23,70 @@ class DirectedMatrixGraph:
 
         self.num_vertices = num_vertices
         self.matrix = [[None] * num_vertices for _ in range(num_vertices)]
+        # Ids of removed vertices: a min-heap for reuse plus a set for lookups
+        self._free = []
+        self._removed = set()
+
+    def add_vertex(self):
+        """
+        Adds an isolated vertex and returns its id. Removed ids are reused,
+        lowest first, before the matrix grows; growing appends a column to
+        every row and one new row. List appends over-allocate geometrically,
+        so this costs amortized O(V) instead of an O(V²) rebuild, and
+        existing ids never change.
+
+        Time Complexity: amortized O(V), O(log V) when reusing an id
+        """
+        if self._free:
+            v = heapq.heappop(self._free)
+            self._removed.discard(v)
+            return v
+
+        v = self.num_vertices
+        for row in self.matrix:
+            row.append(None)
+        self.matrix.append([None] * (v + 1))
+        self.num_vertices += 1
+
+        return v
+
+    def remove_vertex(self, v):
+        """
+        Removes vertex v and all its edges. Its id goes on the free list for
+        add_vertex() to reuse; every other id is unchanged.
+
+        Time Complexity: O(V)
+        Returns: True if the vertex was removed, False if already removed
+        """
+        if not (0 <= v < self.num_vertices):
+            raise IndexError(
+                f"Vertex {v} out of bounds [0, {self.num_vertices})")
+        if v in self._removed:
+            return False
+
+        for row in self.matrix:
+            row[v] = None
+        self.matrix[v] = [None] * self.num_vertices
+        self._removed.add(v)
+        heapq.heappush(self._free, v)
+
+        return True
+
+    def has_vertex(self, v):
+        """
+        Checks if v is the id of a vertex in the graph.
+
+        Time Complexity: O(1)
+        """
+        return 0 <= v < self.num_vertices and v not in self._removed
+
+    def get_vertices(self):
+        """
+        Returns the ids of all vertices in ascending order, skipping removed ones.
+
+        Time Complexity: O(V)
+        """
+        return [v for v in range(self.num_vertices) if v not in self._removed]
 
     def add_edge(self, u, v, weight=1):
         """
@@ -91,11 +160,87 @@ class DirectedMatrixGraph:
         return sum(1 for v in range(self.num_vertices)
                    if self.matrix[u][v] is not None)
 
+    def transitive_closure(self):
+        """
+        Returns the transitive closure as one bitmask per vertex: bit v of
+        closure[u] is set when there is a path of one or more edges FROM u
+        TO v (so bit u is set only if u lies on a cycle). The list is
+        indexed by id up to num_vertices, so removed ids show up as zero
+        masks and are never set in another row.
+
+        Bit-parallel Warshall: rows are Python ints, and for each pivot k
+        every row that reaches k ORs in row k, a whole row per operation.
+
+        Time Complexity: O(V³ / 64) word operations
+        Space Complexity: O(V² / 8) bytes
+        """
+        closure = []
+        for row in self.matrix:
+            mask = 0
+            for v, weight in enumerate(row):
+                if weight is not None:
+                    mask |= 1 << v
+            closure.append(mask)
+
+        for k in range(self.num_vertices):
+            row_k = closure[k]
+            if not row_k:
+                continue
+            for i in range(self.num_vertices):
+                if closure[i] >> k & 1:
+                    closure[i] |= row_k
+
+        return closure
+
+    def count_paths(self, k, cumulative=False, dtype=None):
+        """
+        Returns a NumPy array whose [u, v] entry is the number of walks of
+        exactly k edges FROM u TO v (vertices may repeat), or of 1 to k
+        edges if cumulative is True. Computed as the k-th power of the 0/1
+        adjacency matrix by repeated squaring, with the cumulative sum built
+        alongside: S(2m) = S(m) + A^m S(m) and S(2m + 1) = S(2m) + A^(2m+1).
+
+        Counts are int64 by default and wrap around past 2**63 - 1; pass
+        dtype=object for exact (but much slower) Python int counts.
+        The array is indexed by id up to num_vertices, so removed ids show
+        up as all-zero rows and columns (even for k = 0). Requires NumPy.
+
+        Time Complexity: O(V³ log k)
+        Raises:
+            ValueError: If k is negative
+        """
+        import numpy as np
+
+        if k < 0:
+            raise ValueError("Path length must be non-negative")
+
+        dtype = np.int64 if dtype is None else dtype
+        n = self.num_vertices
+        adjacency = np.array([[weight is not None for weight in row] for row in self.matrix],
+                             dtype=dtype).reshape(n, n)
+
+        power = np.identity(n, dtype=dtype)
+        removed = sorted(self._removed)
+        power[removed, removed] = 0
+        total = np.zeros((n, n), dtype=dtype)
+
+        # Walk the bits of k from the top: doubling m, then adding one if set
+        for bit in bin(k)[2:]:
+            total = total + power @ total
+            power = power @ power
+            if bit == '1':
+                power = power @ adjacency
+                total = total + power
+
+        return total if cumulative else power
+
     def _validate_vertex(self, v):
         """Validates a single vertex index."""
         if not (0 <= v < self.num_vertices):
             raise IndexError(
                 f"Vertex {v} out of bounds [0, {self.num_vertices})")
+        if v in self._removed:
+            raise IndexError(f"Vertex {v} has been removed")
 
     def _validate_vertices(self, u, v):
         """Validates two vertex indices."""
@@ -104,6 +249,7 @@ class DirectedMatrixGraph:
 
     def __str__(self):
         """String representation showing edge list."""
+        num_vertices = len(self.get_vertices())
         edges = []
 
         for u in range(self.num_vertices):
@@ -111,9 +257,9 @@ class DirectedMatrixGraph:
                 if self.matrix[u][v] is not None:
                     edges.append(f"{u} --({self.matrix[u][v]})--> {v}")
 
-        return f"DirectedMatrixGraph({self.num_vertices} vertices, {len(edges)} edges)\n" + \
+        return f"DirectedMatrixGraph({num_vertices} vertices, {len(edges)} edges)\n" + \
                "\n".join(
-                   edges) if edges else f"DirectedMatrixGraph({self.num_vertices} vertices, 0 edges)"
+                   edges) if edges else f"DirectedMatrixGraph({num_vertices} vertices, 0 edges)"
 
     def __repr__(self):
-        return f"DirectedMatrixGraph(num_vertices={self.num_vertices})"
+        return f"DirectedMatrixGraph(num_vertices={len(self.get_vertices())})"
@@ -0,0 +1,190 @@
+import numpy as np
+
+
+class DirectedNumpyGraph:
+    """
+      Implements a Directed Weighted Graph using NumPy arrays.
+      Weights live in a float64 matrix and edge presence in a separate
+      boolean mask (allowing zero and negative weights), so degrees,
+      neighbor lists and edge enumeration are vectorized instead of
+      looping over Python lists of None.
+    """
+
+    directed = True
+
+    def __init__(self, num_vertices):
+        """
+        Initialize a directed weighted graph with num_vertices vertices.
+
+        Time Complexity: O(V²) where V is the number of vertices
+        Space Complexity: 9 bytes per matrix cell (8 weight + 1 mask)
+        """
+        if num_vertices <= 0:
+            raise ValueError("Number of vertices must be positive")
+
+        self.num_vertices = num_vertices
+        self.weights = np.zeros((num_vertices, num_vertices), dtype=np.float64)
+        self.mask = np.zeros((num_vertices, num_vertices), dtype=bool)
+
+    def add_edge(self, u, v, weight=1):
+        """
+        Adds a weighted edge FROM u TO v (non-symmetric).
+
+        Time Complexity: O(1)
+        """
+        self._validate_vertices(u, v)
+        self.weights[u, v] = weight
+        self.mask[u, v] = True
+
+    def add_edges(self, us, vs, weights=None):
+        """
+        Adds many edges at once from parallel arrays of sources, targets
+        and (optionally) weights, which default to 1. Later duplicates
+        overwrite earlier ones, as repeated add_edge() calls would.
+
+        Time Complexity: O(k) vectorized, where k is the number of edges
+        """
+        us = np.asarray(us, dtype=np.intp)
+        vs = np.asarray(vs, dtype=np.intp)
+        self._validate_arrays(us, vs)
+
+        self.weights[us, vs] = 1 if weights is None else weights
+        self.mask[us, vs] = True
+
+    def remove_edge(self, u, v):
+        """
+        Removes the edge FROM u TO v.
+
+        Time Complexity: O(1)
+        Returns: True if edge was removed, False if no edge existed
+        """
+        self._validate_vertices(u, v)
+
+        if self.mask[u, v]:
+            self.mask[u, v] = False
+            self.weights[u, v] = 0
+            return True
+
+        return False
+
+    def has_edge(self, u, v):
+        """
+        Checks if a directed edge exists FROM u TO v.
+
+        Time Complexity: O(1)
+        """
+        self._validate_vertices(u, v)
+        return bool(self.mask[u, v])
+
+    def get_weight(self, u, v):
+        """
+        Returns the weight of edge (u, v), or None if no edge exists.
+
+        Time Complexity: O(1)
+        """
+        self._validate_vertices(u, v)
+        return float(self.weights[u, v]) if self.mask[u, v] else None
+
+    def get_neighbors(self, u):
+        """
+        Returns a list of (vertex, weight) tuples for all outgoing edges from u.
+
+        Time Complexity: O(V) vectorized
+        """
+        self._validate_vertex(u)
+        targets = np.flatnonzero(self.mask[u])
+        return list(zip(targets.tolist(), self.weights[u, targets].tolist()))
+
+    def get_in_degree(self, v):
+        """
+        Returns the number of incoming edges to vertex v.
+
+        Time Complexity: O(V) vectorized
+        """
+        self._validate_vertex(v)
+        return int(np.count_nonzero(self.mask[:, v]))
+
+    def get_out_degree(self, u):
+        """
+        Returns the number of outgoing edges from vertex u.
+
+        Time Complexity: O(V) vectorized
+        """
+        self._validate_vertex(u)
+        return int(np.count_nonzero(self.mask[u]))
+
+    def in_degrees(self):
+        """
+        Returns an array with the in-degree of every vertex.
+
+        Time Complexity: O(V²) vectorized
+        """
+        return np.count_nonzero(self.mask, axis=0)
+
+    def out_degrees(self):
+        """
+        Returns an array with the out-degree of every vertex.
+
+        Time Complexity: O(V²) vectorized
+        """
+        return np.count_nonzero(self.mask, axis=1)
+
+    def edge_arrays(self):
+        """
+        Returns all edges as parallel (sources, targets, weights) arrays,
+        in row-major order.
+
+        Time Complexity: O(V²) vectorized
+        """
+        us, vs = np.nonzero(self.mask)
+        return us, vs, self.weights[us, vs]
+
+    def get_edges(self):
+        """
+        Returns a list of all edges as (u, v, weight) tuples.
+
+        Time Complexity: O(V²) vectorized, plus O(E) to build the tuples
+        """
+        us, vs, weights = self.edge_arrays()
+        return list(zip(us.tolist(), vs.tolist(), weights.tolist()))
+
+    def num_edges(self):
+        """
+        Returns the number of edges.
+
+        Time Complexity: O(V²) vectorized
+        """
+        return int(np.count_nonzero(self.mask))
+
+    def _validate_vertex(self, v):
+        """Validates a single vertex index."""
+        if not (0 <= v < self.num_vertices):
+            raise IndexError(
+                f"Vertex {v} out of bounds [0, {self.num_vertices})")
+
+    def _validate_vertices(self, u, v):
+        """Validates two vertex indices."""
+        self._validate_vertex(u)
+        self._validate_vertex(v)
+
+    def _validate_arrays(self, us, vs):
+        """Validates arrays of vertex indices."""
+        if us.shape != vs.shape:
+            raise ValueError("Source and target arrays must have the same length")
+
+        for vertices in (us, vs):
+            bad = (vertices < 0) | (vertices >= self.num_vertices)
+            if bad.any():
+                raise IndexError(
+                    f"Vertex {vertices[bad][0]} out of bounds [0, {self.num_vertices})")
+
+    def __str__(self):
+        """String representation showing edge list."""
+        edges = [f"{u} --({w})--> {v}" for u, v, w in self.get_edges()]
+
+        return f"DirectedNumpyGraph({self.num_vertices} vertices, {len(edges)} edges)\n" + \
+               "\n".join(
+                   edges) if edges else f"DirectedNumpyGraph({self.num_vertices} vertices, 0 edges)"
+
+    def __repr__(self):
+        return f"DirectedNumpyGraph(num_vertices={self.num_vertices})"
@@ -0,0 +1,235 @@
+import logging
+import random
+
+import pytest
+from adaptive_directed_graph import AdaptiveDirectedGraph
+
+
+def fill(g, count, seed=0):
+    """Add count distinct random edges with their index as weight."""
+    rng = random.Random(seed)
+    cells = rng.sample(range(g.num_vertices ** 2), count)
+    for i, cell in enumerate(cells):
+        g.add_edge(*divmod(cell, g.num_vertices), i)
+    return [divmod(cell, g.num_vertices) + (i,) for i, cell in enumerate(cells)]
+
+
+class TestInitialization:
+    """Tests for graph initialization."""
+
+    def test_defaults(self):
+        g = AdaptiveDirectedGraph(5)
+
+        assert g.num_vertices == 5
+        assert g.storage == 'list'
+        assert g.num_edges() == 0
+        assert g.density() == 0
+        assert g.get_vertices() == [0, 1, 2, 3, 4]
+
+    def test_start_in_matrix_storage(self):
+        assert AdaptiveDirectedGraph(3, storage='matrix').storage == 'matrix'
+
+    @pytest.mark.parametrize("kwargs", [
+        {'num_vertices': 0},
+        {'num_vertices': 3, 'to_matrix_density': 0.1, 'to_list_density': 0.2},
+        {'num_vertices': 3, 'to_matrix_density': 0.2, 'to_list_density': 0.2},
+        {'num_vertices': 3, 'to_matrix_density': 1.5},
+        {'num_vertices': 3, 'storage': 'tree'},
+    ])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            AdaptiveDirectedGraph(**kwargs)
+
+
+@pytest.mark.parametrize("storage", ['list', 'matrix'])
+class TestUnifiedApi:
+    """The same behaviour in either storage (thresholds keep it fixed)."""
+
+    def make(self, storage, n=4):
+        return AdaptiveDirectedGraph(n, to_matrix_density=1, to_list_density=0,
+                                     storage=storage)
+
+    def test_add_and_query(self, storage):
+        g = self.make(storage)
+
+        assert g.add_edge(0, 1, 5)
+        assert not g.add_edge(0, 1, 7)
+        assert g.has_edge(0, 1)
+        assert not g.has_edge(1, 0)
+        assert g.get_weight(0, 1) == 5
+        assert g.get_edge_weight(0, 1) == 5
+        assert g.get_weight(1, 0) is None
+        assert g.num_edges() == 1
+
+    def test_zero_and_negative_weights(self, storage):
+        g = self.make(storage)
+        g.add_edge(0, 1, 0)
+        g.add_edge(1, 2, -3)
+
+        assert g.has_edge(0, 1)
+        assert g.get_weight(1, 2) == -3
+
+    def test_update_weight(self, storage):
+        g = self.make(storage)
+        g.add_edge(2, 3, 1)
+
+        assert g.update_edge_weight(2, 3, 9)
+        assert g.get_weight(2, 3) == 9
+        assert not g.update_edge_weight(3, 2, 9)
+
+    def test_remove_edge(self, storage):
+        g = self.make(storage)
+        g.add_edge(0, 1)
+
+        assert g.remove_edge(0, 1)
+        assert not g.remove_edge(0, 1)
+        assert g.num_edges() == 0
+
+    def test_degrees_and_neighbors(self, storage):
+        g = self.make(storage)
+        g.add_edges_from([(0, 1, 2), (0, 2), (3, 2, 4)])
+
+        assert sorted(g.get_neighbors(0)) == [(1, 2), (2, 1)]
+        assert g.in_degree(2) == g.get_in_degree(2) == 2
+        assert g.out_degree(0) == g.get_out_degree(0) == 2
+        assert sorted(g.get_edges()) == [(0, 1, 2), (0, 2, 1), (3, 2, 4)]
+
+    def test_add_edges_from_skips_duplicates(self, storage):
+        g = self.make(storage)
+
+        assert g.add_edges_from([(0, 1), (0, 1), (1, 0)]) == 2
+        assert g.num_edges() == 2
+
+    def test_out_of_bounds(self, storage):
+        g = self.make(storage)
+
+        with pytest.raises(IndexError, match="out of bounds"):
+            g.add_edge(0, 4)
+        with pytest.raises(IndexError):
+            g.get_neighbors(-1)
+        with pytest.raises(IndexError):
+            g.add_edges_from([(0, 1), (9, 0)])
+        # The edge before the bad one still counts
+        assert g.num_edges() == 1
+
+    def test_traversals(self, storage):
+        g = self.make(storage, n=5)
+        g.add_edges_from([(0, 2), (0, 1), (1, 3), (2, 3)])
+
+        assert sorted(g.dfs(0)) == [0, 1, 2, 3]
+        assert g.bfs(0)[0] == 0 and g.bfs(0)[-1] == 3
+        assert g.dfs(4) == [4]
+        assert not g.has_cycle()
+
+        order = g.topological_sort()
+        assert sorted(order) == [0, 1, 2, 3, 4]
+        assert all(order.index(u) < order.index(v) for u, v, _ in g.get_edges())
+        assert sorted(map(sorted, g.weakly_connected_components())) == [[0, 1, 2, 3], [4]]
+
+        with pytest.raises(IndexError):
+            g.dfs(5)
+
+    def test_cycles_and_sccs(self, storage):
+        g = self.make(storage)
+        g.add_edges_from([(3, 0), (0, 1), (1, 0), (1, 2)])
+
+        assert g.has_cycle()
+        assert g.topological_sort() is None
+        assert [set(c) for c in g.strongly_connected_components()] == [{3}, {0, 1}, {2}]
+
+
+class TestMigration:
+    """Tests for density-driven migration."""
+
+    def test_migrates_to_matrix_and_back(self):
+        g = AdaptiveDirectedGraph(10, to_matrix_density=0.2, to_list_density=0.05)
+        edges = fill(g, 20)
+        assert g.storage == 'list'
+
+        g.add_edge(*next((u, v) for u in range(10) for v in range(10)
+                         if not g.has_edge(u, v)))
+        assert g.storage == 'matrix'
+        assert g.migrations == 1
+
+        for u, v, _ in edges[:17]:
+            g.remove_edge(u, v)
+        assert g.storage == 'list'
+        assert g.migrations == 2
+
+    def test_edges_survive_migration(self):
+        g = AdaptiveDirectedGraph(8, to_matrix_density=0.3, to_list_density=0.1)
+        edges = fill(g, 30, seed=1)
+
+        assert g.storage == 'matrix'
+        assert sorted(g.get_edges()) == sorted(edges)
+        g.migrate('list')
+        assert sorted(g.get_edges()) == sorted(edges)
+        for u, v, w in edges:
+            assert g.get_weight(u, v) == w
+
+    def test_hysteresis_prevents_thrashing(self):
+        g = AdaptiveDirectedGraph(4, to_matrix_density=0.25, to_list_density=0.1)
+        fill(g, 5)
+        assert g.storage == 'matrix'
+
+        # Bouncing around the upper threshold stays in matrix storage
+        for _ in range(10):
+            u, v, _ = g.get_edges()[0]
+            g.remove_edge(u, v)
+            g.add_edge(u, v)
+        assert g.migrations == 1
+
+    def test_bulk_load_migrates_once(self):
+        g = AdaptiveDirectedGraph(10, to_matrix_density=0.2, to_list_density=0.05)
+        g.add_edges_from((u, v) for u in range(10) for v in range(10))
+
+        assert g.storage == 'matrix'
+        assert g.migrations == 1
+        assert g.density() == 1
+
+    def test_migration_is_logged(self, caplog):
+        g = AdaptiveDirectedGraph(4, to_matrix_density=0.1, to_list_density=0.05)
+
+        with caplog.at_level(logging.INFO):
+            g.add_edges_from([(0, 1), (1, 2)])
+
+        assert len(caplog.records) == 1
+        message = caplog.records[0].getMessage()
+        assert "list -> matrix" in message
+        assert "moved 2 edges" in message
+        assert " ms" in message
+
+    def test_manual_migration(self):
+        g = AdaptiveDirectedGraph(4)
+        g.add_edge(0, 1)
+        g.migrate('matrix')
+        g.migrate('matrix')
+
+        assert g.storage == 'matrix'
+        assert g.migrations == 1
+        with pytest.raises(ValueError):
+            g.migrate('csr')
+
+
+class TestRepresentation:
+    """Tests for string representations."""
+
+    def test_repr(self):
+        g = AdaptiveDirectedGraph(3)
+        g.add_edge(0, 1)
+
+        assert repr(g) == "AdaptiveDirectedGraph(num_vertices=3, edges=1, storage='list')"
+
+    def test_str(self):
+        g = AdaptiveDirectedGraph(3)
+        assert str(g) == "AdaptiveDirectedGraph(3 vertices, 0 edges, list storage)"
+
+        g.add_edge(0, 1, 4)
+        assert "0 --(4)--> 1" in str(g)
+
+    def test_len_and_contains(self):
+        g = AdaptiveDirectedGraph(3)
+
+        assert len(g) == 3
+        assert 2 in g
+        assert 3 not in g
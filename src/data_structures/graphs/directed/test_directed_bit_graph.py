@@ -0,0 +1,144 @@
+import pytest
+from directed_bit_graph import DirectedBitGraph
+from directed_matrix_graph import DirectedMatrixGraph
+
+
+def build():
+    g = DirectedBitGraph(6)
+    for u, v in [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4)]:
+        g.add_edge(u, v)
+    return g
+
+
+class TestInitialization:
+    """Tests for graph initialization."""
+
+    def test_valid_initialization(self):
+        """Test that every row starts empty."""
+        g = DirectedBitGraph(5)
+
+        assert g.num_vertices == 5
+        assert g.rows == [0] * 5
+        assert g.num_edges() == 0
+
+    def test_invalid_initialization(self):
+        """Test that a non-positive size raises ValueError."""
+        with pytest.raises(ValueError, match="Number of vertices must be positive"):
+            DirectedBitGraph(0)
+
+    def test_from_matrix_graph(self):
+        """Test conversion from a weighted matrix graph."""
+        matrix = DirectedMatrixGraph(3)
+        matrix.add_edge(0, 2, 5)
+        matrix.add_edge(2, 1, 0)
+
+        g = DirectedBitGraph.from_graph(matrix)
+
+        assert g.rows == [0b100, 0, 0b010]
+
+    def test_from_matrix_graph_with_removed_vertex(self):
+        """Test that removed matrix ids become empty rows."""
+        matrix = DirectedMatrixGraph(3)
+        matrix.add_edge(0, 1)
+        matrix.add_edge(0, 2)
+        matrix.add_edge(2, 0)
+        matrix.remove_vertex(1)
+
+        g = DirectedBitGraph.from_graph(matrix)
+
+        assert g.rows == [0b100, 0, 0b001]
+
+
+class TestEdgeOperations:
+    """Tests for adding, removing and querying edges."""
+
+    def test_add_and_has_edge(self):
+        """Test that edges are directed bits."""
+        g = build()
+
+        assert g.has_edge(0, 1)
+        assert not g.has_edge(1, 0)
+        assert g.rows[0] == 0b110
+        assert g.num_edges() == 5
+
+    def test_remove_edge(self):
+        """Test removing edges."""
+        g = build()
+
+        assert g.remove_edge(0, 1)
+        assert not g.remove_edge(0, 1)
+        assert not g.has_edge(0, 1)
+        assert g.has_edge(0, 2)
+
+    def test_neighbors_and_degrees(self):
+        """Test neighbor lists and degrees."""
+        g = build()
+
+        assert g.get_neighbors(0) == [(1, 1), (2, 1)]
+        assert g.get_neighbors(5) == []
+        assert g.get_out_degree(0) == 2
+        assert g.get_in_degree(3) == 2
+        assert g.get_in_degree(0) == 0
+
+    def test_out_of_bounds(self):
+        """Test that invalid vertices raise IndexError."""
+        g = DirectedBitGraph(3)
+
+        with pytest.raises(IndexError, match="out of bounds"):
+            g.add_edge(0, 3)
+
+        with pytest.raises(IndexError, match="out of bounds"):
+            g.bfs(-1)
+
+
+class TestBitParallelTraversal:
+    """Tests for BFS and reachability."""
+
+    def test_bfs_order_and_distances(self):
+        """Test level-by-level order and hop counts."""
+        g = build()
+
+        assert g.bfs(0) == [0, 1, 2, 3, 4]
+        assert g.bfs_distances(0) == {0: 0, 1: 1, 2: 1, 3: 2, 4: 3}
+        assert g.bfs(3) == [3, 4]
+
+    def test_reachability(self):
+        """Test reachable sets and pairwise queries."""
+        g = build()
+
+        assert g.reachable(1) == [1, 3, 4]
+        assert g.reachable_mask(4) == 0b10000
+        assert g.is_reachable(0, 4)
+        assert not g.is_reachable(4, 0)
+        assert not g.is_reachable(0, 5)
+
+    def test_cycle(self):
+        """Test that cycles terminate."""
+        g = DirectedBitGraph(3)
+        g.add_edge(0, 1)
+        g.add_edge(1, 2)
+        g.add_edge(2, 0)
+
+        assert g.bfs(1) == [1, 2, 0]
+
+    def test_large_sparse_graph(self):
+        """Test a long path on a wide graph."""
+        n = 3000
+        g = DirectedBitGraph(n)
+        for u in range(n - 1):
+            g.add_edge(u, u + 1)
+
+        assert g.bfs_distances(0)[n - 1] == n - 1
+        assert g.is_reachable(0, n - 1)
+
+
+class TestStringRepresentations:
+    """Tests for __str__ and __repr__."""
+
+    def test_str_and_repr(self):
+        g = DirectedBitGraph(2)
+
+        assert str(g) == "DirectedBitGraph(2 vertices, 0 edges)"
+        g.add_edge(1, 0)
+        assert str(g) == "DirectedBitGraph(2 vertices, 1 edges)\n1 --> 0"
+        assert repr(g) == "DirectedBitGraph(num_vertices=2)"
@@ -1,5 +1,7 @@
 import pytest
-from directed_graph import DirectedGraph
+from directed_graph import (
+    DirectedGraph, DynamicTopologicalGraph, FrozenDirectedGraph, IndexedDirectedGraph
+)
 
 
 class TestDirectedGraphInitialization:
@@ -956,6 +958,22 @@ class TestStronglyConnectedComponents:
         assert {'D', 'E'} in scc_sets
         assert {'F'} in scc_sets
 
+    def test_scc_topological_order(self):
+        """Test that source components come before the ones they reach."""
+        g = DirectedGraph()
+        # F -> (D <-> E) -> (A -> B -> C -> A), added sink first
+        g.add_edge('A', 'B')
+        g.add_edge('B', 'C')
+        g.add_edge('C', 'A')
+        g.add_edge('D', 'E')
+        g.add_edge('E', 'D')
+        g.add_edge('E', 'A')
+        g.add_edge('F', 'D')
+
+        sccs = [set(scc) for scc in g.strongly_connected_components()]
+
+        assert sccs == [{'F'}, {'D', 'E'}, {'A', 'B', 'C'}]
+
     def test_scc_self_loop(self):
         """Test SCC with a self-loop."""
         g = DirectedGraph()
@@ -971,3 +989,749 @@ class TestStronglyConnectedComponents:
         scc_sets = [set(scc) for scc in sccs]
         assert {'A'} in scc_sets
         assert {'B'} in scc_sets
+
+
+class TestFreeze:
+    """Tests for the freeze() CSR snapshot."""
+
+    def _sample_graph(self):
+        g = DirectedGraph()
+
+        g.add_edge('A', 'B', 2)
+        g.add_edge('A', 'C', 3)
+        g.add_edge('B', 'D', 4)
+        g.add_edge('C', 'D', 5)
+        g.add_vertex('E')
+
+        return g
+
+    def test_freeze_returns_snapshot(self):
+        """Test that freeze() builds CSR arrays in insertion order."""
+        frozen = self._sample_graph().freeze()
+
+        assert isinstance(frozen, FrozenDirectedGraph)
+        assert frozen.get_vertices() == ['A', 'B', 'C', 'D', 'E']
+        assert list(frozen.offsets) == [0, 2, 3, 4, 4, 4]
+        assert list(frozen.targets) == [1, 2, 3, 3]
+        assert list(frozen.weights) == [2, 3, 4, 5]
+        assert repr(frozen) == "FrozenDirectedGraph(vertices=5, edges=4)"
+
+    def test_freeze_empty_graph(self):
+        """Test freezing an empty graph."""
+        frozen = DirectedGraph().freeze()
+
+        assert len(frozen) == 0
+        assert frozen.num_edges() == 0
+        assert frozen.topological_sort() == []
+        assert frozen.strongly_connected_components() == []
+
+    def test_snapshot_is_independent(self):
+        """Test that later edits do not affect the snapshot."""
+        g = self._sample_graph()
+        frozen = g.freeze()
+
+        g.add_edge('D', 'E')
+
+        assert not frozen.has_edge('D', 'E')
+        assert frozen.num_edges() == 4
+
+    def test_queries(self):
+        """Test neighbor, edge and degree queries on the snapshot."""
+        frozen = self._sample_graph().freeze()
+
+        assert frozen.get_neighbors('A') == [('B', 2), ('C', 3)]
+        assert frozen.has_edge('A', 'C')
+        assert not frozen.has_edge('C', 'A')
+        assert not frozen.has_edge('A', 'Z')
+        assert frozen.in_degree('D') == 2
+        assert frozen.out_degree('A') == 2
+        assert 'E' in frozen
+        assert 'Z' not in frozen
+        assert sorted(frozen.get_edges()) == sorted(
+            self._sample_graph().get_edges())
+
+    def test_unknown_vertex_raises(self):
+        """Test that unknown vertices raise ValueError."""
+        frozen = self._sample_graph().freeze()
+
+        with pytest.raises(ValueError, match="not in graph"):
+            frozen.dfs('Z')
+
+        with pytest.raises(ValueError, match="not in graph"):
+            frozen.bfs('Z')
+
+    def test_non_numeric_weights_kept(self):
+        """Test that arbitrary weight objects survive freezing."""
+        g = DirectedGraph()
+        g.add_edge('A', 'B', 'heavy')
+
+        assert g.freeze().get_neighbors('A') == [('B', 'heavy')]
+
+    def test_traversals_match_graph(self):
+        """Test that traversals match the mutable graph's results."""
+        g = DirectedGraph()
+        edges = [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (4, 1), (2, 5),
+                 (5, 6), (6, 5), (7, 0)]
+        for u, v in edges:
+            g.add_edge(u, v)
+
+        frozen = g.freeze()
+
+        for start in g.get_vertices():
+            assert frozen.dfs(start) == g.dfs(start)
+            assert frozen.bfs(start) == g.bfs(start)
+
+        assert frozen.has_cycle() == g.has_cycle()
+        assert sorted(map(sorted, frozen.strongly_connected_components())) == \
+            sorted(map(sorted, g.strongly_connected_components()))
+
+    def test_scc_order_matches_graph(self):
+        """Test that the snapshot returns SCCs in the same (topological) order."""
+        g = DirectedGraph()
+        for u, v in [('A', 'B'), ('B', 'C'), ('C', 'B'), ('C', 'D')]:
+            g.add_edge(u, v)
+
+        sccs = g.freeze().strongly_connected_components()
+
+        assert sccs == g.strongly_connected_components()
+        assert [set(scc) for scc in sccs] == [{'A'}, {'B', 'C'}, {'D'}]
+
+    def test_topological_sort_matches_graph(self):
+        """Test topological sort on the snapshot."""
+        g = DirectedGraph()
+        g.add_edge('A', 'B')
+        g.add_edge('B', 'C')
+        g.add_edge('C', 'D')
+        g.add_edge('A', 'D')
+
+        frozen = g.freeze()
+
+        assert frozen.topological_sort() == g.topological_sort()
+        assert not frozen.has_cycle()
+
+        g.add_edge('D', 'A')
+        frozen = g.freeze()
+
+        assert frozen.topological_sort() is None
+        assert frozen.has_cycle()
+
+    def test_scc_on_long_chain(self):
+        """Test that snapshot algorithms do not recurse on long chains."""
+        g = DirectedGraph()
+        n = 20000
+        for i in range(n - 1):
+            g.add_edge(i, i + 1)
+        g.add_edge(n - 1, 0)
+
+        frozen = g.freeze()
+        sccs = frozen.strongly_connected_components()
+
+        assert len(sccs) == 1
+        assert len(sccs[0]) == n
+        assert frozen.has_cycle()
+
+
+class TestDeepGraphs:
+    """Tests that traversal algorithms do not recurse on long chains."""
+
+    N = 50000
+
+    def _chain(self, n):
+        g = DirectedGraph()
+        for i in range(n - 1):
+            g.add_edge(i, i + 1)
+        return g
+
+    def test_has_cycle_long_chain(self):
+        """Test cycle detection on a chain deeper than the recursion limit."""
+        g = self._chain(self.N)
+
+        assert not g.has_cycle()
+
+        g.add_edge(self.N - 1, 0)
+
+        assert g.has_cycle()
+
+    def test_topological_sort_long_chain(self):
+        """Test topological sort on a chain deeper than the recursion limit."""
+        g = self._chain(self.N)
+
+        assert g.topological_sort() == list(range(self.N))
+
+    def test_scc_long_cycle(self):
+        """Test SCC on a cycle deeper than the recursion limit."""
+        g = self._chain(self.N)
+        g.add_edge(self.N - 1, 0)
+
+        sccs = g.strongly_connected_components()
+
+        assert len(sccs) == 1
+        assert len(sccs[0]) == self.N
+
+
+class TestIndexedDirectedGraph:
+    """Tests for the indexed adjacency mode."""
+
+    def test_edge_operations(self):
+        """Test O(1) edge insertion, lookup and weight updates."""
+        g = IndexedDirectedGraph()
+
+        assert g.add_edge('A', 'B', 2)
+        assert not g.add_edge('A', 'B', 5)
+        assert g.add_edge('A', 'C', 3)
+
+        assert g.has_edge('A', 'B')
+        assert not g.has_edge('B', 'A')
+        assert not g.has_edge('Z', 'A')
+        assert g.get_edge_weight('A', 'B') == 2
+        assert g.get_edge_weight('A', 'Z') is None
+        assert g.update_edge_weight('A', 'B', 7)
+        assert not g.update_edge_weight('B', 'A', 7)
+        assert g.get_edge_weight('A', 'B') == 7
+        assert repr(g) == "IndexedDirectedGraph(vertices=3, edges=2)"
+
+    def test_remove_edge_keeps_index_consistent(self):
+        """Test that swap-removal keeps the position index valid."""
+        g = IndexedDirectedGraph()
+
+        for target in 'BCDE':
+            g.add_edge('A', target, ord(target))
+
+        assert g.remove_edge('A', 'B')
+        assert not g.remove_edge('A', 'B')
+
+        assert sorted(g.get_neighbors('A')) == [
+            ('C', ord('C')), ('D', ord('D')), ('E', ord('E'))]
+        for target in 'CDE':
+            assert g.get_edge_weight('A', target) == ord(target)
+        assert g.in_degree('B') == 0
+
+    def test_predecessors(self):
+        """Test the maintained reverse index."""
+        g = IndexedDirectedGraph()
+
+        g.add_edge('A', 'C')
+        g.add_edge('B', 'C')
+
+        assert sorted(g.get_predecessors('C')) == ['A', 'B']
+        assert g.get_predecessors('A') == []
+
+        with pytest.raises(ValueError):
+            g.get_predecessors('Z')
+
+    def test_remove_vertex(self):
+        """Test that vertex removal only drops incident edges."""
+        g = IndexedDirectedGraph()
+
+        g.add_edge('A', 'B')
+        g.add_edge('B', 'C')
+        g.add_edge('C', 'B')
+        g.add_edge('B', 'B')
+        g.add_edge('A', 'C')
+
+        assert g.remove_vertex('B')
+        assert not g.remove_vertex('B')
+
+        assert set(g.get_vertices()) == {'A', 'C'}
+        assert g.get_edges() == [('A', 'C', 1)]
+        assert g.in_degree('C') == 1
+        assert g.get_predecessors('C') == ['A']
+        assert g.out_degree('C') == 0
+
+    def test_matches_directed_graph(self):
+        """Test that random edits leave the same edge set as DirectedGraph."""
+        import random
+
+        rng = random.Random(7)
+        plain = DirectedGraph()
+        indexed = IndexedDirectedGraph()
+
+        for _ in range(2000):
+            u, v = rng.randrange(30), rng.randrange(30)
+            op = rng.random()
+            if op < 0.6:
+                assert plain.add_edge(u, v, u * v) == indexed.add_edge(u, v, u * v)
+            elif op < 0.9:
+                assert plain.remove_edge(u, v) == indexed.remove_edge(u, v)
+            else:
+                assert plain.remove_vertex(u) == indexed.remove_vertex(u)
+
+        assert sorted(plain.get_edges()) == sorted(indexed.get_edges())
+        for vertex in plain.get_vertices():
+            assert plain.in_degree(vertex) == indexed.in_degree(vertex)
+            assert sorted(indexed.get_predecessors(vertex)) == sorted(
+                u for u, v, _ in plain.get_edges() if v == vertex)
+
+    def test_copy_and_clear(self):
+        """Test that copies are independent and clear resets indexes."""
+        g = IndexedDirectedGraph()
+        g.add_edge('A', 'B')
+
+        copied = g.copy()
+        copied.add_edge('B', 'A')
+
+        assert isinstance(copied, IndexedDirectedGraph)
+        assert not g.has_edge('B', 'A')
+
+        g.clear()
+
+        assert g.is_empty()
+        assert not g.has_edge('A', 'B')
+        g.add_edge('A', 'B')
+        assert g.get_predecessors('B') == ['A']
+
+    def test_traversals_inherited(self):
+        """Test that traversals and freezing work on the indexed graph."""
+        g = IndexedDirectedGraph()
+        g.add_edge('A', 'B')
+        g.add_edge('B', 'C')
+
+        assert g.dfs('A') == ['A', 'B', 'C']
+        assert g.topological_sort() == ['A', 'B', 'C']
+        assert g.freeze().bfs('A') == ['A', 'B', 'C']
+
+
+class TestBulkIngestion:
+    """Tests for add_edges_from() and the from_* constructors."""
+
+    def test_add_edges_from_dedupes(self):
+        """Test that duplicates in the batch and graph are skipped."""
+        g = DirectedGraph()
+        g.add_edge('A', 'B', 9)
+
+        added = g.add_edges_from([('A', 'B'), ('A', 'C', 2), ('A', 'C', 3),
+                                  ('C', 'A'), ('D', 'D')])
+
+        assert added == 3
+        assert g.get_edge_weight('A', 'B') == 9
+        assert g.get_edge_weight('A', 'C') == 2
+        assert g.in_degree('A') == 1
+        assert g.in_degree('C') == 1
+        assert g.in_degree('D') == 1
+        assert len(g.get_edges()) == 4
+
+    def test_from_edge_list_generator(self):
+        """Test building from a generator matches per-edge insertion."""
+        expected = DirectedGraph()
+        for i in range(100):
+            expected.add_edge(i % 10, (i * 7) % 13, i)
+
+        g = DirectedGraph.from_edge_list(
+            (i % 10, (i * 7) % 13, i) for i in range(100))
+
+        assert g.get_edges() == expected.get_edges()
+        assert set(g.get_vertices()) == set(expected.get_vertices())
+        for vertex in g.get_vertices():
+            assert g.in_degree(vertex) == expected.in_degree(vertex)
+
+    def test_from_edge_list_indexed(self):
+        """Test that the indexed subclass keeps its indexes when bulk loading."""
+        g = IndexedDirectedGraph.from_edge_list([('A', 'B'), ('A', 'B'), ('B', 'C')])
+
+        assert isinstance(g, IndexedDirectedGraph)
+        assert len(g.get_edges()) == 2
+        assert g.get_predecessors('C') == ['B']
+
+    def test_from_csv(self, tmp_path):
+        """Test streaming edges from a CSV file."""
+        path = tmp_path / "edges.csv"
+        path.write_text("src,dst,w\n1,2,0.5\n2,3,1.5\n\n1,2,9\n3,1\n")
+
+        g = DirectedGraph.from_csv(str(path), has_header=True, vertex_type=int)
+
+        assert sorted(g.get_edges()) == [(1, 2, 0.5), (2, 3, 1.5), (3, 1, 1)]
+
+    @pytest.mark.parametrize("bad_row", ["3", "3,1,2.0,extra"])
+    def test_from_csv_rejects_malformed_rows(self, tmp_path, bad_row):
+        """Test that rows with too few or too many columns raise ValueError."""
+        path = tmp_path / "edges.csv"
+        path.write_text(f"1,2,0.5\n\n{bad_row}\n")
+
+        with pytest.raises(ValueError, match="line 3: expected 2 or 3 columns") as info:
+            DirectedGraph.from_csv(str(path), vertex_type=int)
+
+        assert repr(bad_row.split(',')) in str(info.value)
+
+    def test_from_binary(self, tmp_path):
+        """Test streaming edges from a binary edge file."""
+        import struct
+
+        path = tmp_path / "edges.bin"
+        record = struct.Struct('<qqd')
+        path.write_bytes(b''.join(record.pack(u, v, w) for u, v, w in
+                                  [(0, 1, 1.0), (1, 2, 2.5), (0, 1, 3.0)]))
+
+        g = DirectedGraph.from_binary(str(path))
+
+        assert g.get_edges() == [(0, 1, 1.0), (1, 2, 2.5)]
+
+    def test_from_binary_truncated(self, tmp_path):
+        """Test that a truncated binary file raises ValueError."""
+        path = tmp_path / "edges.bin"
+        path.write_bytes(b'\x00' * 30)
+
+        with pytest.raises(ValueError, match="Truncated"):
+            DirectedGraph.from_binary(str(path))
+
+
+class TestDynamicTopologicalGraph:
+    """Tests for the incrementally maintained topological order."""
+
+    def assert_valid_order(self, g):
+        order = g.topological_sort()
+        position = {vertex: i for i, vertex in enumerate(order)}
+
+        assert sorted(order, key=str) == sorted(g.get_vertices(), key=str)
+        for u, v, _ in g.get_edges():
+            assert position[u] < position[v]
+
+    def test_order_updates_on_back_edge(self):
+        """Test that an edge against the current order reorders vertices."""
+        g = DynamicTopologicalGraph()
+
+        g.add_vertex('C')
+        g.add_vertex('B')
+        g.add_vertex('A')
+        g.add_edge('A', 'B')
+        g.add_edge('B', 'C')
+
+        assert g.topological_sort() == ['A', 'B', 'C']
+        assert g.comes_before('A', 'C')
+        assert not g.comes_before('C', 'A')
+
+    def test_cycle_edge_rejected(self):
+        """Test that cycle-creating edges raise and leave the graph unchanged."""
+        g = DynamicTopologicalGraph()
+
+        g.add_edge('A', 'B')
+        g.add_edge('B', 'C')
+
+        with pytest.raises(ValueError, match="cycle"):
+            g.add_edge('C', 'A')
+
+        with pytest.raises(ValueError, match="cycle"):
+            g.add_edge('B', 'B')
+
+        assert not g.has_edge('C', 'A')
+        assert not g.has_cycle()
+        assert g.topological_sort() == ['A', 'B', 'C']
+
+    def test_duplicate_edge(self):
+        """Test that duplicate edges are ignored."""
+        g = DynamicTopologicalGraph()
+
+        assert g.add_edge('A', 'B')
+        assert not g.add_edge('A', 'B')
+
+    def test_remove_vertex_and_compaction(self):
+        """Test that removed vertices leave the order and slots are compacted."""
+        g = DynamicTopologicalGraph()
+
+        for i in range(10):
+            g.add_edge(i, i + 1)
+        for i in range(0, 10, 2):
+            g.remove_vertex(i)
+        g.remove_vertex(1)
+
+        assert g.topological_sort() == [3, 5, 7, 9, 10]
+        assert len(g.order) == len(g.position)
+        g.add_edge(10, 3)
+        self.assert_valid_order(g)
+
+    def test_unknown_vertex(self):
+        """Test that comes_before rejects unknown vertices."""
+        g = DynamicTopologicalGraph()
+        g.add_vertex('A')
+
+        with pytest.raises(ValueError, match="Z"):
+            g.comes_before('A', 'Z')
+
+    def test_random_dag_matches_static_check(self):
+        """Test the maintained order against random edge insertions."""
+        import random
+
+        rng = random.Random(5)
+        g = DynamicTopologicalGraph()
+        reference = DirectedGraph()
+
+        for v in range(40):
+            g.add_vertex(v)
+            reference.add_vertex(v)
+
+        for _ in range(400):
+            u, v = rng.randrange(40), rng.randrange(40)
+            reference.add_edge(u, v)
+            creates_cycle = reference.has_cycle()
+
+            if creates_cycle:
+                reference.remove_edge(u, v)
+                with pytest.raises(ValueError):
+                    g.add_edge(u, v)
+            else:
+                g.add_edge(u, v)
+
+        assert sorted(g.get_edges()) == sorted(reference.get_edges())
+        self.assert_valid_order(g)
+
+
+class TestLazyTraversals:
+    """Tests for the iter_dfs() and iter_bfs() generators."""
+
+    def _tree(self):
+        g = DirectedGraph()
+
+        g.add_edge('A', 'B', 1)
+        g.add_edge('A', 'C', 5)
+        g.add_edge('B', 'D', 1)
+        g.add_edge('C', 'E', 1)
+        g.add_edge('D', 'F', 1)
+        g.add_edge('E', 'A', 1)
+
+        return g
+
+    def test_matches_eager_traversals(self):
+        """Test that full iteration matches dfs() and bfs()."""
+        g = self._tree()
+
+        for start in g.get_vertices():
+            assert list(g.iter_dfs(start)) == g.dfs(start)
+            assert list(g.iter_bfs(start)) == g.bfs(start)
+
+    def test_detailed_tuples(self):
+        """Test (vertex, depth, parent) output."""
+        g = self._tree()
+
+        assert list(g.iter_bfs('A', detailed=True)) == [
+            ('A', 0, None), ('B', 1, 'A'), ('C', 1, 'A'),
+            ('D', 2, 'B'), ('E', 2, 'C'), ('F', 3, 'D')]
+        assert list(g.iter_dfs('A', detailed=True))[:3] == [
+            ('A', 0, None), ('B', 1, 'A'), ('D', 2, 'B')]
+
+    def test_max_depth(self):
+        """Test that max_depth stops expansion."""
+        g = self._tree()
+
+        assert list(g.iter_bfs('A', max_depth=1)) == ['A', 'B', 'C']
+        assert list(g.iter_dfs('A', max_depth=0)) == ['A']
+
+    def test_filters(self):
+        """Test vertex and edge filter predicates."""
+        g = self._tree()
+
+        assert list(g.iter_bfs('A', vertex_filter=lambda v: v != 'B')) == [
+            'A', 'C', 'E']
+        assert list(g.iter_dfs('A', edge_filter=lambda u, v, w: w < 5)) == [
+            'A', 'B', 'D', 'F']
+
+    def test_early_termination(self):
+        """Test that stopping the generator avoids visiting the rest."""
+        g = DirectedGraph()
+        for i in range(1000):
+            g.add_edge(i, i + 1)
+
+        expanded = []
+        traversal = g.iter_dfs(0, vertex_filter=lambda v: expanded.append(v) or True)
+
+        assert next(v for v in traversal if v == 3) == 3
+        assert expanded == [1, 2, 3]
+
+    def test_unknown_start(self):
+        """Test that an unknown start vertex raises ValueError."""
+        g = self._tree()
+
+        with pytest.raises(ValueError):
+            next(g.iter_dfs('Z'))
+
+        with pytest.raises(ValueError):
+            next(g.iter_bfs('Z'))
+
+
+class TestPersistence:
+    """Tests for save()/load() and memory-mapped snapshots."""
+
+    def _graph(self):
+        g = DirectedGraph()
+
+        g.add_edge('A', 'B', 1.5)
+        g.add_edge(('x', 1), 'A', 2)
+        g.add_edge(3, 'B')
+        g.add_vertex(None)
+
+        return g
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_save_and_load(self, tmp_path, use_mmap):
+        """Test a save/load round trip."""
+        g = self._graph()
+        path = str(tmp_path / "graph.bin")
+
+        g.save(path)
+        loaded = DirectedGraph.load(path, mmap=use_mmap)
+
+        assert isinstance(loaded, FrozenDirectedGraph)
+        assert loaded.get_vertices() == g.get_vertices()
+        assert loaded.get_edges() == g.get_edges()
+        assert loaded.in_degree('B') == 2
+        assert loaded.topological_sort() == g.topological_sort()
+        assert loaded.has_edge(('x', 1), 'A')
+
+        thawed = loaded.thaw()
+        assert isinstance(thawed, DirectedGraph)
+        assert thawed.get_edges() == g.get_edges()
+        assert thawed.in_degree('A') == 1
+
+    def test_resave_loaded_snapshot(self, tmp_path):
+        """Test that a memory-mapped snapshot can be saved again unchanged."""
+        first, second = str(tmp_path / "a.bin"), str(tmp_path / "b.bin")
+
+        self._graph().save(first)
+        DirectedGraph.load(first).save(second)
+
+        with open(first, 'rb') as a, open(second, 'rb') as b:
+            assert a.read() == b.read()
+
+    def test_traversal_decodes_only_visited_labels(self, tmp_path):
+        """Test that labels are decoded lazily."""
+        g = DirectedGraph()
+        g.add_edge('start', 'end')
+        for i in range(100):
+            g.add_edge(f"v{i}", f"v{i + 1}")
+
+        path = str(tmp_path / "graph.bin")
+        g.save(path)
+        loaded = DirectedGraph.load(path)
+
+        assert loaded.dfs('start') == ['start', 'end']
+        decoded = [label for label in loaded.vertices._decoded
+                   if isinstance(label, str)]
+        assert decoded == ['start', 'end']
+
+    def test_save_errors(self, tmp_path):
+        """Test that non-numeric weights and foreign files are rejected."""
+        g = DirectedGraph()
+        g.add_edge('A', 'B', 'heavy')
+        path = tmp_path / "graph.bin"
+
+        with pytest.raises(ValueError, match="numeric"):
+            g.save(str(path))
+
+        path.write_bytes(b'\x00' * 8)
+        with pytest.raises(ValueError, match="not a saved directed graph"):
+            DirectedGraph.load(str(path))
+
+
+class TestSnapshots:
+    """Test copy-on-write snapshots."""
+
+    def build(self, cls=DirectedGraph):
+        g = cls()
+        g.add_edge('A', 'B', 1)
+        g.add_edge('B', 'C', 2)
+        g.add_edge('C', 'D', 3)
+        return g
+
+    def test_snapshot_shares_storage(self):
+        """Test that a snapshot copies nothing until written."""
+        g = self.build()
+        snap = g.snapshot()
+
+        assert snap.graph is g.graph
+        assert snap.get_edges() == g.get_edges()
+
+    def test_edits_do_not_leak_into_snapshot(self):
+        """Test that the original can be edited after a snapshot."""
+        g = self.build()
+        snap = g.snapshot()
+
+        g.add_edge('A', 'C')
+        g.update_edge_weight('B', 'C', 20)
+        g.remove_vertex('D')
+
+        assert snap.get_edges() == [('A', 'B', 1), ('B', 'C', 2), ('C', 'D', 3)]
+        assert snap.in_degree('C') == 1
+        assert g.has_edge('A', 'C')
+        assert g.get_edge_weight('B', 'C') == 20
+        assert 'D' not in g
+
+    def test_snapshot_edits_do_not_leak_back(self):
+        """Test that the snapshot itself can be edited independently."""
+        g = self.build()
+        snap = g.snapshot()
+
+        snap.add_edge('D', 'A')
+        snap.remove_edge('A', 'B')
+
+        assert g.get_edges() == [('A', 'B', 1), ('B', 'C', 2), ('C', 'D', 3)]
+        assert g.in_degree('A') == 0
+        assert snap.has_edge('D', 'A')
+        assert not snap.has_edge('A', 'B')
+
+    def test_untouched_lists_stay_shared(self):
+        """Test that only the edited vertex's adjacency list is copied."""
+        g = self.build()
+        snap = g.snapshot()
+
+        g.add_edge('A', 'D')
+
+        assert g.graph is not snap.graph
+        assert g.graph['A'] is not snap.graph['A']
+        assert g.graph['B'] is snap.graph['B']
+        assert g.graph['C'] is snap.graph['C']
+
+    def test_nested_snapshots(self):
+        """Test that snapshots of snapshots stay independent."""
+        g = self.build()
+        first = g.snapshot()
+        g.add_edge('D', 'E')
+        second = g.snapshot()
+        g.add_edge('E', 'F')
+
+        assert len(first.get_edges()) == 3
+        assert len(second.get_edges()) == 4
+        assert len(g.get_edges()) == 5
+
+        third = first.snapshot()
+        third.clear()
+
+        assert third.is_empty()
+        assert len(first.get_edges()) == 3
+
+    def test_bulk_ingestion_after_snapshot(self):
+        """Test add_edges_from on a shared graph."""
+        g = self.build()
+        snap = g.snapshot()
+
+        assert g.add_edges_from([('A', 'C'), ('A', 'B'), ('X', 'A')]) == 2
+        assert len(snap.get_edges()) == 3
+        assert len(g.get_edges()) == 5
+
+    def test_indexed_snapshot(self):
+        """Test that the indexes are copied on write too."""
+        g = self.build(IndexedDirectedGraph)
+        snap = g.snapshot()
+
+        g.remove_edge('A', 'B')
+        g.add_edge('D', 'B')
+        g.remove_vertex('C')
+
+        assert snap.has_edge('A', 'B')
+        assert not snap.has_edge('D', 'B')
+        assert snap.get_predecessors('B') == ['A']
+        assert snap.get_predecessors('D') == ['C']
+        assert g.get_predecessors('B') == ['D']
+        assert snap.in_degree('B') == 1
+        assert g.in_degree('B') == 1
+
+    def test_dynamic_topological_snapshot(self):
+        """Test that the maintained order is copied on write."""
+        g = self.build(DynamicTopologicalGraph)
+        snap = g.snapshot()
+
+        g.add_edge('E', 'A')
+
+        assert snap.topological_sort() == ['A', 'B', 'C', 'D']
+        assert g.topological_sort() == ['E', 'A', 'B', 'C', 'D']
+
+        snap.add_edge('F', 'A')
+        assert snap.topological_sort() == ['F', 'A', 'B', 'C', 'D']
+        assert 'F' not in g
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 from directed_matrix_graph import DirectedMatrixGraph
 
@@ -371,6 +373,192 @@ class TestDegree:
             g.get_in_degree(5)
 
 
+class TestTransitiveClosure:
+    """Tests for bit-parallel transitive closure."""
+
+    def test_chain(self):
+        """Test that a chain reaches everything after it."""
+        g = DirectedMatrixGraph(4)
+        g.add_edge(0, 1)
+        g.add_edge(1, 2)
+        g.add_edge(2, 3)
+
+        assert g.transitive_closure() == [0b1110, 0b1100, 0b1000, 0]
+
+    def test_cycle_reaches_itself(self):
+        """Test that vertices on a cycle reach themselves."""
+        g = DirectedMatrixGraph(3)
+        g.add_edge(0, 1)
+        g.add_edge(1, 0)
+        g.add_edge(1, 2)
+
+        closure = g.transitive_closure()
+
+        assert closure[0] == closure[1] == 0b111
+        assert closure[2] == 0
+
+    def test_matches_search(self):
+        """Test the closure against a DFS from every vertex."""
+        rng = random.Random(7)
+        g = DirectedMatrixGraph(30)
+        for _ in range(45):
+            g.add_edge(rng.randrange(30), rng.randrange(30))
+
+        closure = g.transitive_closure()
+
+        for u in range(30):
+            seen, stack = set(), [v for v, _ in g.get_neighbors(u)]
+            while stack:
+                v = stack.pop()
+                if v not in seen:
+                    seen.add(v)
+                    stack.extend(w for w, _ in g.get_neighbors(v))
+            assert closure[u] == sum(1 << v for v in seen)
+
+
+class TestCountPaths:
+    """Tests for counting walks by matrix exponentiation."""
+
+    def brute_force(self, g, k):
+        """Dynamic programming over path length, one step at a time."""
+        n = g.num_vertices
+        counts = [[int(u == v) for v in range(n)] for u in range(n)]
+        totals = [[0] * n for _ in range(n)]
+        for _ in range(k):
+            counts = [[sum(counts[u][w] for w in range(n) if g.has_edge(w, v))
+                       for v in range(n)] for u in range(n)]
+            totals = [[totals[u][v] + counts[u][v] for v in range(n)] for u in range(n)]
+        return counts, totals
+
+    def test_matches_brute_force(self):
+        """Test exact and cumulative counts for several lengths."""
+        np = pytest.importorskip("numpy")
+        rng = random.Random(3)
+        g = DirectedMatrixGraph(6)
+        for _ in range(14):
+            g.add_edge(rng.randrange(6), rng.randrange(6))
+
+        for k in range(8):
+            exact, cumulative = self.brute_force(g, k)
+            assert np.array_equal(g.count_paths(k), exact)
+            assert np.array_equal(g.count_paths(k, cumulative=True), cumulative)
+
+    def test_zero_length(self):
+        """Test that zero-edge walks are the identity."""
+        np = pytest.importorskip("numpy")
+        g = DirectedMatrixGraph(3)
+        g.add_edge(0, 1)
+
+        assert np.array_equal(g.count_paths(0), np.identity(3))
+        assert not g.count_paths(0, cumulative=True).any()
+
+    def test_complete_graph(self):
+        """Test counts on a complete graph with self-loops: n^(k-1) each."""
+        pytest.importorskip("numpy")
+        g = DirectedMatrixGraph(3)
+        for u in range(3):
+            for v in range(3):
+                g.add_edge(u, v)
+
+        assert (g.count_paths(5) == 3 ** 4).all()
+        assert g.count_paths(5).dtype.name == 'int64'
+
+    def test_object_dtype_is_exact(self):
+        """Test that dtype=object avoids int64 overflow."""
+        pytest.importorskip("numpy")
+        g = DirectedMatrixGraph(2)
+        for u in range(2):
+            for v in range(2):
+                g.add_edge(u, v)
+
+        assert g.count_paths(80, dtype=object)[0, 0] == 2 ** 79
+
+    def test_negative_length(self):
+        """Test that a negative length raises ValueError."""
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="non-negative"):
+            DirectedMatrixGraph(2).count_paths(-1)
+
+
+class TestVertexManagement:
+    """Tests for adding and removing vertices."""
+
+    def test_add_vertex_grows_matrix(self):
+        """Test that a new vertex gets the next id and an empty row/column."""
+        g = DirectedMatrixGraph(2)
+        g.add_edge(0, 1, 4)
+
+        assert g.add_vertex() == 2
+        assert g.num_vertices == 3
+        assert len(g.matrix) == 3
+        assert all(len(row) == 3 for row in g.matrix)
+        assert g.get_weight(0, 1) == 4
+
+        g.add_edge(2, 0, 7)
+        assert g.get_neighbors(2) == [(0, 7)]
+
+    def test_ids_stable_across_growth(self):
+        """Test that growing many times keeps every edge on its ids."""
+        g = DirectedMatrixGraph(1)
+        for _ in range(50):
+            v = g.add_vertex()
+            g.add_edge(v - 1, v, v)
+
+        assert g.num_vertices == 51
+        assert all(g.get_weight(v - 1, v) == v for v in range(1, 51))
+        assert g.get_in_degree(0) == 0
+
+    def test_remove_vertex_clears_edges(self):
+        """Test that removing a vertex drops its incoming and outgoing edges."""
+        g = DirectedMatrixGraph(3)
+        g.add_edge(0, 1)
+        g.add_edge(1, 2)
+        g.add_edge(2, 1)
+
+        assert g.remove_vertex(1)
+        assert not g.remove_vertex(1)
+        assert g.get_out_degree(0) == 0
+        assert g.get_in_degree(2) == 0
+        assert g.get_vertices() == [0, 2]
+        assert not g.has_vertex(1)
+
+    def test_removed_vertex_rejected(self):
+        """Test that a removed id can't be used until it is reused."""
+        g = DirectedMatrixGraph(3)
+        g.remove_vertex(2)
+
+        with pytest.raises(IndexError, match="removed"):
+            g.add_edge(0, 2)
+        with pytest.raises(IndexError):
+            g.remove_vertex(3)
+
+    def test_free_slots_reused_lowest_first(self):
+        """Test that add_vertex reuses removed ids before growing."""
+        g = DirectedMatrixGraph(4)
+        g.remove_vertex(3)
+        g.remove_vertex(1)
+
+        assert g.add_vertex() == 1
+        assert g.add_vertex() == 3
+        assert g.add_vertex() == 4
+        assert g.get_neighbors(1) == []
+        assert g.get_vertices() == [0, 1, 2, 3, 4]
+
+    def test_removed_vertex_in_repr_and_matrices(self):
+        """Test that removed ids are not counted and stay all-zero."""
+        g = DirectedMatrixGraph(3)
+        g.add_edge(0, 1)
+        g.add_edge(1, 2)
+        g.add_edge(2, 0)
+        g.remove_vertex(1)
+
+        assert repr(g) == "DirectedMatrixGraph(num_vertices=2)"
+        assert "2 vertices" in str(g)
+        assert g.transitive_closure() == [0, 0, 0b001]
+        assert g.count_paths(0).tolist() == [[1, 0, 0], [0, 0, 0], [0, 0, 1]]
+        assert g.count_paths(2, cumulative=True)[1].tolist() == [0, 0, 0]
+
+
 class TestStringRepresentation:
     """Tests for string representation methods."""
 
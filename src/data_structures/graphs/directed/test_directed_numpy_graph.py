@@ -0,0 +1,150 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from directed_numpy_graph import DirectedNumpyGraph
+
+
+class TestInitialization:
+    """Tests for graph initialization."""
+
+    def test_valid_initialization(self):
+        """Test that the weight matrix and mask start empty."""
+        g = DirectedNumpyGraph(4)
+
+        assert g.num_vertices == 4
+        assert g.weights.shape == g.mask.shape == (4, 4)
+        assert g.weights.dtype == np.float64
+        assert g.mask.dtype == bool
+        assert not g.mask.any()
+        assert g.num_edges() == 0
+
+    def test_invalid_initialization(self):
+        """Test that a non-positive size raises ValueError."""
+        with pytest.raises(ValueError, match="Number of vertices must be positive"):
+            DirectedNumpyGraph(0)
+
+
+class TestEdgeOperations:
+    """Tests for single-edge operations."""
+
+    def test_add_and_query_edge(self):
+        """Test adding edges, including zero and negative weights."""
+        g = DirectedNumpyGraph(3)
+        g.add_edge(0, 1, 2.5)
+        g.add_edge(1, 2, 0)
+        g.add_edge(2, 0, -4)
+
+        assert g.has_edge(0, 1)
+        assert not g.has_edge(1, 0)
+        assert g.get_weight(0, 1) == 2.5
+        assert g.get_weight(1, 2) == 0
+        assert g.get_weight(2, 0) == -4
+        assert g.get_weight(1, 0) is None
+
+    def test_remove_edge(self):
+        """Test removing an edge."""
+        g = DirectedNumpyGraph(2)
+        g.add_edge(0, 1)
+
+        assert g.remove_edge(0, 1)
+        assert not g.remove_edge(0, 1)
+        assert not g.has_edge(0, 1)
+        assert g.get_weight(0, 1) is None
+
+    def test_out_of_bounds(self):
+        """Test that invalid vertices raise IndexError."""
+        g = DirectedNumpyGraph(2)
+
+        with pytest.raises(IndexError, match="out of bounds"):
+            g.add_edge(0, 2)
+
+        with pytest.raises(IndexError, match="out of bounds"):
+            g.get_neighbors(-1)
+
+
+class TestVectorizedQueries:
+    """Tests for neighbors, degrees and edge enumeration."""
+
+    def build(self):
+        g = DirectedNumpyGraph(4)
+        g.add_edge(0, 1, 1)
+        g.add_edge(0, 2, 2)
+        g.add_edge(1, 2, 3)
+        g.add_edge(3, 2, 4)
+        return g
+
+    def test_neighbors(self):
+        """Test that neighbors are plain Python (vertex, weight) tuples."""
+        g = self.build()
+
+        neighbors = g.get_neighbors(0)
+
+        assert neighbors == [(1, 1.0), (2, 2.0)]
+        assert type(neighbors[0][0]) is int
+        assert g.get_neighbors(2) == []
+
+    def test_degrees(self):
+        """Test single and whole-graph degrees."""
+        g = self.build()
+
+        assert g.get_out_degree(0) == 2
+        assert g.get_in_degree(2) == 3
+        assert g.out_degrees().tolist() == [2, 1, 0, 1]
+        assert g.in_degrees().tolist() == [0, 1, 3, 0]
+
+    def test_edges(self):
+        """Test edge enumeration as tuples and arrays."""
+        g = self.build()
+
+        assert g.get_edges() == [(0, 1, 1.0), (0, 2, 2.0), (1, 2, 3.0), (3, 2, 4.0)]
+        us, vs, ws = g.edge_arrays()
+        assert us.tolist() == [0, 0, 1, 3]
+        assert vs.tolist() == [1, 2, 2, 2]
+        assert ws.tolist() == [1.0, 2.0, 3.0, 4.0]
+        assert g.num_edges() == 4
+
+
+class TestBulkAddEdges:
+    """Tests for add_edges()."""
+
+    def test_add_edges(self):
+        """Test adding edges from arrays."""
+        g = DirectedNumpyGraph(4)
+
+        g.add_edges(np.array([0, 1, 2]), np.array([1, 2, 3]), np.array([0.5, 1.5, 2.5]))
+
+        assert g.get_edges() == [(0, 1, 0.5), (1, 2, 1.5), (2, 3, 2.5)]
+
+    def test_default_weights_and_lists(self):
+        """Test that weights default to 1 and lists are accepted."""
+        g = DirectedNumpyGraph(3)
+
+        g.add_edges([0, 0], [1, 2])
+
+        assert g.get_weight(0, 2) == 1.0
+        assert g.get_out_degree(0) == 2
+
+    def test_add_edges_validation(self):
+        """Test that bad indices and shapes are rejected before any write."""
+        g = DirectedNumpyGraph(3)
+
+        with pytest.raises(IndexError, match="Vertex 5 out of bounds"):
+            g.add_edges([0, 1], [2, 5])
+
+        with pytest.raises(ValueError, match="same length"):
+            g.add_edges([0, 1], [2])
+
+        assert g.num_edges() == 0
+
+
+class TestStringRepresentations:
+    """Tests for __str__ and __repr__."""
+
+    def test_str_and_repr(self):
+        g = DirectedNumpyGraph(2)
+
+        assert str(g) == "DirectedNumpyGraph(2 vertices, 0 edges)"
+        g.add_edge(0, 1, 3)
+        assert str(g) == "DirectedNumpyGraph(2 vertices, 1 edges)\n0 --(3.0)--> 1"
+        assert repr(g) == "DirectedNumpyGraph(num_vertices=2)"
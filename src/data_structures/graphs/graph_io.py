@@ -0,0 +1,336 @@
+from __future__ import annotations
+import ast
+import csv
+import mmap as mmap_module
+import struct
+from array import array
+from typing import (
+    Any, Callable, Dict, Generic, Hashable, Iterator, List, Optional, Sequence,
+    Tuple, TypeVar
+)
+
+V = TypeVar('V', bound=Hashable)
+W = TypeVar('W', bound=Any)
+
+# Binary edge file record: int64 endpoint, int64 endpoint, float64 weight
+EDGE_RECORD = struct.Struct('<qqd')
+
+# Saved snapshot layout, all sections little endian and 8-byte aligned:
+#   header: magic, vertex count, adjacency entry count, label blob size,
+#           weight typecode
+#   offsets (V + 1 int64), targets (one int64 per adjacency entry: E for a
+#   directed graph, 2E for an undirected one), weights (int64 or float64,
+#   one per adjacency entry), label offsets (V + 1 int64), label blob
+#   (repr() of each label, UTF-8)
+GRAPH_HEADER = struct.Struct('<8sqqq1s7x')
+
+
+def iter_csv_edges(path: str, delimiter: str, has_header: bool,
+                   vertex_type: Callable[[str], Any],
+                   weight_type: Callable[[str], Any]) -> Iterator[Tuple]:
+    """
+    Lazily yield (u, v) or (u, v, weight) tuples from a CSV file.
+    Blank lines are skipped.
+
+    Raises:
+        ValueError: If a row does not have two or three columns
+    """
+    with open(path, newline='') as f:
+        reader = csv.reader(f, delimiter=delimiter)
+
+        if has_header:
+            next(reader, None)
+
+        for row in reader:
+            if not row:
+                continue
+            if len(row) not in (2, 3):
+                raise ValueError(f"{path}, line {reader.line_num}: expected 2 or 3 "
+                                 f"columns, got {row!r}")
+            if len(row) == 2:
+                yield vertex_type(row[0]), vertex_type(row[1])
+            else:
+                yield (vertex_type(row[0]), vertex_type(row[1]),
+                       weight_type(row[2]))
+
+
+def iter_binary_edges(path: str, chunk_records: int = 65536) -> Iterator[Tuple[int, int, float]]:
+    """
+    Lazily yield (u, v, weight) tuples from a file of EDGE_RECORDs, reading
+    chunk_records records at a time.
+    """
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(EDGE_RECORD.size * chunk_records)
+            if not chunk:
+                break
+            if len(chunk) % EDGE_RECORD.size:
+                raise ValueError(f"Truncated edge record in {path}")
+
+            yield from EDGE_RECORD.iter_unpack(chunk)
+
+
+def pack_weights(weights: List[W]) -> array | List[W]:
+    """
+    Store weights in a typed array when they are all ints or all numbers,
+    falling back to a plain list for arbitrary weight objects.
+    """
+    if all(type(w) is int for w in weights):
+        try:
+            return array('q', weights)
+        except OverflowError:
+            return weights
+    if all(type(w) in (int, float) for w in weights):
+        return array('d', weights)
+
+    return weights
+
+
+_UNDECODED = object()
+
+
+class LabelTable(Generic[V]):
+    """
+    Read-only sequence of vertex labels stored as repr() strings in a saved
+    snapshot. Each label is decoded on first access.
+    """
+
+    def __init__(self, offsets: memoryview, blob: memoryview) -> None:
+        self._offsets = offsets
+        self._blob = blob
+        self._decoded: List[Any] = [_UNDECODED] * (len(offsets) - 1)
+
+    def __getitem__(self, i: int) -> V:
+        label = self._decoded[i]
+
+        if label is _UNDECODED:
+            raw = self._blob[self._offsets[i]:self._offsets[i + 1]]
+            label = self._decoded[i] = ast.literal_eval(str(raw, 'utf-8'))
+
+        return label
+
+    def __len__(self) -> int:
+        return len(self._decoded)
+
+    def __iter__(self) -> Iterator[V]:
+        return (self[i] for i in range(len(self._decoded)))
+
+
+def encode_label(label: Any) -> bytes:
+    """
+    Encode a vertex label as its repr(), checking that it reads back equal.
+    """
+    text = repr(label)
+
+    try:
+        if ast.literal_eval(text) == label:
+            return text.encode('utf-8')
+    except (ValueError, SyntaxError):
+        pass
+
+    raise ValueError(f"Vertex {text} cannot be saved: labels must be Python literals")
+
+
+class FrozenGraph(Generic[V, W]):
+    """
+    Storage shared by the frozen graph snapshots: compressed sparse row
+    (CSR) arrays over dense vertex ids 0..V-1, where the adjacency entries
+    of vertex i live in targets[offsets[i]:offsets[i + 1]], plus a lazily
+    built label -> id index and the binary file format. Subclasses set
+    MAGIC (the file signature) and KIND (used in error messages).
+    """
+
+    MAGIC: bytes = b''
+    KIND: str = 'graph'
+
+    def __init__(self, vertices: Sequence[V], offsets: Sequence[int],
+                 targets: Sequence[int], weights: Sequence[W],
+                 index: Optional[Dict[V, int]] = None) -> None:
+        """
+        Initialize a snapshot from prebuilt CSR arrays. Without an index the
+        label -> id map is filled in lazily, so labels are only decoded when
+        a lookup needs them.
+
+        Time Complexity: O(1)
+        """
+        self.vertices: Sequence[V] = vertices
+        self.offsets: Sequence[int] = offsets
+        self.targets: Sequence[int] = targets
+        self.weights: Sequence[W] = weights
+
+        self._index: Dict[V, int] = index if index is not None else {}
+        # Labels [0, _indexed) are already in _index
+        self._indexed: int = len(vertices) if index is not None else 0
+
+    @classmethod
+    def from_graph(cls, graph: Any) -> 'FrozenGraph[V, W]':
+        """
+        Build a snapshot from the adjacency lists (graph.graph) of a
+        DirectedGraph or UndirectedGraph.
+
+        Time Complexity: O(V + E)
+        """
+        vertices = list(graph.graph.keys())
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+        offsets = array('q', [0])
+        targets = array('q')
+        weights: List[W] = []
+
+        for vertex in vertices:
+            edges = graph.graph[vertex]
+            targets.extend([index[neighbor] for neighbor, _ in edges])
+            weights.extend([weight for _, weight in edges])
+            offsets.append(len(targets))
+
+        return cls(vertices, offsets, targets, pack_weights(weights), index)
+
+    def save(self, path: str) -> None:
+        """
+        Write the snapshot to path in the binary format read by load().
+
+        Time Complexity: O(V + E)
+
+        Raises:
+            ValueError: If weights are not all numbers or a vertex label is
+            not a Python literal
+        """
+        weights = self.weights
+        if isinstance(weights, list):
+            weights = pack_weights(weights)
+            if isinstance(weights, list):
+                raise ValueError("Only numeric edge weights can be saved")
+
+        typecode = weights.typecode if isinstance(weights, array) else weights.format
+        labels = [encode_label(vertex) for vertex in self.vertices]
+        label_offsets = array('q', [0])
+        for label in labels:
+            label_offsets.append(label_offsets[-1] + len(label))
+
+        with open(path, 'wb') as f:
+            f.write(GRAPH_HEADER.pack(self.MAGIC, len(self.vertices),
+                                      len(self.targets), label_offsets[-1],
+                                      typecode.encode()))
+            # Arrays and memoryviews are written as their raw bytes
+            f.write(self.offsets)
+            f.write(self.targets)
+            f.write(weights)
+            f.write(label_offsets)
+            f.writelines(labels)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'FrozenGraph':
+        """
+        Load a snapshot written by save(). With mmap=True the file is memory
+        mapped and the CSR arrays are zero-copy views into it; otherwise it
+        is read into memory once. Labels are decoded lazily either way, so
+        traversals can start before every label has been decoded.
+
+        Time Complexity: O(1) with mmap, O(file size) without
+
+        Raises:
+            ValueError: If the file is not a saved graph of this kind
+        """
+        with open(path, 'rb') as f:
+            if mmap:
+                buffer = mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_READ)
+            else:
+                buffer = f.read()
+
+        view = memoryview(buffer)
+        if len(view) < GRAPH_HEADER.size:
+            raise ValueError(f"{path} is not a saved {cls.KIND}")
+
+        magic, n, m, blob_size, typecode = GRAPH_HEADER.unpack_from(view)
+        if magic != cls.MAGIC:
+            raise ValueError(f"{path} is not a saved {cls.KIND}")
+
+        sections = []
+        position = GRAPH_HEADER.size
+        for length, code in ((n + 1, 'q'), (m, 'q'), (m, typecode.decode()),
+                             (n + 1, 'q')):
+            end = position + 8 * length
+            sections.append(view[position:end].cast(code))
+            position = end
+
+        offsets, targets, weights, label_offsets = sections
+        labels = LabelTable(label_offsets, view[position:position + blob_size])
+
+        return cls(labels, offsets, targets, weights)
+
+    @property
+    def index(self) -> Dict[V, int]:
+        """
+        The complete label -> id map, decoding any labels not yet indexed.
+
+        Time Complexity: O(V) the first time, O(1) afterwards
+        """
+        while self._indexed < len(self.vertices):
+            self._index[self.vertices[self._indexed]] = self._indexed
+            self._indexed += 1
+
+        return self._index
+
+    def _find(self, vertex: V) -> int | None:
+        """
+        Look up a vertex id, decoding further labels only until it is found.
+
+        Time Complexity: O(1) once indexed, O(V) worst case before that
+        """
+        i = self._index.get(vertex)
+
+        while i is None and self._indexed < len(self.vertices):
+            label = self.vertices[self._indexed]
+            self._index[label] = self._indexed
+            self._indexed += 1
+            if label == vertex:
+                i = self._indexed - 1
+
+        return i
+
+    def vertex_id(self, vertex: V) -> int:
+        """
+        Get the dense integer id of a vertex.
+
+        Time Complexity: O(1) once indexed
+
+        Raises:
+            ValueError: If vertex not in graph
+        """
+        i = self._find(vertex)
+
+        if i is None:
+            raise ValueError(f"Vertex {vertex} not in graph")
+
+        return i
+
+    def get_vertices(self) -> List[V]:
+        """
+        Get all vertices in the graph, ordered by id.
+
+        Time Complexity: O(V)
+        """
+        return list(self.vertices)
+
+    def num_vertices(self) -> int:
+        """
+        Get the number of vertices.
+
+        Time Complexity: O(1)
+        """
+        return len(self.vertices)
+
+    def __contains__(self, vertex: V) -> bool:
+        """
+        Check if a vertex is in the snapshot.
+
+        Time Complexity: O(1) once indexed
+        """
+        return self._find(vertex) is not None
+
+    def __len__(self) -> int:
+        """
+        Return the number of vertices.
+
+        Time Complexity: O(1)
+        """
+        return len(self.vertices)
@@ -0,0 +1,550 @@
+from __future__ import annotations
+import sys
+from array import array
+from collections import deque
+from typing import Any, Deque, Dict, Generic, Hashable, Iterable, List, Tuple, TypeVar
+
+V = TypeVar('V', bound=Hashable)
+
+# Marks a free vertex slot in labels
+_FREE = object()
+
+
+class CompactUndirectedGraph(Generic[V]):
+    """
+    An undirected weighted graph that stores every edge exactly once.
+
+    Edge e connects ends[2e] and ends[2e + 1] (dense vertex ids) and has
+    weight weights[e], kept in a typed array. Each vertex has an incidence
+    array of the ids of its edges. Compared to UndirectedGraph, which keeps
+    a (neighbor, weight) tuple at both endpoints, an edge costs about 40
+    bytes instead of well over 100, updating a weight touches one slot and
+    get_edges() needs no deduplication.
+
+    Weights must be numbers that fit the array typecode ('d' by default;
+    use 'f' to halve weight storage or 'q' for integers). Self-loops and
+    duplicate edges are rejected, as in UndirectedGraph.
+    """
+
+    directed = False
+
+    def __init__(self, typecode: str = 'd') -> None:
+        """
+        Initialize an empty graph whose weights use the given array typecode.
+
+        Time Complexity: O(1)
+        """
+        # Vertex label <-> dense id; freed ids are reused
+        self.index: Dict[V, int] = {}
+        self.labels: List[Any] = []
+        self._free_vertices: List[int] = []
+        # incidence[i] holds the ids of the edges at vertex id i
+        self.incidence: List[array] = []
+
+        # Edge store; freed edge ids have ends (-1, -1) and are reused
+        self.ends = array('q')
+        self.weights = array(typecode)
+        self._free_edges = array('q')
+
+    def add_vertex(self, vertex: V) -> None:
+        """
+        Add a vertex to the graph if it doesn't exist.
+
+        Time Complexity: O(1)
+        """
+        if vertex in self.index:
+            return
+
+        if self._free_vertices:
+            i = self._free_vertices.pop()
+            self.labels[i] = vertex
+        else:
+            i = len(self.labels)
+            self.labels.append(vertex)
+            self.incidence.append(array('q'))
+
+        self.index[vertex] = i
+
+    def _other(self, edge: int, i: int) -> int:
+        """
+        The endpoint of edge other than vertex id i.
+        """
+        a = self.ends[2 * edge]
+        return self.ends[2 * edge + 1] if a == i else a
+
+    def _find_edge(self, i: int, j: int) -> int | None:
+        """
+        Id of the edge between vertex ids i and j, scanning the smaller of
+        the two incidence arrays.
+
+        Time Complexity: O(min(deg(i), deg(j)))
+        """
+        if len(self.incidence[j]) < len(self.incidence[i]):
+            i, j = j, i
+
+        for edge in self.incidence[i]:
+            if self._other(edge, i) == j:
+                return edge
+
+        return None
+
+    def _link(self, i: int, j: int, weight: float) -> None:
+        """
+        Store a new edge between vertex ids i and j. The weight is written
+        first, so a weight that doesn't fit the typecode raises before the
+        ends or incidence arrays change.
+
+        Time Complexity: O(1) amortized
+        """
+        if self._free_edges:
+            edge = self._free_edges.pop()
+            try:
+                self.weights[edge] = weight
+            except (TypeError, OverflowError):
+                self._free_edges.append(edge)
+                raise
+            self.ends[2 * edge] = i
+            self.ends[2 * edge + 1] = j
+        else:
+            edge = len(self.weights)
+            self.weights.append(weight)
+            self.ends.append(i)
+            self.ends.append(j)
+
+        self.incidence[i].append(edge)
+        self.incidence[j].append(edge)
+
+    def _unlink(self, edge: int) -> None:
+        """
+        Free an edge id and drop it from both incidence arrays (by moving
+        the last entry into its slot).
+
+        Time Complexity: O(deg) of the two endpoints
+        """
+        for i in (self.ends[2 * edge], self.ends[2 * edge + 1]):
+            edges = self.incidence[i]
+            k = edges.index(edge)
+            last = edges.pop()
+            if k < len(edges):
+                edges[k] = last
+
+        self.ends[2 * edge] = self.ends[2 * edge + 1] = -1
+        self._free_edges.append(edge)
+
+    def add_edge(self, vertex1: V, vertex2: V, weight: float = 1) -> bool:
+        """
+        Add an undirected edge between vertex1 and vertex2.
+        Prevents duplicate edges and self-loops.
+
+        Time Complexity: O(min(deg(v1), deg(v2)))
+
+        Raises:
+            TypeError: If weight does not fit the weight array typecode
+        """
+        if vertex1 == vertex2:
+            return False
+
+        self.add_vertex(vertex1)
+        self.add_vertex(vertex2)
+        i, j = self.index[vertex1], self.index[vertex2]
+
+        if self._find_edge(i, j) is not None:
+            return False
+
+        self._link(i, j, weight)
+        return True
+
+    def add_edges_from(self, edges: Iterable[Tuple]) -> int:
+        """
+        Add many (vertex1, vertex2) or (vertex1, vertex2, weight) edges in one
+        pass. Self-loops and duplicates are skipped using a per-vertex set
+        of neighbor ids instead of a scan per edge.
+
+        Time Complexity: O(k + sum of existing degrees of touched vertices)
+        where k is the number of edges given
+
+        Returns:
+            int: Number of edges actually added
+        """
+        known: Dict[int, set] = {}
+        added = 0
+
+        for vertex1, vertex2, *rest in edges:
+            if vertex1 == vertex2:
+                continue
+
+            self.add_vertex(vertex1)
+            self.add_vertex(vertex2)
+            i, j = self.index[vertex1], self.index[vertex2]
+
+            neighbors = known.get(i)
+            if neighbors is None:
+                neighbors = known[i] = {
+                    self._other(edge, i) for edge in self.incidence[i]}
+
+            if j in neighbors:
+                continue
+
+            self._link(i, j, rest[0] if rest else 1)
+            neighbors.add(j)
+
+            # A set built later is derived from the arrays, which are up to date
+            if j in known:
+                known[j].add(i)
+
+            added += 1
+
+        return added
+
+    @classmethod
+    def from_edge_list(cls, edges: Iterable[Tuple],
+                       typecode: str = 'd') -> 'CompactUndirectedGraph':
+        """
+        Build a graph from an iterable of (vertex1, vertex2) or
+        (vertex1, vertex2, weight) tuples.
+
+        Time Complexity: O(k) where k is the number of edges given
+        """
+        graph = cls(typecode)
+        graph.add_edges_from(edges)
+
+        return graph
+
+    @classmethod
+    def from_graph(cls, graph: Any, typecode: str = 'd') -> 'CompactUndirectedGraph':
+        """
+        Convert an UndirectedGraph (or anything with get_vertices() and
+        get_edges()), keeping isolated vertices and vertex order.
+
+        Time Complexity: O(V + E)
+        """
+        compact = cls(typecode)
+
+        for vertex in graph.get_vertices():
+            compact.add_vertex(vertex)
+        for vertex1, vertex2, weight in graph.get_edges():
+            compact._link(compact.index[vertex1], compact.index[vertex2], weight)
+
+        return compact
+
+    def remove_vertex(self, vertex: V) -> bool:
+        """
+        Remove a vertex and all edges connected to it.
+
+        Time Complexity: O(sum of degrees of the vertex and its neighbors)
+
+        Returns:
+            bool: True if vertex was removed, False if it didn't exist
+        """
+        i = self.index.pop(vertex, None)
+        if i is None:
+            return False
+
+        while self.incidence[i]:
+            self._unlink(self.incidence[i][-1])
+
+        self.labels[i] = _FREE
+        self._free_vertices.append(i)
+
+        return True
+
+    def remove_edge(self, vertex1: V, vertex2: V) -> bool:
+        """
+        Remove the undirected edge between vertex1 and vertex2.
+
+        Time Complexity: O(deg(v1) + deg(v2))
+
+        Returns:
+            bool: True if edge was removed, False if it didn't exist
+        """
+        edge = self._edge_id(vertex1, vertex2)
+        if edge is None:
+            return False
+
+        self._unlink(edge)
+        return True
+
+    def _edge_id(self, vertex1: V, vertex2: V) -> int | None:
+        """
+        Id of the edge between two vertex labels, or None.
+        """
+        i, j = self.index.get(vertex1), self.index.get(vertex2)
+        if i is None or j is None:
+            return None
+
+        return self._find_edge(i, j)
+
+    def get_neighbors(self, vertex: V) -> List[Tuple[V, float]]:
+        """
+        Get all neighbors of a vertex with their weights.
+
+        Time Complexity: O(deg(v))
+
+        Raises:
+            ValueError: If vertex not in graph
+        """
+        i = self.index.get(vertex)
+        if i is None:
+            raise ValueError(f"Vertex {vertex} not in graph")
+
+        labels, weights = self.labels, self.weights
+        return [(labels[self._other(edge, i)], weights[edge])
+                for edge in self.incidence[i]]
+
+    def get_vertices(self) -> List[V]:
+        """
+        Get all vertices in the graph.
+
+        Time Complexity: O(V)
+        """
+        return list(self.index)
+
+    def get_edges(self) -> List[Tuple[V, V, float]]:
+        """
+        Get all edges as a list of (vertex1, vertex2, weight) tuples, in
+        edge id order. Each edge is stored, and listed, only once.
+
+        Time Complexity: O(E)
+        """
+        labels, ends, weights = self.labels, self.ends, self.weights
+
+        return [(labels[ends[2 * edge]], labels[ends[2 * edge + 1]], weights[edge])
+                for edge in range(len(weights)) if ends[2 * edge] >= 0]
+
+    def has_edge(self, vertex1: V, vertex2: V) -> bool:
+        """
+        Check if there's an edge between vertex1 and vertex2.
+
+        Time Complexity: O(min(deg(v1), deg(v2)))
+        """
+        return self._edge_id(vertex1, vertex2) is not None
+
+    def get_edge_weight(self, vertex1: V, vertex2: V) -> float | None:
+        """
+        Get the weight of the edge between vertex1 and vertex2.
+
+        Time Complexity: O(min(deg(v1), deg(v2)))
+
+        Returns:
+            weight or None: Weight if edge exists, None otherwise
+        """
+        edge = self._edge_id(vertex1, vertex2)
+
+        return None if edge is None else self.weights[edge]
+
+    def update_edge_weight(self, vertex1: V, vertex2: V, new_weight: float) -> bool:
+        """
+        Update the weight of an existing edge (a single array slot).
+
+        Time Complexity: O(min(deg(v1), deg(v2)))
+
+        Returns:
+            bool: True if edge was updated, False if edge doesn't exist
+        """
+        edge = self._edge_id(vertex1, vertex2)
+        if edge is None:
+            return False
+
+        self.weights[edge] = new_weight
+        return True
+
+    def degree(self, vertex: V) -> int:
+        """
+        Calculate the degree of a vertex (number of edges connected to it).
+
+        Time Complexity: O(1)
+
+        Raises:
+            ValueError: If vertex not in graph
+        """
+        i = self.index.get(vertex)
+        if i is None:
+            raise ValueError(f"Vertex {vertex} not in graph")
+
+        return len(self.incidence[i])
+
+    def dfs(self, start_vertex: V) -> List[V]:
+        """
+        Depth-First Search traversal starting from start_vertex (iterative).
+        Returns list of vertices in DFS order.
+
+        Time Complexity: O(V + E)
+
+        Raises:
+            ValueError: If start_vertex not in graph
+        """
+        if start_vertex not in self.index:
+            raise ValueError(f"Vertex {start_vertex} not in graph")
+
+        visited = bytearray(len(self.labels))
+        stack = [self.index[start_vertex]]
+        result = []
+
+        while stack:
+            i = stack.pop()
+            if not visited[i]:
+                visited[i] = 1
+                result.append(self.labels[i])
+
+                # Add neighbors in reverse to maintain left-to-right order
+                for edge in reversed(self.incidence[i]):
+                    j = self._other(edge, i)
+                    if not visited[j]:
+                        stack.append(j)
+
+        return result
+
+    def bfs(self, start_vertex: V) -> List[V]:
+        """
+        Breadth-First Search traversal starting from start_vertex.
+        Returns list of vertices in BFS order.
+
+        Time Complexity: O(V + E)
+
+        Raises:
+            ValueError: If start_vertex not in graph
+        """
+        if start_vertex not in self.index:
+            raise ValueError(f"Vertex {start_vertex} not in graph")
+
+        visited = bytearray(len(self.labels))
+        start = self.index[start_vertex]
+        visited[start] = 1
+        queue: Deque[int] = deque([start])
+        result = []
+
+        while queue:
+            i = queue.popleft()
+            result.append(self.labels[i])
+
+            for edge in self.incidence[i]:
+                j = self._other(edge, i)
+                if not visited[j]:
+                    visited[j] = 1
+                    queue.append(j)
+
+        return result
+
+    def connected_components(self) -> List[List[V]]:
+        """
+        Find all connected components in the graph (iterative, so deep
+        graphs do not hit the recursion limit).
+
+        Time Complexity: O(V + E)
+
+        Returns:
+            List of lists, where each inner list contains vertices in a component
+        """
+        visited = bytearray(len(self.labels))
+        components = []
+
+        for start in self.index.values():
+            if visited[start]:
+                continue
+
+            visited[start] = 1
+            stack = [start]
+            component = []
+
+            while stack:
+                i = stack.pop()
+                component.append(self.labels[i])
+
+                for edge in self.incidence[i]:
+                    j = self._other(edge, i)
+                    if not visited[j]:
+                        visited[j] = 1
+                        stack.append(j)
+
+            components.append(component)
+
+        return components
+
+    def is_connected(self) -> bool:
+        """
+        Check if the graph is connected (all vertices reachable from any vertex).
+
+        Time Complexity: O(V + E)
+        """
+        if not self.index:
+            return True
+
+        return len(self.bfs(next(iter(self.index)))) == len(self.index)
+
+    def num_vertices(self) -> int:
+        """
+        Get the number of vertices.
+
+        Time Complexity: O(1)
+        """
+        return len(self.index)
+
+    def num_edges(self) -> int:
+        """
+        Get the number of edges.
+
+        Time Complexity: O(1)
+        """
+        return len(self.weights) - len(self._free_edges)
+
+    def memory_footprint(self) -> Dict[str, int]:
+        """
+        Approximate bytes used by the edge store, the incidence arrays and
+        the vertex tables (labels themselves not included).
+
+        Time Complexity: O(V)
+        """
+        edges = sys.getsizeof(self.ends) + sys.getsizeof(self.weights)
+        incidence = (sys.getsizeof(self.incidence)
+                     + sum(sys.getsizeof(ids) for ids in self.incidence))
+        vertices = sys.getsizeof(self.index) + sys.getsizeof(self.labels)
+
+        return {'edges': edges, 'incidence': incidence, 'vertices': vertices,
+                'total': edges + incidence + vertices}
+
+    def is_empty(self) -> bool:
+        """
+        Check if the graph has any vertices.
+
+        Time Complexity: O(1)
+        """
+        return not self.index
+
+    def clear(self) -> None:
+        """
+        Remove all vertices and edges from the graph.
+
+        Time Complexity: O(1)
+        """
+        self.index.clear()
+        self.labels.clear()
+        self._free_vertices.clear()
+        self.incidence.clear()
+        self.ends = array('q')
+        self.weights = array(self.weights.typecode)
+        self._free_edges = array('q')
+
+    def __contains__(self, vertex: V) -> bool:
+        """
+        Check if a vertex is in the graph. Allows 'if vertex in graph:'.
+
+        Time Complexity: O(1)
+        """
+        return vertex in self.index
+
+    def __len__(self) -> int:
+        """
+        Return the number of vertices.
+
+        Time Complexity: O(1)
+        """
+        return len(self.index)
+
+    def __repr__(self) -> str:
+        """
+        Unambiguous representation of the graph.
+
+        Time Complexity: O(1)
+        """
+        return (f"CompactUndirectedGraph(vertices={self.num_vertices()}, "
+                f"edges={self.num_edges()})")
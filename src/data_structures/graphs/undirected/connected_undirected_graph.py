@@ -0,0 +1,243 @@
+from __future__ import annotations
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Tuple, TypeVar
+
+from src.data_structures.graphs.undirected.undirected_graph import UndirectedGraph
+from src.data_structures.union_find.union_find import UnionFind
+
+V = TypeVar('V', bound=Hashable)
+W = TypeVar('W', bound=Any)
+
+
+class ConnectedUndirectedGraph(UndirectedGraph[V, W]):
+    """
+    An UndirectedGraph that maintains its connected components online with
+    the project's UnionFind, so connectivity queries do not traverse the
+    graph. Adding vertices and edges keeps the components up to date.
+
+    UnionFind cannot split sets, so removing an edge or vertex only marks
+    the components stale; they are rebuilt once, in O(V + E), by the next
+    query. A graph that only grows never pays for a rebuild.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty graph with no components.
+
+        Time Complexity: O(1)
+        """
+        super().__init__()
+        self._components = UnionFind(0)
+        # ids[v] is the UnionFind element of vertex v
+        self._ids: Dict[V, int] = {}
+        # True once a removal has made the components stale
+        self._stale = False
+
+    def add_vertex(self, vertex: V) -> None:
+        """
+        Add a vertex to the graph, in a component of its own, if it doesn't
+        exist.
+
+        Time Complexity: O(1)
+        """
+        if vertex not in self.graph:
+            super().add_vertex(vertex)
+            if not self._stale:
+                self._ids[vertex] = self._components.add()
+
+    def add_edge(self, vertex1: V, vertex2: V, weight: W = 1) -> bool:
+        """
+        Add an undirected edge between vertex1 and vertex2, merging their
+        components. Prevents duplicate edges and self-loops.
+
+        Time Complexity: O(E_v + α(V)) where E_v is the degree of the vertices
+        """
+        if not super().add_edge(vertex1, vertex2, weight):
+            return False
+
+        if not self._stale:
+            self._components.union(self._ids[vertex1], self._ids[vertex2])
+
+        return True
+
+    def add_edges_from(self, edges: Iterable[Tuple]) -> int:
+        """
+        Add many (vertex1, vertex2) or (vertex1, vertex2, weight) edges in one
+        pass, merging components as the edges stream through.
+
+        Time Complexity: O(k α(V) + sum of existing degrees of touched
+        vertices) where k is the number of edges given
+
+        Returns:
+            int: Number of edges actually added
+        """
+        def merged(edges: Iterable[Tuple]) -> Iterator[Tuple]:
+            for edge in edges:
+                vertex1, vertex2 = edge[0], edge[1]
+
+                if vertex1 != vertex2:
+                    self.add_vertex(vertex1)
+                    self.add_vertex(vertex2)
+                    # Duplicates are skipped by the caller, but their
+                    # endpoints are already in one component anyway
+                    if not self._stale:
+                        self._components.union(
+                            self._ids[vertex1], self._ids[vertex2])
+
+                yield edge
+
+        return super().add_edges_from(merged(edges))
+
+    def remove_vertex(self, vertex: V) -> bool:
+        """
+        Remove a vertex and all edges connected to it. Components are
+        rebuilt lazily by the next connectivity query.
+
+        Time Complexity: O(V + E) where V is vertices and E is edges
+
+        Returns:
+            bool: True if vertex was removed, False if it didn't exist
+        """
+        if not super().remove_vertex(vertex):
+            return False
+
+        self._stale = True
+        return True
+
+    def remove_edge(self, vertex1: V, vertex2: V) -> bool:
+        """
+        Remove the undirected edge between vertex1 and vertex2. Components
+        are rebuilt lazily by the next connectivity query.
+
+        Time Complexity: O(E_v) where E_v is the degree of the vertices
+
+        Returns:
+            bool: True if edge was removed, False if it didn't exist
+        """
+        if not super().remove_edge(vertex1, vertex2):
+            return False
+
+        self._stale = True
+        return True
+
+    def _detach(self) -> None:
+        """
+        Also give this graph its own UnionFind when it is shared with a
+        snapshot, since unions (and rebuilds) change it in place.
+
+        Time Complexity: O(1) when not shared, O(V) otherwise
+        """
+        if self._shared:
+            self._components = self._components.copy()
+            self._ids = dict(self._ids)
+
+        super()._detach()
+
+    def _rebuild(self) -> None:
+        """
+        Recompute the components from scratch if a removal made them stale.
+
+        Time Complexity: O((V + E) α(V)) when stale, O(1) otherwise
+        """
+        if not self._stale:
+            return
+
+        self._detach()
+        self._ids = {vertex: i for i, vertex in enumerate(self.graph)}
+        self._components = UnionFind(len(self._ids))
+
+        for vertex, edges in self.graph.items():
+            for neighbor, _ in edges:
+                self._components.union(self._ids[vertex], self._ids[neighbor])
+
+        self._stale = False
+
+    def component_of(self, vertex: V) -> int:
+        """
+        Get an id for the component containing vertex. Two vertices are
+        connected exactly when their ids are equal; ids are only stable
+        until the graph is next modified.
+
+        Time Complexity: O(α(V)), or one O(V + E) rebuild after a removal
+
+        Raises:
+            ValueError: If vertex not in graph
+        """
+        if vertex not in self.graph:
+            raise ValueError(f"Vertex {vertex} not in graph")
+
+        self._rebuild()
+        return self._components.find(self._ids[vertex])
+
+    def same_component(self, vertex1: V, vertex2: V) -> bool:
+        """
+        Check if there is a path between vertex1 and vertex2.
+
+        Time Complexity: O(α(V)), or one O(V + E) rebuild after a removal
+
+        Raises:
+            ValueError: If either vertex not in graph
+        """
+        return self.component_of(vertex1) == self.component_of(vertex2)
+
+    def num_components(self) -> int:
+        """
+        Get the number of connected components.
+
+        Time Complexity: O(1), or one O(V + E) rebuild after a removal
+        """
+        self._rebuild()
+        return self._components.components
+
+    def is_connected(self) -> bool:
+        """
+        Check if the graph is connected (all vertices reachable from any vertex).
+
+        Time Complexity: O(1), or one O(V + E) rebuild after a removal
+        """
+        return self.num_components() <= 1
+
+    def connected_components(self) -> List[List[V]]:
+        """
+        Find all connected components in the graph, in order of each
+        component's first vertex.
+
+        Time Complexity: O(V α(V)), or one O(V + E) rebuild after a removal
+
+        Returns:
+            List of lists, where each inner list contains vertices in a component
+        """
+        self._rebuild()
+        components: Dict[int, List[V]] = {}
+
+        for vertex in self.graph:
+            root = self._components.find(self._ids[vertex])
+            components.setdefault(root, []).append(vertex)
+
+        return list(components.values())
+
+    def copy(self) -> 'ConnectedUndirectedGraph[V, W]':
+        """
+        Create a deep copy of the graph, including its components.
+
+        Time Complexity: O(V + E)
+        """
+        new_graph = type(self)()
+
+        for vertex, edges in self.graph.items():
+            new_graph.graph[vertex] = list(edges)
+        new_graph._components = self._components.copy()
+        new_graph._ids = dict(self._ids)
+        new_graph._stale = self._stale
+
+        return new_graph
+
+    def clear(self) -> None:
+        """
+        Remove all vertices and edges from the graph.
+
+        Time Complexity: O(1)
+        """
+        super().clear()
+        self._components = UnionFind(0)
+        self._ids = {}
+        self._stale = False
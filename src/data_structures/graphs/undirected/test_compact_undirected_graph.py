@@ -0,0 +1,211 @@
+import sys
+
+import pytest
+from compact_undirected_graph import CompactUndirectedGraph
+from undirected_graph import UndirectedGraph
+
+
+class TestCompactBasics:
+    """Test vertex and edge operations."""
+
+    def test_empty_graph(self):
+        """Test that a new graph is empty."""
+        g = CompactUndirectedGraph()
+
+        assert g.is_empty()
+        assert g.get_vertices() == []
+        assert g.get_edges() == []
+        assert repr(g) == "CompactUndirectedGraph(vertices=0, edges=0)"
+
+    def test_add_edge_stores_one_record(self):
+        """Test that an edge is stored once but visible from both ends."""
+        g = CompactUndirectedGraph()
+
+        assert g.add_edge('A', 'B', 5)
+        assert g.add_edge('B', 'C', 2.5)
+
+        assert len(g.weights) == 2
+        assert g.get_edges() == [('A', 'B', 5.0), ('B', 'C', 2.5)]
+        assert g.get_neighbors('B') == [('A', 5.0), ('C', 2.5)]
+        assert g.has_edge('B', 'A')
+        assert g.get_edge_weight('C', 'B') == 2.5
+        assert g.degree('B') == 2
+
+    def test_rejects_duplicates_and_self_loops(self):
+        """Test that duplicates (either direction) and self-loops are rejected."""
+        g = CompactUndirectedGraph()
+        g.add_edge('A', 'B')
+
+        assert not g.add_edge('B', 'A')
+        assert not g.add_edge('A', 'A')
+        assert g.num_edges() == 1
+        assert 'A' in g
+
+    def test_update_edge_weight_touches_one_slot(self):
+        """Test that weight updates are seen from both endpoints."""
+        g = CompactUndirectedGraph()
+        g.add_edge('A', 'B', 1)
+
+        assert g.update_edge_weight('B', 'A', 9)
+        assert g.get_edge_weight('A', 'B') == 9
+        assert g.get_neighbors('B') == [('A', 9.0)]
+        assert not g.update_edge_weight('A', 'Z', 1)
+
+    def test_remove_edge_reuses_slot(self):
+        """Test that removed edge ids are reused."""
+        g = CompactUndirectedGraph()
+        g.add_edge('A', 'B')
+        g.add_edge('B', 'C')
+
+        assert g.remove_edge('B', 'A')
+        assert not g.remove_edge('A', 'B')
+        assert not g.remove_edge('A', 'Q')
+        assert g.get_edges() == [('B', 'C', 1.0)]
+        assert g.degree('A') == 0
+
+        g.add_edge('C', 'D')
+        assert len(g.weights) == 2
+        assert g.num_edges() == 2
+
+    def test_remove_vertex(self):
+        """Test that removing a vertex removes its edges."""
+        g = CompactUndirectedGraph()
+        g.add_edges_from([('A', 'B'), ('A', 'C'), ('B', 'C'), ('C', 'D')])
+
+        assert g.remove_vertex('C')
+        assert not g.remove_vertex('C')
+
+        assert g.get_vertices() == ['A', 'B', 'D']
+        assert g.get_edges() == [('A', 'B', 1.0)]
+        assert g.degree('D') == 0
+
+        g.add_edge('E', 'D', 3)
+        assert g.get_neighbors('E') == [('D', 3.0)]
+        assert len(g.labels) == 4
+
+    def test_missing_vertex_errors(self):
+        """Test that unknown vertices raise ValueError."""
+        g = CompactUndirectedGraph()
+
+        with pytest.raises(ValueError, match="not in graph"):
+            g.get_neighbors('X')
+
+        with pytest.raises(ValueError, match="not in graph"):
+            g.degree('X')
+
+        with pytest.raises(ValueError, match="not in graph"):
+            g.dfs('X')
+
+        assert g.get_edge_weight('X', 'Y') is None
+        assert not g.has_edge('X', 'Y')
+
+    def test_integer_typecode(self):
+        """Test a graph with integer weights."""
+        g = CompactUndirectedGraph('q')
+        g.add_edge(1, 2, 7)
+
+        assert g.get_edge_weight(1, 2) == 7
+        with pytest.raises(TypeError):
+            g.add_edge(2, 3, 1.5)
+
+    def test_failed_insert_leaves_store_aligned(self):
+        """Test that a rejected weight doesn't shift later edges."""
+        g = CompactUndirectedGraph('q')
+        g.add_edge('a', 'b', 1)
+
+        with pytest.raises(TypeError):
+            g.add_edge('a', 'c', 1.5)
+        g.add_edge('c', 'd', 2)
+
+        assert sorted(g.get_edges()) == [('a', 'b', 1), ('c', 'd', 2)]
+        assert g.get_neighbors('c') == [('d', 2)]
+        assert not g.has_edge('a', 'c')
+
+    def test_failed_insert_into_freed_slot(self):
+        """Test that a rejected weight keeps the freed edge id reusable."""
+        g = CompactUndirectedGraph('q')
+        g.add_edge('a', 'b', 1)
+        g.add_edge('b', 'c', 2)
+        g.remove_edge('a', 'b')
+
+        with pytest.raises(TypeError):
+            g.add_edge('a', 'c', 1.5)
+        g.add_edge('c', 'd', 3)
+
+        assert sorted(g.get_edges()) == [('b', 'c', 2), ('c', 'd', 3)]
+        assert len(g.weights) == 2
+
+    def test_clear(self):
+        """Test that clear() empties the graph but keeps the typecode."""
+        g = CompactUndirectedGraph('f')
+        g.add_edge('A', 'B')
+
+        g.clear()
+
+        assert g.is_empty()
+        assert g.num_edges() == 0
+        assert g.weights.typecode == 'f'
+
+
+class TestCompactAgainstUndirectedGraph:
+    """Test that the compact store behaves like UndirectedGraph."""
+
+    def build_both(self):
+        edges = [('A', 'B', 1), ('A', 'C', 2), ('B', 'D', 3), ('C', 'D', 4),
+                 ('D', 'E', 5), ('F', 'G', 6), ('C', 'A', 7), ('E', 'E', 1)]
+        return (UndirectedGraph.from_edge_list(edges),
+                CompactUndirectedGraph.from_edge_list(edges))
+
+    def test_same_edges(self):
+        """Test that bulk ingestion keeps the same edges."""
+        graph, compact = self.build_both()
+
+        assert compact.get_vertices() == graph.get_vertices()
+        assert compact.get_edges() == graph.get_edges()
+        assert compact.num_edges() == 6
+
+    def test_same_traversals(self):
+        """Test that traversal orders match."""
+        graph, compact = self.build_both()
+
+        assert compact.dfs('A') == graph.dfs('A')
+        assert compact.bfs('A') == graph.bfs('A')
+        assert (sorted(map(sorted, compact.connected_components()))
+                == sorted(map(sorted, graph.connected_components())))
+        assert not compact.is_connected()
+
+        compact.add_edge('E', 'F')
+        assert compact.is_connected()
+
+    def test_from_graph_keeps_isolated_vertices(self):
+        """Test converting an UndirectedGraph."""
+        graph, _ = self.build_both()
+        graph.add_vertex('Z')
+
+        compact = CompactUndirectedGraph.from_graph(graph)
+
+        assert compact.get_vertices() == graph.get_vertices()
+        assert compact.get_edges() == graph.get_edges()
+        assert compact.degree('Z') == 0
+
+    def test_deep_traversals(self):
+        """Test that long paths do not hit the recursion limit."""
+        compact = CompactUndirectedGraph.from_edge_list(
+            (i, i + 1) for i in range(5000))
+
+        assert len(compact.dfs(0)) == 5001
+        assert compact.connected_components()[0][0] == 0
+        assert compact.is_connected()
+
+    def test_smaller_than_tuple_lists(self):
+        """Test that the footprint is well below the adjacency lists'."""
+        edges = [(i % 500, (i * 31 + 7) % 499, float(i)) for i in range(10000)]
+        graph = UndirectedGraph.from_edge_list(edges)
+        compact = CompactUndirectedGraph.from_edge_list(edges)
+
+        tuple_lists = sys.getsizeof(graph.graph) + sum(
+            sys.getsizeof(neighbors) + sum(map(sys.getsizeof, neighbors))
+            for neighbors in graph.graph.values())
+
+        assert compact.num_edges() == len(graph.get_edges())
+        assert compact.memory_footprint()['total'] * 2 < tuple_lists
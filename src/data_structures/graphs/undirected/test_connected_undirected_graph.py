@@ -0,0 +1,140 @@
+import pytest
+from connected_undirected_graph import ConnectedUndirectedGraph
+from undirected_graph import UndirectedGraph
+
+
+class TestConnectedUndirectedGraph:
+    """Test online connected components."""
+
+    def test_components_grow_online(self):
+        """Test that components merge as edges are added."""
+        graph = ConnectedUndirectedGraph()
+        graph.add_vertex('A')
+        graph.add_vertex('B')
+
+        assert graph.num_components() == 2
+        assert not graph.is_connected()
+        assert not graph.same_component('A', 'B')
+
+        graph.add_edge('A', 'B')
+        graph.add_edge('C', 'D')
+
+        assert graph.num_components() == 2
+        assert graph.same_component('A', 'B')
+        assert graph.component_of('C') == graph.component_of('D')
+        assert graph.component_of('A') != graph.component_of('C')
+
+        graph.add_edge('B', 'C')
+        assert graph.is_connected()
+        assert graph.connected_components() == [['A', 'B', 'C', 'D']]
+
+    def test_empty_graph(self):
+        """Test queries on an empty graph."""
+        graph = ConnectedUndirectedGraph()
+
+        assert graph.is_connected()
+        assert graph.num_components() == 0
+        assert graph.connected_components() == []
+
+    def test_duplicates_and_self_loops(self):
+        """Test that rejected edges do not affect the components."""
+        graph = ConnectedUndirectedGraph()
+
+        assert not graph.add_edge('A', 'A')
+        graph.add_edge('A', 'B')
+        assert not graph.add_edge('B', 'A')
+
+        assert graph.num_components() == 1
+        assert graph.connected_components() == [['A', 'B']]
+
+    def test_add_edges_from(self):
+        """Test that bulk ingestion merges components."""
+        graph = ConnectedUndirectedGraph()
+
+        added = graph.add_edges_from(
+            [(1, 2), (3, 4), (2, 1), (5, 5), (4, 6, 2.5)])
+
+        assert added == 3
+        assert graph.num_components() == 2
+        assert graph.same_component(3, 6)
+        assert 5 not in graph
+        assert graph.connected_components() == [[1, 2], [3, 4, 6]]
+
+    def test_remove_edge_splits_component(self):
+        """Test that components are rebuilt after removing an edge."""
+        graph = ConnectedUndirectedGraph()
+        graph.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'A'), ('C', 'D')])
+
+        graph.remove_edge('A', 'B')
+        assert graph.is_connected()
+
+        graph.remove_edge('C', 'D')
+        assert graph.num_components() == 2
+        assert not graph.same_component('A', 'D')
+
+        graph.add_edge('D', 'E')
+        assert graph.connected_components() == [['A', 'B', 'C'], ['D', 'E']]
+
+    def test_remove_vertex(self):
+        """Test that removing a cut vertex splits its component."""
+        graph = ConnectedUndirectedGraph()
+        graph.add_edges_from([('A', 'B'), ('B', 'C')])
+
+        graph.remove_vertex('B')
+        graph.add_vertex('D')
+
+        assert graph.num_components() == 3
+        assert not graph.same_component('A', 'C')
+
+    def test_missing_vertex(self):
+        """Test that unknown vertices raise ValueError."""
+        graph = ConnectedUndirectedGraph()
+        graph.add_vertex('A')
+
+        with pytest.raises(ValueError, match="not in graph"):
+            graph.component_of('Z')
+
+        with pytest.raises(ValueError, match="not in graph"):
+            graph.same_component('A', 'Z')
+
+    def test_matches_traversal(self):
+        """Test that the online components agree with a full traversal."""
+        graph = ConnectedUndirectedGraph()
+        reference = UndirectedGraph()
+        edges = [(i, (i * 7 + 3) % 50) for i in range(0, 50, 3)]
+
+        for u, v in edges:
+            graph.add_edge(u, v)
+            reference.add_edge(u, v)
+
+        graph.remove_vertex(3)
+        reference.remove_vertex(3)
+
+        expected = sorted(sorted(c) for c in reference.connected_components())
+        actual = sorted(sorted(c) for c in graph.connected_components())
+
+        assert actual == expected
+        assert graph.num_components() == len(expected)
+
+    def test_copy_snapshot_and_clear(self):
+        """Test that copies and snapshots keep independent components."""
+        graph = ConnectedUndirectedGraph()
+        graph.add_edge('A', 'B')
+        graph.add_vertex('C')
+
+        copied = graph.copy()
+        snap = graph.snapshot()
+        graph.add_edge('B', 'C')
+
+        assert isinstance(copied, ConnectedUndirectedGraph)
+        assert graph.is_connected()
+        assert copied.num_components() == 2
+        assert snap.num_components() == 2
+
+        snap.remove_edge('A', 'B')
+        assert snap.num_components() == 3
+        assert graph.is_connected()
+
+        graph.clear()
+        assert graph.num_components() == 0
+        assert repr(graph) == "ConnectedUndirectedGraph(vertices=0, edges=0)"
@@ -0,0 +1,94 @@
+import pytest
+from undirected_bit_graph import UndirectedBitGraph
+from undirected_matrix_graph import UndirectedMatrixGraph
+
+
+def build():
+    g = UndirectedBitGraph(7)
+    for u, v in [(0, 1), (0, 2), (1, 3), (2, 3), (5, 6)]:
+        g.add_edge(u, v)
+    return g
+
+
+class TestEdgeOperations:
+    """Tests for symmetric bit rows."""
+
+    def test_initialization(self):
+        """Test that rows start empty and bad sizes are rejected."""
+        assert UndirectedBitGraph(3).rows == [0, 0, 0]
+
+        with pytest.raises(ValueError, match="Number of vertices must be positive"):
+            UndirectedBitGraph(-2)
+
+    def test_add_and_remove_edge(self):
+        """Test that edges are set and cleared in both rows."""
+        g = build()
+
+        assert g.has_edge(3, 1)
+        assert g.rows[1] == 0b1001
+        assert g.remove_edge(3, 1)
+        assert not g.has_edge(1, 3)
+        assert not g.remove_edge(1, 3)
+
+    def test_degrees_and_edges(self):
+        """Test degrees and single listing of each edge."""
+        g = build()
+        g.add_edge(4, 4)
+
+        assert g.get_degree(0) == 2
+        assert g.get_neighbors(3) == [(1, 1), (2, 1)]
+        assert g.get_edges() == [(0, 1, 1), (0, 2, 1), (1, 3, 1), (2, 3, 1), (5, 6, 1)]
+        assert g.num_edges() == 5
+
+    def test_from_matrix_graph(self):
+        """Test conversion from a weighted matrix graph."""
+        matrix = UndirectedMatrixGraph(3)
+        matrix.add_edge(0, 2, 4)
+
+        g = UndirectedBitGraph.from_graph(matrix)
+
+        assert g.get_edges() == [(0, 2, 1)]
+
+    def test_from_matrix_graph_with_removed_vertex(self):
+        """Test that removed matrix ids become empty rows."""
+        matrix = UndirectedMatrixGraph(3)
+        matrix.add_edge(0, 1)
+        matrix.add_edge(0, 2)
+        matrix.remove_vertex(1)
+
+        g = UndirectedBitGraph.from_graph(matrix)
+
+        assert g.get_edges() == [(0, 2, 1)]
+        assert g.rows[1] == 0
+
+
+class TestBitParallelTraversal:
+    """Tests for BFS, reachability and components."""
+
+    def test_bfs_and_reachability(self):
+        """Test traversal within one component."""
+        g = build()
+
+        assert g.bfs(3) == [3, 1, 2, 0]
+        assert g.bfs_distances(0) == {0: 0, 1: 1, 2: 1, 3: 2}
+        assert g.is_reachable(3, 0)
+        assert not g.is_reachable(0, 6)
+
+    def test_connected_components(self):
+        """Test components, including an isolated vertex."""
+        g = build()
+
+        assert g.connected_components() == [[0, 1, 2, 3], [4], [5, 6]]
+        assert not g.is_connected()
+
+        g.add_edge(3, 4)
+        g.add_edge(4, 5)
+        assert g.is_connected()
+
+    def test_str(self):
+        """Test __str__ lists each edge once."""
+        g = UndirectedBitGraph(2)
+        g.add_edge(1, 0)
+
+        assert str(g) == "UndirectedBitGraph(2 vertices, 1 edges)\n0 -- 1"
+        assert repr(g) == "UndirectedBitGraph(num_vertices=2)"
@@ -1,5 +1,5 @@
 import pytest
-from undirected_graph import UndirectedGraph
+from undirected_graph import FrozenUndirectedGraph, UndirectedGraph
 
 
 class TestGraphInitialization:
@@ -538,3 +538,305 @@ class TestConnectivity:
 
         graph.add_vertex(1)
         assert graph.is_connected()
+
+
+class TestBulkIngestion:
+    """Tests for add_edges_from() and the from_* constructors."""
+
+    def test_add_edges_from_dedupes(self):
+        """Test that duplicates in either direction and self-loops are skipped."""
+        graph = UndirectedGraph()
+        graph.add_edge('A', 'B', 9)
+
+        added = graph.add_edges_from([('B', 'A', 1), ('A', 'C', 2), ('C', 'A', 3),
+                                      ('C', 'D'), ('D', 'D')])
+
+        assert added == 2
+        assert graph.get_edge_weight('B', 'A') == 9
+        assert graph.get_edge_weight('C', 'A') == 2
+        assert graph.degree('A') == 2
+        assert graph.degree('C') == 2
+        assert 'D' in graph
+        assert len(graph.get_edges()) == 3
+
+    def test_from_edge_list_generator(self):
+        """Test building from a generator matches per-edge insertion."""
+        expected = UndirectedGraph()
+        for i in range(100):
+            expected.add_edge(i % 10, (i * 7) % 13, i)
+
+        graph = UndirectedGraph.from_edge_list(
+            (i % 10, (i * 7) % 13, i) for i in range(100))
+
+        assert graph.get_edges() == expected.get_edges()
+        for vertex in expected.get_vertices():
+            assert graph.get_neighbors(vertex) == expected.get_neighbors(vertex)
+
+    def test_from_csv(self, tmp_path):
+        """Test streaming edges from a CSV file."""
+        path = tmp_path / "edges.csv"
+        path.write_text("a;b;2\nb;c;3\nc;a\n")
+
+        graph = UndirectedGraph.from_csv(str(path), delimiter=';', weight_type=int)
+
+        assert graph.get_edge_weight('a', 'b') == 2
+        assert graph.get_edge_weight('c', 'b') == 3
+        assert graph.get_edge_weight('a', 'c') == 1
+
+    def test_from_binary(self, tmp_path):
+        """Test streaming edges from a binary edge file."""
+        import struct
+
+        path = tmp_path / "edges.bin"
+        record = struct.Struct('<qqd')
+        path.write_bytes(b''.join(record.pack(u, v, w) for u, v, w in
+                                  [(0, 1, 1.0), (1, 0, 2.0), (1, 2, 2.5)]))
+
+        graph = UndirectedGraph.from_binary(str(path))
+
+        assert graph.get_edges() == [(0, 1, 1.0), (1, 2, 2.5)]
+
+
+class TestLazyTraversals:
+    """Tests for the iter_dfs() and iter_bfs() generators."""
+
+    def _graph(self):
+        graph = UndirectedGraph()
+
+        graph.add_edge(1, 2, 1)
+        graph.add_edge(1, 3, 9)
+        graph.add_edge(2, 4, 1)
+        graph.add_edge(3, 4, 1)
+        graph.add_edge(4, 5, 1)
+
+        return graph
+
+    def test_matches_eager_traversals(self):
+        """Test that full iteration matches dfs() and bfs()."""
+        graph = self._graph()
+
+        for start in graph.get_vertices():
+            assert list(graph.iter_dfs(start)) == graph.dfs(start)
+            assert list(graph.iter_bfs(start)) == graph.bfs(start)
+
+    def test_depth_and_filters(self):
+        """Test max_depth, filters and detailed output."""
+        graph = self._graph()
+
+        assert list(graph.iter_bfs(1, max_depth=1, detailed=True)) == [
+            (1, 0, None), (2, 1, 1), (3, 1, 1)]
+        assert list(graph.iter_bfs(1, edge_filter=lambda u, v, w: w < 5)) == [
+            1, 2, 4, 3, 5]
+        assert list(graph.iter_dfs(1, vertex_filter=lambda v: v != 4)) == [
+            1, 2, 3]
+
+    def test_unknown_start(self):
+        """Test that an unknown start vertex raises ValueError."""
+        with pytest.raises(ValueError):
+            next(self._graph().iter_bfs(99))
+
+
+class TestFreezeAndPersistence:
+    """Tests for freeze() snapshots and save()/load()."""
+
+    def _graph(self):
+        graph = UndirectedGraph()
+
+        graph.add_edge('A', 'B', 2)
+        graph.add_edge('A', 'C', 3)
+        graph.add_edge('B', 'C', 1.5)
+        graph.add_edge('D', 'E', 4)
+        graph.add_vertex('F')
+
+        return graph
+
+    def test_freeze_matches_graph(self):
+        """Test that the snapshot answers like the graph."""
+        graph = self._graph()
+        frozen = graph.freeze()
+
+        assert isinstance(frozen, FrozenUndirectedGraph)
+        assert repr(frozen) == "FrozenUndirectedGraph(vertices=6, edges=4)"
+        assert frozen.get_edges() == graph.get_edges()
+        assert frozen.get_neighbors('C') == graph.get_neighbors('C')
+        assert frozen.degree('A') == 2
+        assert frozen.has_edge('C', 'A')
+        assert not frozen.has_edge('A', 'D')
+        assert not frozen.has_edge('A', 'Z')
+        for vertex in graph.get_vertices():
+            assert frozen.dfs(vertex) == graph.dfs(vertex)
+            assert frozen.bfs(vertex) == graph.bfs(vertex)
+        assert sorted(map(sorted, frozen.connected_components())) == \
+            sorted(map(sorted, graph.connected_components()))
+        assert not frozen.is_connected()
+        assert UndirectedGraph().freeze().is_connected()
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_save_and_load(self, tmp_path, use_mmap):
+        """Test a save/load round trip."""
+        graph = self._graph()
+        path = str(tmp_path / "graph.bin")
+
+        graph.save(path)
+        loaded = UndirectedGraph.load(path, mmap=use_mmap)
+
+        assert isinstance(loaded, FrozenUndirectedGraph)
+        assert loaded.get_edges() == graph.get_edges()
+        assert loaded.bfs('A') == graph.bfs('A')
+        assert 'F' in loaded
+        assert 'Z' not in loaded
+
+        thawed = loaded.thaw()
+        assert isinstance(thawed, UndirectedGraph)
+        assert thawed.get_edges() == graph.get_edges()
+        thawed.add_edge('F', 'A')
+        assert thawed.degree('A') == 3
+
+    def test_labels_decoded_lazily(self, tmp_path):
+        """Test that a traversal only decodes the labels it needs."""
+        graph = UndirectedGraph()
+        graph.add_edge(500, 501)
+        for i in range(100):
+            graph.add_edge(i, i + 1)
+
+        path = str(tmp_path / "graph.bin")
+        graph.save(path)
+        loaded = UndirectedGraph.load(path)
+
+        assert loaded.bfs(500) == [500, 501]
+        decoded = [label for label in loaded.vertices._decoded
+                   if isinstance(label, int)]
+        assert decoded == [500, 501]
+
+    def test_load_rejects_other_files(self, tmp_path):
+        """Test that foreign files are rejected."""
+        path = tmp_path / "junk.bin"
+        path.write_bytes(b'x' * 64)
+
+        with pytest.raises(ValueError, match="not a saved undirected graph"):
+            UndirectedGraph.load(str(path))
+
+    def test_save_rejects_non_literal_labels(self, tmp_path):
+        """Test that labels without a literal repr cannot be saved."""
+        graph = UndirectedGraph()
+        graph.add_edge(object(), 'A')
+
+        with pytest.raises(ValueError, match="cannot be saved"):
+            graph.save(str(tmp_path / "graph.bin"))
+
+
+class TestSnapshots:
+    """Test copy-on-write snapshots."""
+
+    def build(self):
+        graph = UndirectedGraph()
+        graph.add_edge('A', 'B', 1)
+        graph.add_edge('B', 'C', 2)
+        graph.add_edge('C', 'D', 3)
+        return graph
+
+    def test_snapshot_shares_storage(self):
+        """Test that a snapshot copies nothing until written."""
+        graph = self.build()
+        snap = graph.snapshot()
+
+        assert snap.graph is graph.graph
+        assert snap.get_edges() == graph.get_edges()
+
+    def test_edits_are_independent(self):
+        """Test that both sides can be edited without affecting each other."""
+        graph = self.build()
+        snap = graph.snapshot()
+
+        graph.add_edge('A', 'C')
+        graph.update_edge_weight('B', 'C', 20)
+        snap.remove_vertex('D')
+        snap.add_edges_from([('A', 'E'), ('E', 'A')])
+
+        assert graph.has_edge('A', 'C')
+        assert graph.get_edge_weight('C', 'B') == 20
+        assert 'E' not in graph
+        assert graph.has_edge('C', 'D')
+        assert not snap.has_edge('A', 'C')
+        assert snap.get_edge_weight('B', 'C') == 2
+        assert snap.has_edge('E', 'A')
+        assert 'D' not in snap
+
+    def test_untouched_lists_stay_shared(self):
+        """Test that only the edited vertices' adjacency lists are copied."""
+        graph = self.build()
+        snap = graph.snapshot()
+
+        graph.add_edge('A', 'C')
+
+        assert graph.graph['A'] is not snap.graph['A']
+        assert graph.graph['C'] is not snap.graph['C']
+        assert graph.graph['B'] is snap.graph['B']
+        assert graph.graph['D'] is snap.graph['D']
+
+    def test_nested_snapshots(self):
+        """Test that snapshots of snapshots stay independent."""
+        graph = self.build()
+        first = graph.snapshot()
+        graph.add_edge('D', 'E')
+        second = first.snapshot()
+        second.clear()
+        graph.remove_edge('A', 'B')
+
+        assert first.get_edges() == [('A', 'B', 1), ('B', 'C', 2), ('C', 'D', 3)]
+        assert second.is_empty()
+        assert graph.degree('E') == 1
+
+
+class TestTriangles:
+    """Test triangle counting and clustering coefficients."""
+
+    def naive_triangles(self, graph):
+        counts = {}
+        for v in graph.get_vertices():
+            neighbors = [n for n, _ in graph.get_neighbors(v)]
+            counts[v] = sum(1 for i, a in enumerate(neighbors)
+                            for b in neighbors[i + 1:] if graph.has_edge(a, b))
+        return counts
+
+    def test_single_triangle(self):
+        """Test a triangle with a pendant vertex."""
+        graph = UndirectedGraph.from_edge_list(
+            [('A', 'B'), ('B', 'C'), ('C', 'A'), ('C', 'D')])
+
+        assert graph.triangle_count() == 1
+        assert graph.triangles() == {'A': 1, 'B': 1, 'C': 1, 'D': 0}
+        assert graph.local_clustering() == {
+            'A': 1.0, 'B': 1.0, 'C': 1 / 3, 'D': 0.0}
+        # 1 triangle, triples: A 1, B 1, C 3
+        assert graph.global_clustering() == pytest.approx(3 / 5)
+
+    def test_complete_graph(self):
+        """Test K5: C(5, 3) triangles and all coefficients 1."""
+        graph = UndirectedGraph.from_edge_list(
+            (u, v) for u in range(5) for v in range(u + 1, 5))
+
+        assert graph.triangle_count() == 10
+        assert set(graph.triangles().values()) == {6}
+        assert set(graph.local_clustering().values()) == {1.0}
+        assert graph.global_clustering() == 1.0
+
+    def test_triangle_free_and_empty(self):
+        """Test graphs without triangles."""
+        square = UndirectedGraph.from_edge_list([(1, 2), (2, 3), (3, 4), (4, 1)])
+
+        assert square.triangle_count() == 0
+        assert square.global_clustering() == 0.0
+        assert UndirectedGraph().triangle_count() == 0
+        assert UndirectedGraph().global_clustering() == 0.0
+        assert UndirectedGraph().local_clustering() == {}
+
+    def test_matches_naive_count(self):
+        """Test against a brute force count on a pseudo-random graph."""
+        graph = UndirectedGraph.from_edge_list(
+            ((i * 7) % 40, (i * 13 + 5) % 40) for i in range(200))
+
+        expected = self.naive_triangles(graph)
+
+        assert graph.triangles() == expected
+        assert graph.triangle_count() == sum(expected.values()) // 3
@@ -349,6 +349,80 @@ class TestGetEdges:
         assert not ((0, 1) in edge_pairs and (1, 0) in edge_pairs)
 
 
+class TestVertexManagement:
+    """Tests for adding and removing vertices."""
+
+    def test_add_vertex_grows_matrix(self):
+        """Test that a new vertex gets the next id and an empty row/column."""
+        g = UndirectedMatrixGraph(2)
+        g.add_edge(0, 1, 4)
+
+        assert g.add_vertex() == 2
+        assert g.num_vertices == 3
+        assert len(g.matrix) == 3
+        assert all(len(row) == 3 for row in g.matrix)
+        assert g.get_weight(0, 1) == 4
+
+        g.add_edge(2, 0, 7)
+        assert g.get_neighbors(0) == [(1, 4), (2, 7)]
+
+    def test_ids_stable_across_growth(self):
+        """Test that growing many times keeps every edge on its ids."""
+        g = UndirectedMatrixGraph(1)
+        for _ in range(50):
+            v = g.add_vertex()
+            g.add_edge(v - 1, v, v)
+
+        assert g.num_vertices == 51
+        assert all(g.get_weight(v - 1, v) == v for v in range(1, 51))
+        assert g.get_degree(0) == 1
+
+    def test_remove_vertex_clears_edges(self):
+        """Test that removing a vertex drops all its edges."""
+        g = UndirectedMatrixGraph(3)
+        g.add_edge(0, 1)
+        g.add_edge(1, 2)
+        g.add_edge(0, 2)
+
+        assert g.remove_vertex(1)
+        assert not g.remove_vertex(1)
+        assert g.get_degree(0) == 1
+        assert g.get_edges() == [(0, 2, 1)]
+        assert g.get_vertices() == [0, 2]
+        assert not g.has_vertex(1)
+
+    def test_removed_vertex_rejected(self):
+        """Test that a removed id can't be used until it is reused."""
+        g = UndirectedMatrixGraph(3)
+        g.remove_vertex(2)
+
+        with pytest.raises(IndexError, match="removed"):
+            g.add_edge(0, 2)
+        with pytest.raises(IndexError):
+            g.remove_vertex(3)
+
+    def test_free_slots_reused_lowest_first(self):
+        """Test that add_vertex reuses removed ids before growing."""
+        g = UndirectedMatrixGraph(4)
+        g.remove_vertex(3)
+        g.remove_vertex(1)
+
+        assert g.add_vertex() == 1
+        assert g.add_vertex() == 3
+        assert g.add_vertex() == 4
+        assert g.get_neighbors(1) == []
+        assert g.get_vertices() == [0, 1, 2, 3, 4]
+
+    def test_removed_vertex_not_counted(self):
+        """Test that str and repr report the live vertex count."""
+        g = UndirectedMatrixGraph(3)
+        g.add_edge(0, 1)
+        g.remove_vertex(1)
+
+        assert repr(g) == "UndirectedMatrixGraph(num_vertices=2)"
+        assert "2 vertices, 0 edges" in str(g)
+
+
 class TestStringRepresentation:
     """Tests for string and repr methods."""
 
@@ -0,0 +1,105 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from undirected_numpy_graph import UndirectedNumpyGraph
+
+
+class TestEdgeOperations:
+    """Tests for symmetric edge storage."""
+
+    def test_initialization(self):
+        """Test that the graph starts empty and rejects bad sizes."""
+        g = UndirectedNumpyGraph(3)
+
+        assert g.weights.shape == (3, 3)
+        assert g.num_edges() == 0
+
+        with pytest.raises(ValueError, match="Number of vertices must be positive"):
+            UndirectedNumpyGraph(-1)
+
+    def test_add_and_remove_edge(self):
+        """Test that edges are visible from both endpoints."""
+        g = UndirectedNumpyGraph(3)
+        g.add_edge(0, 2, 7)
+
+        assert g.has_edge(2, 0)
+        assert g.get_weight(2, 0) == 7.0
+        assert g.remove_edge(2, 0)
+        assert not g.has_edge(0, 2)
+        assert not g.remove_edge(0, 2)
+
+    def test_out_of_bounds(self):
+        """Test that invalid vertices raise IndexError."""
+        g = UndirectedNumpyGraph(2)
+
+        with pytest.raises(IndexError, match="out of bounds"):
+            g.get_degree(2)
+
+
+class TestVectorizedQueries:
+    """Tests for neighbors, degrees and edge enumeration."""
+
+    def build(self):
+        g = UndirectedNumpyGraph(4)
+        g.add_edge(0, 1, 1)
+        g.add_edge(0, 2, 2)
+        g.add_edge(1, 2, 3)
+        g.add_edge(2, 3, 4)
+        return g
+
+    def test_neighbors_and_degrees(self):
+        """Test neighbor lists and degrees."""
+        g = self.build()
+
+        assert g.get_neighbors(2) == [(0, 2.0), (1, 3.0), (3, 4.0)]
+        assert g.get_degree(2) == 3
+        assert g.degrees().tolist() == [2, 2, 3, 1]
+
+    def test_edges_listed_once(self):
+        """Test that each edge is listed once with u < v."""
+        g = self.build()
+        g.add_edge(3, 3, 9)
+
+        assert g.get_edges() == [(0, 1, 1.0), (0, 2, 2.0), (1, 2, 3.0), (2, 3, 4.0)]
+        assert g.num_edges() == 4
+
+
+class TestBulkAddEdges:
+    """Tests for add_edges()."""
+
+    def test_add_edges_symmetric(self):
+        """Test that bulk edges are stored in both directions."""
+        g = UndirectedNumpyGraph(4)
+
+        g.add_edges([0, 3], [1, 1], [5.0, 6.0])
+
+        assert g.get_weight(1, 0) == 5.0
+        assert g.get_weight(1, 3) == 6.0
+        assert g.get_degree(1) == 2
+
+    def test_later_duplicate_wins_both_ways(self):
+        """Test that reversed duplicates behave like repeated add_edge()."""
+        g = UndirectedNumpyGraph(2)
+
+        g.add_edges([0, 1], [1, 0], [1.0, 2.0])
+
+        assert g.get_weight(0, 1) == g.get_weight(1, 0) == 2.0
+
+    def test_add_edges_validation(self):
+        """Test that bad indices are rejected."""
+        g = UndirectedNumpyGraph(2)
+
+        with pytest.raises(IndexError, match="out of bounds"):
+            g.add_edges([0], [-1])
+
+
+class TestStringRepresentations:
+    """Tests for __str__ and __repr__."""
+
+    def test_str_and_repr(self):
+        g = UndirectedNumpyGraph(2)
+        g.add_edge(1, 0, 2)
+
+        assert str(g) == "UndirectedNumpyGraph(2 vertices, 1 edges)\n0 --(2.0)-- 1"
+        assert repr(g) == "UndirectedNumpyGraph(num_vertices=2)"
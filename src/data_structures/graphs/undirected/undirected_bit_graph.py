@@ -0,0 +1,238 @@
+def _bits(mask):
+    """Indices of the set bits of mask, ascending (via one C-level bin())."""
+    digits = bin(mask)[:1:-1]
+    return [i for i, digit in enumerate(digits) if digit == '1']
+
+
+class UndirectedBitGraph:
+    """
+      Implements an unweighted Undirected Graph as a bit-packed adjacency
+      matrix: row u is a Python int whose bit v is set when u and v are
+      adjacent (rows are kept symmetric). That is one bit per cell instead
+      of a list slot (8 bytes) per cell, and traversals OR whole rows
+      together at once.
+    """
+
+    directed = False
+
+    def __init__(self, num_vertices):
+        """
+        Initialize an undirected graph with num_vertices vertices and no edges.
+
+        Time Complexity: O(V)
+        Space Complexity: O(V² / 8) bytes once the rows fill up
+        """
+        if num_vertices <= 0:
+            raise ValueError("Number of vertices must be positive")
+
+        self.num_vertices = num_vertices
+        self.rows = [0] * num_vertices
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Build from a matrix graph (or anything with num_vertices and
+        get_neighbors()), ignoring weights. Ids removed from a matrix graph
+        keep their index as a vertex with no edges.
+
+        Time Complexity: O(V + E) plus the cost of get_neighbors()
+        """
+        bit_graph = cls(graph.num_vertices)
+        vertices = (graph.get_vertices() if hasattr(graph, 'has_vertex')
+                    else range(graph.num_vertices))
+
+        for u in vertices:
+            for v, _ in graph.get_neighbors(u):
+                bit_graph.rows[u] |= 1 << v
+                bit_graph.rows[v] |= 1 << u
+
+        return bit_graph
+
+    def add_edge(self, u, v):
+        """
+        Adds an edge BETWEEN u and v (symmetric).
+
+        Time Complexity: O(V / 64), since Python ints are immutable
+        """
+        self._validate_vertices(u, v)
+        self.rows[u] |= 1 << v
+        self.rows[v] |= 1 << u
+
+    def remove_edge(self, u, v):
+        """
+        Removes the edge BETWEEN u and v (both directions).
+
+        Time Complexity: O(V / 64)
+        Returns: True if edge was removed, False if no edge existed
+        """
+        self._validate_vertices(u, v)
+
+        if self.rows[u] >> v & 1:
+            self.rows[u] &= ~(1 << v)
+            self.rows[v] &= ~(1 << u)
+            return True
+
+        return False
+
+    def has_edge(self, u, v):
+        """
+        Checks if an edge exists BETWEEN u and v.
+
+        Time Complexity: O(1)
+        """
+        self._validate_vertices(u, v)
+        return bool(self.rows[u] >> v & 1)
+
+    def get_neighbors(self, u):
+        """
+        Returns a list of (vertex, weight) tuples for all edges connected
+        to u. Every edge has weight 1.
+
+        Time Complexity: O(V)
+        """
+        self._validate_vertex(u)
+        return [(v, 1) for v in _bits(self.rows[u])]
+
+    def get_degree(self, v):
+        """
+        Returns the degree (number of edges) connected to vertex v.
+
+        Time Complexity: O(V / 64)
+        """
+        self._validate_vertex(v)
+        return self.rows[v].bit_count()
+
+    def get_edges(self):
+        """
+        Returns a list of all edges as (u, v, 1) tuples.
+        Each edge appears once (only includes u < v to avoid duplicates).
+
+        Time Complexity: O(V²)
+        """
+        return [(u, v, 1) for u in range(self.num_vertices)
+                for v in _bits(self.rows[u] >> (u + 1) << (u + 1))]
+
+    def num_edges(self):
+        """
+        Returns the number of edges (self-loops excluded, as in get_edges()).
+
+        Time Complexity: O(V² / 64)
+        """
+        loops = sum(row >> u & 1 for u, row in enumerate(self.rows))
+        return (sum(row.bit_count() for row in self.rows) - loops) // 2
+
+    def _levels(self, start):
+        """
+        Bit-parallel BFS: yields the frontier of each level as a bitmask.
+        The next frontier is the OR of the frontier's rows minus everything
+        already visited, so each vertex's row is ORed exactly once.
+
+        Time Complexity: O(V² / 64) word operations
+        """
+        self._validate_vertex(start)
+        frontier = visited = 1 << start
+
+        while frontier:
+            yield frontier
+            reached = 0
+            for u in _bits(frontier):
+                reached |= self.rows[u]
+            frontier = reached & ~visited
+            visited |= frontier
+
+    def bfs(self, start):
+        """
+        Breadth-First Search from start. Returns vertices level by level,
+        ascending within a level.
+
+        Time Complexity: O(V² / 64)
+        """
+        return [v for frontier in self._levels(start) for v in _bits(frontier)]
+
+    def bfs_distances(self, start):
+        """
+        Returns a dict of hop counts from start to every reachable vertex.
+
+        Time Complexity: O(V² / 64)
+        """
+        return {v: depth for depth, frontier in enumerate(self._levels(start))
+                for v in _bits(frontier)}
+
+    def reachable_mask(self, start):
+        """
+        Returns a bitmask of every vertex reachable from start (including
+        start).
+
+        Time Complexity: O(V² / 64)
+        """
+        mask = 0
+        for frontier in self._levels(start):
+            mask |= frontier
+        return mask
+
+    def reachable(self, start):
+        """
+        Returns the ascending list of vertices reachable from start.
+
+        Time Complexity: O(V² / 64)
+        """
+        return _bits(self.reachable_mask(start))
+
+    def is_reachable(self, u, v):
+        """
+        Checks if there is a path BETWEEN u and v, stopping at the level
+        that reaches v.
+
+        Time Complexity: O(V² / 64) worst case
+        """
+        self._validate_vertex(v)
+        target = 1 << v
+        return any(frontier & target for frontier in self._levels(u))
+
+    def connected_components(self):
+        """
+        Returns the connected components as ascending lists of vertices,
+        each found by one bit-parallel BFS.
+
+        Time Complexity: O(V² / 64)
+        """
+        components = []
+        remaining = (1 << self.num_vertices) - 1
+
+        while remaining:
+            start = (remaining & -remaining).bit_length() - 1
+            component = self.reachable_mask(start)
+            components.append(_bits(component))
+            remaining &= ~component
+
+        return components
+
+    def is_connected(self):
+        """
+        Checks if every vertex is reachable from vertex 0.
+
+        Time Complexity: O(V² / 64)
+        """
+        return self.reachable_mask(0) == (1 << self.num_vertices) - 1
+
+    def _validate_vertex(self, v):
+        """Validates a single vertex index."""
+        if not (0 <= v < self.num_vertices):
+            raise IndexError(
+                f"Vertex {v} out of bounds [0, {self.num_vertices})")
+
+    def _validate_vertices(self, u, v):
+        """Validates two vertex indices."""
+        self._validate_vertex(u)
+        self._validate_vertex(v)
+
+    def __str__(self):
+        """String representation showing edge list."""
+        edges = [f"{u} -- {v}" for u, v, _ in self.get_edges()]
+
+        return f"UndirectedBitGraph({self.num_vertices} vertices, {len(edges)} edges)\n" + \
+               "\n".join(
+                   edges) if edges else f"UndirectedBitGraph({self.num_vertices} vertices, 0 edges)"
+
+    def __repr__(self):
+        return f"UndirectedBitGraph(num_vertices={self.num_vertices})"
@@ -1,8 +1,14 @@
 from __future__ import annotations
+import copy
+from array import array
 from collections import defaultdict, deque
 from typing import (
-    Any, Dict, List, Optional, Set, Tuple,
-    TypeVar, Hashable, Generic, Deque
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Set,
+    Tuple, TypeVar, Hashable, Generic, Deque
+)
+
+from src.data_structures.graphs.graph_io import (
+    FrozenGraph, iter_binary_edges, iter_csv_edges
 )
 
 V = TypeVar('V', bound=Hashable)
@@ -15,6 +21,8 @@ class UndirectedGraph(Generic[V, W]):
     Uses adjacency list representation for efficiency.
     """
 
+    directed = False
+
     def __init__(self) -> None:
         """
         Initialize an empty undirected graph.
@@ -22,6 +30,11 @@ class UndirectedGraph(Generic[V, W]):
         Time Complexity: O(1)
         """
         self.graph: Dict[V, List[Tuple[V, W]]] = defaultdict(list)
+        # True while self.graph is shared with a snapshot
+        self._shared: bool = False
+        # Vertices whose adjacency list this graph has its own copy of,
+        # or None when nothing is shared
+        self._owned: Optional[Set[V]] = None
 
     def add_vertex(self, vertex: V) -> None:
         """
@@ -30,6 +43,7 @@ class UndirectedGraph(Generic[V, W]):
         Time Complexity: O(1)
         """
         if vertex not in self.graph:
+            self._detach()
             self.graph[vertex]
 
     def add_edge(self, vertex1: V, vertex2: V, weight: W = 1) -> bool:
@@ -52,11 +66,98 @@ class UndirectedGraph(Generic[V, W]):
             return False
 
         # Add edge in both directions
+        self._own(vertex1)
+        self._own(vertex2)
         self.graph[vertex1].append((vertex2, weight))
         self.graph[vertex2].append((vertex1, weight))
 
         return True
 
+    def add_edges_from(self, edges: Iterable[Tuple]) -> int:
+        """
+        Add many (vertex1, vertex2) or (vertex1, vertex2, weight) edges in one
+        pass. Self-loops and duplicates (against the graph and within the
+        batch, in either direction) are skipped using a per-vertex set,
+        instead of a linear scan per edge. Accepts any iterable, so edges can
+        be streamed from a generator.
+
+        Time Complexity: O(k + sum of existing degrees of touched vertices)
+        where k is the number of edges given
+
+        Returns:
+            int: Number of edges actually added
+        """
+        self._detach()
+        graph = self.graph
+        known: Dict[V, Set[V]] = {}
+        added = 0
+
+        for vertex1, vertex2, *rest in edges:
+            if vertex1 == vertex2:
+                continue
+
+            neighbors = known.get(vertex1)
+            if neighbors is None:
+                neighbors = known[vertex1] = {
+                    neighbor for neighbor, _ in graph[vertex1]}
+
+            if vertex2 in neighbors:
+                continue
+
+            weight = rest[0] if rest else 1
+            self._own(vertex1)
+            self._own(vertex2)
+            graph[vertex1].append((vertex2, weight))
+            graph[vertex2].append((vertex1, weight))
+            neighbors.add(vertex2)
+
+            # A set built later is derived from the list, which is up to date
+            if vertex2 in known:
+                known[vertex2].add(vertex1)
+
+            added += 1
+
+        return added
+
+    @classmethod
+    def from_edge_list(cls, edges: Iterable[Tuple]) -> 'UndirectedGraph[V, W]':
+        """
+        Build a graph from an iterable of (vertex1, vertex2) or
+        (vertex1, vertex2, weight) tuples.
+
+        Time Complexity: O(k) where k is the number of edges given
+        """
+        graph = cls()
+        graph.add_edges_from(edges)
+
+        return graph
+
+    @classmethod
+    def from_csv(cls, path: str, delimiter: str = ',', has_header: bool = False,
+                 vertex_type: Callable[[str], Any] = str,
+                 weight_type: Callable[[str], Any] = float) -> 'UndirectedGraph':
+        """
+        Build a graph by streaming rows of "vertex1,vertex2[,weight]" from a
+        CSV file.
+
+        Time Complexity: O(k) where k is the number of rows
+
+        Raises:
+            ValueError: If a row does not have two or three columns
+        """
+        return cls.from_edge_list(
+            iter_csv_edges(path, delimiter, has_header, vertex_type, weight_type))
+
+    @classmethod
+    def from_binary(cls, path: str) -> 'UndirectedGraph[int, float]':
+        """
+        Build a graph by streaming fixed-size (int64, int64, float64) little
+        endian edge records from a binary file.
+
+        Time Complexity: O(k) where k is the number of records
+        """
+        return cls.from_edge_list(iter_binary_edges(path))
+
     def remove_vertex(self, vertex: V) -> bool:
         """
         Remove a vertex and all edges connected to it.
@@ -69,6 +170,8 @@ class UndirectedGraph(Generic[V, W]):
         if vertex not in self.graph:
             return False
 
+        self._detach()
+
         # Remove all edges from neighbors pointing to this vertex
         for neighbor, _ in self.graph[vertex]:
             if neighbor in self.graph:
@@ -92,6 +195,7 @@ class UndirectedGraph(Generic[V, W]):
         if vertex1 not in self.graph or vertex2 not in self.graph:
             return False
 
+        self._detach()
         original_length1 = len(self.graph[vertex1])
         original_length2 = len(self.graph[vertex2])
 
@@ -198,6 +302,7 @@ class UndirectedGraph(Generic[V, W]):
         # Update in both directions
         for i, (neighbor, _) in enumerate(self.graph[vertex1]):
             if neighbor == vertex2:
+                self._own(vertex1)
                 self.graph[vertex1][i] = (neighbor, new_weight)
                 updated = True
                 break
@@ -205,6 +310,7 @@ class UndirectedGraph(Generic[V, W]):
         if updated:
             for i, (neighbor, _) in enumerate(self.graph[vertex2]):
                 if neighbor == vertex1:
+                    self._own(vertex2)
                     self.graph[vertex2][i] = (neighbor, new_weight)
                     break
 
@@ -284,6 +390,99 @@ class UndirectedGraph(Generic[V, W]):
 
         return result
 
+    def iter_dfs(self, start_vertex: V, max_depth: Optional[int] = None,
+                 vertex_filter: Optional[Callable[[V], bool]] = None,
+                 edge_filter: Optional[Callable[[V, V, W], bool]] = None,
+                 detailed: bool = False) -> Iterator:
+        """
+        Lazy Depth-First Search from start_vertex, yielding vertices in the
+        same order as dfs() as they are discovered. Stop iterating to stop
+        the search.
+
+        Args:
+            max_depth: Do not expand vertices at this depth (start is depth 0)
+            vertex_filter: vertex -> bool; rejected vertices are neither
+                yielded nor expanded (start_vertex is always yielded)
+            edge_filter: (from, to, weight) -> bool; rejected edges are skipped
+            detailed: Yield (vertex, depth, parent) tuples instead of vertices
+
+        Time Complexity: O(V + E) for a full traversal, less when stopped early
+
+        Raises:
+            ValueError: If start_vertex not in graph
+        """
+        if start_vertex not in self.graph:
+            raise ValueError(f"Vertex {start_vertex} not in graph")
+
+        visited: Set[V] = set()
+        stack: List[Tuple[V, int, Optional[V]]] = [(start_vertex, 0, None)]
+
+        while stack:
+            vertex, depth, parent = stack.pop()
+
+            if vertex in visited:
+                continue
+
+            visited.add(vertex)
+            yield (vertex, depth, parent) if detailed else vertex
+
+            if max_depth is not None and depth >= max_depth:
+                continue
+
+            # Add neighbors in reverse to maintain left-to-right order
+            for neighbor, weight in reversed(self.graph[vertex]):
+                if neighbor in visited:
+                    continue
+                if edge_filter is not None and not edge_filter(vertex, neighbor, weight):
+                    continue
+                if vertex_filter is not None and not vertex_filter(neighbor):
+                    continue
+                stack.append((neighbor, depth + 1, vertex))
+
+    def iter_bfs(self, start_vertex: V, max_depth: Optional[int] = None,
+                 vertex_filter: Optional[Callable[[V], bool]] = None,
+                 edge_filter: Optional[Callable[[V, V, W], bool]] = None,
+                 detailed: bool = False) -> Iterator:
+        """
+        Lazy Breadth-First Search from start_vertex, yielding vertices in the
+        same order as bfs(). A vertex's neighbors are only examined after it
+        has been yielded, so stopping early skips the rest of the component.
+
+        Args:
+            max_depth: Do not expand vertices at this depth (start is depth 0)
+            vertex_filter: vertex -> bool; rejected vertices are neither
+                yielded nor expanded (start_vertex is always yielded)
+            edge_filter: (from, to, weight) -> bool; rejected edges are skipped
+            detailed: Yield (vertex, depth, parent) tuples instead of vertices
+
+        Time Complexity: O(V + E) for a full traversal, less when stopped early
+
+        Raises:
+            ValueError: If start_vertex not in graph
+        """
+        if start_vertex not in self.graph:
+            raise ValueError(f"Vertex {start_vertex} not in graph")
+
+        visited: Set[V] = {start_vertex}
+        queue: Deque[Tuple[V, int, Optional[V]]] = deque([(start_vertex, 0, None)])
+
+        while queue:
+            vertex, depth, parent = queue.popleft()
+            yield (vertex, depth, parent) if detailed else vertex
+
+            if max_depth is not None and depth >= max_depth:
+                continue
+
+            for neighbor, weight in self.graph[vertex]:
+                if neighbor in visited:
+                    continue
+                if edge_filter is not None and not edge_filter(vertex, neighbor, weight):
+                    continue
+                if vertex_filter is not None and not vertex_filter(neighbor):
+                    continue
+                visited.add(neighbor)
+                queue.append((neighbor, depth + 1, vertex))
+
     def has_cycle(self) -> bool:
         """
         Check if the graph has a cycle using DFS.
@@ -355,6 +554,92 @@ class UndirectedGraph(Generic[V, W]):
 
         return len(visited) == len(self.graph)
 
+    def _forward_neighbors(self) -> Dict[V, Set[V]]:
+        """
+        Orient every edge from the endpoint of lower degree to the one of
+        higher degree (ties broken by insertion order). Every vertex then
+        has at most O(sqrt(E)) out-neighbors, which bounds triangle listing.
+
+        Time Complexity: O(V log V + E)
+        """
+        rank = {vertex: i for i, vertex in enumerate(
+            sorted(self.graph, key=lambda v: len(self.graph[v])))}
+
+        return {vertex: {neighbor for neighbor, _ in edges
+                         if rank[neighbor] > rank[vertex]}
+                for vertex, edges in self.graph.items()}
+
+    def _iter_triangles(self) -> Iterator[Tuple[V, V, V]]:
+        """
+        Yield every triangle exactly once, by intersecting the forward
+        neighbor sets of each oriented edge (set intersection iterates the
+        smaller set).
+
+        Time Complexity: O(E^1.5)
+        """
+        forward = self._forward_neighbors()
+
+        for u, successors in forward.items():
+            for v in successors:
+                for w in successors & forward[v]:
+                    yield u, v, w
+
+    def triangle_count(self) -> int:
+        """
+        Count the triangles in the graph using degree-ordered orientation.
+
+        Time Complexity: O(E^1.5)
+        """
+        return sum(1 for _ in self._iter_triangles())
+
+    def triangles(self) -> Dict[V, int]:
+        """
+        Count the triangles each vertex belongs to.
+
+        Time Complexity: O(V + E^1.5)
+
+        Returns:
+            Dict mapping every vertex to its triangle count
+        """
+        counts = dict.fromkeys(self.graph, 0)
+
+        for u, v, w in self._iter_triangles():
+            counts[u] += 1
+            counts[v] += 1
+            counts[w] += 1
+
+        return counts
+
+    def local_clustering(self) -> Dict[V, float]:
+        """
+        Local clustering coefficient of every vertex: the fraction of pairs
+        of its neighbors that are themselves connected. Vertices of degree
+        below 2 have coefficient 0.
+
+        Time Complexity: O(V + E^1.5)
+        """
+        coefficients = {}
+
+        for vertex, count in self.triangles().items():
+            degree = len(self.graph[vertex])
+            coefficients[vertex] = (
+                2 * count / (degree * (degree - 1)) if degree > 1 else 0.0)
+
+        return coefficients
+
+    def global_clustering(self) -> float:
+        """
+        Global clustering coefficient (transitivity): three times the number
+        of triangles over the number of connected triples (paths of length
+        two). 0 for a graph without any such triple.
+
+        Time Complexity: O(V + E^1.5)
+        """
+        triples = sum(len(edges) * (len(edges) - 1) // 2
+                      for edges in self.graph.values())
+
+        return 3 * self.triangle_count() / triples if triples else 0.0
+
     def copy(self) -> 'UndirectedGraph[V, W]':
         """
         Create a deep copy of the graph.
@@ -363,21 +648,86 @@ class UndirectedGraph(Generic[V, W]):
         """
         new_graph = UndirectedGraph()
 
-        # Add all vertices
-        for vertex in self.graph:
-            new_graph.add_vertex(vertex)
-
-        # Add all edges (each edge appears twice in adjacency list)
-        seen = set()
-        for vertex1 in self.graph:
-            for vertex2, weight in self.graph[vertex1]:
-                edge = frozenset([vertex1, vertex2])
-                if edge not in seen:
-                    seen.add(edge)
-                    new_graph.add_edge(vertex1, vertex2, weight)
+        # Copy all adjacency lists (each edge already appears at both ends)
+        for vertex, edges in self.graph.items():
+            new_graph.graph[vertex] = list(edges)
 
         return new_graph
 
+    def snapshot(self) -> 'UndirectedGraph[V, W]':
+        """
+        Create a copy-on-write snapshot of the graph. The snapshot and this
+        graph share their adjacency lists until one of them is edited; the
+        first edit after a snapshot takes a shallow copy of the vertex map
+        (a pointer copy), and after that each edit copies only the adjacency
+        lists of the vertices it touches. Either graph may be edited freely.
+
+        Time Complexity: O(1)
+        """
+        clone = copy.copy(self)
+        self._shared = clone._shared = True
+        # Nothing is exclusively owned any more, on either side
+        self._owned = set()
+        clone._owned = set()
+
+        return clone
+
+    def _detach(self) -> None:
+        """
+        Give this graph a private copy of its vertex map if it is shared
+        with a snapshot. Called before any structural edit.
+
+        Time Complexity: O(1) when not shared, O(V) shallow copy otherwise
+        """
+        if self._shared:
+            self.graph = copy.copy(self.graph)
+            self._shared = False
+
+    def _own(self, vertex: V) -> None:
+        """
+        Give this graph a private copy of vertex's adjacency list before it
+        is edited in place.
+
+        Time Complexity: O(1) when already owned, O(deg(v)) otherwise
+        """
+        self._detach()
+
+        if self._owned is not None and vertex not in self._owned:
+            if vertex in self.graph:
+                self.graph[vertex] = list(self.graph[vertex])
+            self._owned.add(vertex)
+
+    def freeze(self) -> 'FrozenUndirectedGraph[V, W]':
+        """
+        Create an immutable CSR (compressed sparse row) snapshot of the graph.
+        Vertices are interned to dense integer ids in insertion order.
+
+        Time Complexity: O(V + E)
+        """
+        return FrozenUndirectedGraph.from_graph(self)
+
+    def save(self, path: str) -> None:
+        """
+        Save the graph to a binary file (a CSR snapshot plus a label table).
+
+        Time Complexity: O(V + E)
+
+        Raises:
+            ValueError: If weights are not all numbers or a vertex label is
+            not a Python literal
+        """
+        self.freeze().save(path)
+
+    @staticmethod
+    def load(path: str, mmap: bool = True) -> 'FrozenUndirectedGraph':
+        """
+        Load a graph saved with save() as a read-only snapshot, memory
+        mapped by default. Call thaw() on the result for a mutable graph.
+
+        Time Complexity: O(1) with mmap, O(file size) without
+        """
+        return FrozenUndirectedGraph.load(path, mmap)
+
     def is_empty(self) -> bool:
         """
         Check if the graph has any vertices.
@@ -392,7 +742,9 @@ class UndirectedGraph(Generic[V, W]):
 
         Time Complexity: O(1)
         """
+        self._detach()
         self.graph.clear()
+        self._owned = None
 
     def __contains__(self, vertex: V) -> bool:
         """
@@ -436,4 +788,198 @@ class UndirectedGraph(Generic[V, W]):
         # Each edge is stored twice, so divide by 2
         num_edges = sum(len(edges) for edges in self.graph.values()) // 2
 
-        return f"UndirectedGraph(vertices={num_vertices}, edges={num_edges})"
+        return f"{type(self).__name__}(vertices={num_vertices}, edges={num_edges})"
+
+
+class FrozenUndirectedGraph(FrozenGraph[V, W]):
+    """
+    An immutable undirected graph snapshot in compressed sparse row (CSR)
+    form. Vertex labels are interned to dense ids 0..V-1 and the neighbors
+    of vertex i live in targets[offsets[i]:offsets[i + 1]]; like the
+    adjacency lists, every edge is stored once per endpoint.
+    """
+
+    MAGIC = b'UGRAPH01'
+    KIND = 'undirected graph'
+    directed = False
+
+    def thaw(self) -> UndirectedGraph[V, W]:
+        """
+        Build a mutable UndirectedGraph with the same vertices and edges.
+
+        Time Complexity: O(V + E)
+        """
+        graph: UndirectedGraph[V, W] = UndirectedGraph()
+        labels = list(self.vertices)
+
+        for i, vertex in enumerate(labels):
+            graph.graph[vertex] = [
+                (labels[self.targets[k]], self.weights[k])
+                for k in range(self.offsets[i], self.offsets[i + 1])]
+
+        return graph
+
+    def get_neighbors(self, vertex: V) -> List[Tuple[V, W]]:
+        """
+        Get all neighbors of a vertex with their weights.
+
+        Time Complexity: O(E_v) where E_v is the degree of vertex
+
+        Raises:
+            ValueError: If vertex not in graph
+        """
+        i = self.vertex_id(vertex)
+
+        return [(self.vertices[self.targets[k]], self.weights[k])
+                for k in range(self.offsets[i], self.offsets[i + 1])]
+
+    def get_edges(self) -> List[Tuple[V, V, W]]:
+        """
+        Get all edges as a list of (vertex1, vertex2, weight) tuples.
+        Each edge appears only once.
+
+        Time Complexity: O(V + E)
+        """
+        edges = []
+        labels = self.vertices
+
+        for i in range(len(labels)):
+            for k in range(self.offsets[i], self.offsets[i + 1]):
+                # Each edge is stored at both endpoints; keep the first
+                if i < self.targets[k]:
+                    edges.append((labels[i], labels[self.targets[k]],
+                                  self.weights[k]))
+
+        return edges
+
+    def has_edge(self, vertex1: V, vertex2: V) -> bool:
+        """
+        Check if there's an edge between vertex1 and vertex2.
+
+        Time Complexity: O(E_v) where E_v is the degree of vertex1
+        """
+        i, j = self._find(vertex1), self._find(vertex2)
+
+        if i is None or j is None:
+            return False
+
+        return j in self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def degree(self, vertex: V) -> int:
+        """
+        Get the degree of a vertex.
+
+        Time Complexity: O(1)
+
+        Raises:
+            ValueError: If vertex not in graph
+        """
+        i = self.vertex_id(vertex)
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def dfs(self, start_vertex: V) -> List[V]:
+        """
+        Depth-First Search traversal starting from start_vertex.
+        Produces the same order as UndirectedGraph.dfs.
+
+        Time Complexity: O(V + E)
+
+        Raises:
+            ValueError: If start_vertex not in graph
+        """
+        offsets, targets = self.offsets, self.targets
+        visited = bytearray(len(self.vertices))
+        stack = [self.vertex_id(start_vertex)]
+        order = []
+
+        while stack:
+            u = stack.pop()
+
+            if not visited[u]:
+                visited[u] = 1
+                order.append(u)
+                # Push neighbors in reverse to maintain left-to-right order
+                stack.extend(reversed(targets[offsets[u]:offsets[u + 1]]))
+
+        return [self.vertices[u] for u in order]
+
+    def bfs(self, start_vertex: V) -> List[V]:
+        """
+        Breadth-First Search traversal starting from start_vertex.
+        Produces the same order as UndirectedGraph.bfs.
+
+        Time Complexity: O(V + E)
+
+        Raises:
+            ValueError: If start_vertex not in graph
+        """
+        return [self.vertices[u] for u in self._bfs_ids(self.vertex_id(start_vertex),
+                                                        bytearray(len(self.vertices)))]
+
+    def _bfs_ids(self, start: int, visited: bytearray) -> List[int]:
+        """
+        BFS over ids from start, marking vertices in visited.
+
+        Time Complexity: O(size of the component)
+        """
+        offsets, targets = self.offsets, self.targets
+        visited[start] = 1
+        order = [start]
+
+        # The order list doubles as the FIFO queue
+        head = 0
+        while head < len(order):
+            u = order[head]
+            head += 1
+
+            for k in range(offsets[u], offsets[u + 1]):
+                t = targets[k]
+                if not visited[t]:
+                    visited[t] = 1
+                    order.append(t)
+
+        return order
+
+    def connected_components(self) -> List[List[V]]:
+        """
+        Find all connected components in the snapshot (iterative BFS).
+
+        Time Complexity: O(V + E)
+        """
+        visited = bytearray(len(self.vertices))
+        components = []
+
+        for start in range(len(self.vertices)):
+            if not visited[start]:
+                component = self._bfs_ids(start, visited)
+                components.append([self.vertices[u] for u in component])
+
+        return components
+
+    def is_connected(self) -> bool:
+        """
+        Check if every vertex is reachable from vertex 0.
+
+        Time Complexity: O(V + E)
+        """
+        if not len(self.vertices):
+            return True
+
+        return len(self._bfs_ids(0, bytearray(len(self.vertices)))) == len(self.vertices)
+
+    def num_edges(self) -> int:
+        """
+        Get the number of edges.
+
+        Time Complexity: O(1)
+        """
+        return len(self.targets) // 2
+
+    def __repr__(self) -> str:
+        """
+        Unambiguous representation of the snapshot.
+
+        Time Complexity: O(1)
+        """
+        return (f"FrozenUndirectedGraph(vertices={len(self.vertices)}, "
+                f"edges={len(self.targets) // 2})")
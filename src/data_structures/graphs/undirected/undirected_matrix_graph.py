@@ -1,3 +1,6 @@
+import heapq
+
+
 class UndirectedMatrixGraph:
     """
     Implements an Undirected Weighted Graph using an Adjacency Matrix.
@@ -5,6 +8,8 @@ class UndirectedMatrixGraph:
     Uses None to represent absence of edges (allowing zero-weight edges).
     """
 
+    directed = False
+
     def __init__(self, num_vertices):
         """
         Initialize an undirected weighted graph with num_vertices vertices.
@@ -16,6 +21,66 @@ class UndirectedMatrixGraph:
 
         self.num_vertices = num_vertices
         self.matrix = [[None] * num_vertices for _ in range(num_vertices)]
+        # Ids of removed vertices: a min-heap for reuse plus a set for lookups
+        self._free = []
+        self._removed = set()
+
+    def add_vertex(self):
+        """
+        Adds an isolated vertex and returns its id. Removed ids are reused,
+        lowest first, before the matrix grows; growing appends a column to
+        every row and one new row. List appends over-allocate geometrically,
+        so this costs amortized O(V) instead of an O(V²) rebuild, and
+        existing ids never change.
+        Time Complexity: amortized O(V), O(log V) when reusing an id
+        """
+        if self._free:
+            v = heapq.heappop(self._free)
+            self._removed.discard(v)
+            return v
+
+        v = self.num_vertices
+        for row in self.matrix:
+            row.append(None)
+        self.matrix.append([None] * (v + 1))
+        self.num_vertices += 1
+
+        return v
+
+    def remove_vertex(self, v):
+        """
+        Removes vertex v and all its edges. Its id goes on the free list for
+        add_vertex() to reuse; every other id is unchanged.
+        Time Complexity: O(V)
+        Returns: True if the vertex was removed, False if already removed
+        """
+        if not (0 <= v < self.num_vertices):
+            raise IndexError(
+                f"Vertex {v} out of bounds [0, {self.num_vertices})")
+        if v in self._removed:
+            return False
+
+        for row in self.matrix:
+            row[v] = None
+        self.matrix[v] = [None] * self.num_vertices
+        self._removed.add(v)
+        heapq.heappush(self._free, v)
+
+        return True
+
+    def has_vertex(self, v):
+        """
+        Checks if v is the id of a vertex in the graph.
+        Time Complexity: O(1)
+        """
+        return 0 <= v < self.num_vertices and v not in self._removed
+
+    def get_vertices(self):
+        """
+        Returns the ids of all vertices in ascending order, skipping removed ones.
+        Time Complexity: O(V)
+        """
+        return [v for v in range(self.num_vertices) if v not in self._removed]
 
     def add_edge(self, u, v, weight=1):
         """
@@ -93,6 +158,8 @@ class UndirectedMatrixGraph:
         if not (0 <= v < self.num_vertices):
             raise IndexError(
                 f"Vertex {v} out of bounds [0, {self.num_vertices})")
+        if v in self._removed:
+            raise IndexError(f"Vertex {v} has been removed")
 
     def _validate_vertices(self, u, v):
         """Validates two vertex indices."""
@@ -101,14 +168,15 @@ class UndirectedMatrixGraph:
 
     def __str__(self):
         """String representation showing edge list."""
+        num_vertices = len(self.get_vertices())
         edges = []
         for u in range(self.num_vertices):
             for v in range(u + 1, self.num_vertices):  # Avoid duplicates
                 if self.matrix[u][v] is not None:
                     edges.append(f"{u} --({self.matrix[u][v]})-- {v}")
-        return f"UndirectedMatrixGraph({self.num_vertices} vertices, {len(edges)} edges)\n" + \
+        return f"UndirectedMatrixGraph({num_vertices} vertices, {len(edges)} edges)\n" + \
                "\n".join(
-                   edges) if edges else f"UndirectedMatrixGraph({self.num_vertices} vertices, 0 edges)"
+                   edges) if edges else f"UndirectedMatrixGraph({num_vertices} vertices, 0 edges)"
 
     def __repr__(self):
-        return f"UndirectedMatrixGraph(num_vertices={self.num_vertices})"
+        return f"UndirectedMatrixGraph(num_vertices={len(self.get_vertices())})"
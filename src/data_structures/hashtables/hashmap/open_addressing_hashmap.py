@@ -0,0 +1,238 @@
+from array import array
+from typing import TypeVar, Generic, List, Tuple, Optional
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+# Key slot markers: never used, and emptied by remove() (a tombstone, which
+# lookups must probe past)
+_EMPTY = object()
+_DELETED = object()
+
+
+class OpenAddressingHashMap(Generic[K, V]):
+    """
+    Hash map using open addressing with linear probing. Instead of a list
+    of (key, value) tuple buckets, every slot lives in three parallel
+    preallocated arrays: the full hash (a typed int64 array), the key and
+    the value. An entry costs three machine words per slot, updates
+    overwrite the value in place, and the stored hashes let probes skip
+    key comparisons and let resizes skip calling hash() again.
+    """
+
+    def __init__(self, initial_capacity: int = 16) -> None:
+        """
+        Initialize hash map with at least the given capacity, rounded up to
+        a power of two so slots can be picked with a bit mask.
+
+        Time Complexity: O(n) where n is initial_capacity
+        """
+        capacity = 8
+        while capacity < initial_capacity:
+            capacity *= 2
+
+        self.size = 0
+        self.load_factor = 0.7
+        # Number of tombstones, which count towards the load
+        self.deleted = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Replace the slot arrays with empty ones of the given capacity.
+
+        Time Complexity: O(n) where n is capacity
+        """
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._hashes = array('q', bytes(8 * capacity))
+        self._keys: List = [_EMPTY] * capacity
+        self._values: List[Optional[V]] = [None] * capacity
+
+    def _slot(self, h: int) -> int:
+        """
+        First slot to probe for hash h. High bits are folded in so keys
+        that differ only above the mask (e.g. ints with a power-of-two
+        stride) don't all start on the same slot.
+
+        Time Complexity: O(1)
+        """
+        return (h ^ (h >> 16) ^ (h >> 32)) & self._mask
+
+    def _find(self, key: K, h: int) -> int:
+        """
+        Index of the slot holding key, or -1 if it is absent.
+
+        Time Complexity: O(1) average, O(n) worst case
+        """
+        hashes, keys, mask = self._hashes, self._keys, self._mask
+        i = self._slot(h)
+
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                return -1
+            if hashes[i] == h and k is not _DELETED and (k is key or k == key):
+                return i
+            i = (i + 1) & mask
+
+    def _resize(self) -> None:
+        """
+        Rebuild the table without tombstones, doubling the capacity unless
+        tombstones were what filled it. Reuses the stored hashes.
+
+        Time Complexity: O(n) where n is the capacity
+        """
+        old_hashes, old_keys, old_values = self._hashes, self._keys, self._values
+
+        if self.size * 2 >= self.capacity * self.load_factor:
+            self._allocate(self.capacity * 2)
+        else:
+            self._allocate(self.capacity)
+        self.deleted = 0
+
+        hashes, keys, values, mask = self._hashes, self._keys, self._values, self._mask
+
+        for h, k, v in zip(old_hashes, old_keys, old_values):
+            if k is _EMPTY or k is _DELETED:
+                continue
+
+            i = self._slot(h)
+            while keys[i] is not _EMPTY:
+                i = (i + 1) & mask
+
+            hashes[i] = h
+            keys[i] = k
+            values[i] = v
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Insert or update a key-value pair. An update only overwrites the
+        value slot; an insert reuses the first tombstone on the probe path.
+
+        Time Complexity: O(1) average, O(n) worst case (with resizing)
+        """
+        if self.size + self.deleted + 1 > self.capacity * self.load_factor:
+            self._resize()
+
+        h = hash(key)
+        hashes, keys, mask = self._hashes, self._keys, self._mask
+        i = self._slot(h)
+        tombstone = -1
+
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                break
+            if k is _DELETED:
+                if tombstone < 0:
+                    tombstone = i
+            elif hashes[i] == h and (k is key or k == key):
+                self._values[i] = value
+                return
+            i = (i + 1) & mask
+
+        if tombstone >= 0:
+            i = tombstone
+            self.deleted -= 1
+
+        hashes[i] = h
+        keys[i] = key
+        self._values[i] = value
+        self.size += 1
+
+    def get(self, key: K) -> V:
+        """
+        Retrieve value for a given key.
+
+        Time Complexity: O(1) average, O(n) worst case
+        """
+        i = self._find(key, hash(key))
+
+        if i < 0:
+            raise KeyError(f"Key '{key}' not found")
+
+        return self._values[i]
+
+    def remove(self, key: K) -> V:
+        """
+        Remove a key-value pair, leaving a tombstone so later keys on the
+        same probe path stay reachable.
+
+        Time Complexity: O(1) average, O(n) worst case
+        """
+        i = self._find(key, hash(key))
+
+        if i < 0:
+            raise KeyError(f"Key '{key}' not found")
+
+        value = self._values[i]
+        self._keys[i] = _DELETED
+        self._values[i] = None
+        self.size -= 1
+        self.deleted += 1
+
+        return value
+
+    def contains(self, key: K) -> bool:
+        """
+        Check if key exists in hash map.
+
+        Time Complexity: O(1) average, O(n) worst case
+        """
+        return self._find(key, hash(key)) >= 0
+
+    def keys(self) -> List[K]:
+        """
+        Return all keys.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        return [k for k in self._keys if k is not _EMPTY and k is not _DELETED]
+
+    def values(self) -> List[V]:
+        """
+        Return all values.
+
+        Time Complexity: O(n)
+        """
+        return [v for k, v in zip(self._keys, self._values)
+                if k is not _EMPTY and k is not _DELETED]
+
+    def items(self) -> List[Tuple[K, V]]:
+        """
+        Return all key-value pairs.
+
+        Time Complexity: O(n)
+        """
+        return [(k, v) for k, v in zip(self._keys, self._values)
+                if k is not _EMPTY and k is not _DELETED]
+
+    def __len__(self) -> int:
+        """
+        Return number of key-value pairs.
+
+        Time Complexity: O(1)
+        """
+        return self.size
+
+    def __str__(self) -> str:
+        """
+        String representation.
+
+        Time Complexity: O(n)
+        """
+        items = self.items()
+        return "{" + ", ".join(f"'{k}': {v}" for k, v in items) + "}"
+
+    def __repr__(self) -> str:
+        """
+        Official string representation for debugging.
+
+        Time Complexity: O(n)
+        """
+        items = self.items()
+        items_str = ", ".join(f"{k!r}: {v!r}" for k, v in items)
+        return (f"OpenAddressingHashMap({{{items_str}}}, size={self.size}, "
+                f"capacity={self.capacity})")
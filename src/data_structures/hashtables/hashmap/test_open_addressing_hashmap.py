@@ -0,0 +1,244 @@
+import random
+
+import pytest
+from open_addressing_hashmap import OpenAddressingHashMap
+
+
+class CollidingKey:
+    """Key whose instances all share one hash, forcing long probe runs."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and self.name == other.name
+
+    def __repr__(self):
+        return f"CollidingKey({self.name!r})"
+
+
+class TestOpenAddressingBasicOperations:
+    """Test basic CRUD operations."""
+
+    def test_initialization(self):
+        """Test hash map initializes with correct defaults."""
+        hm = OpenAddressingHashMap()
+
+        assert len(hm) == 0
+        assert hm.capacity == 16
+        assert hm.size == 0
+
+    def test_capacity_rounds_up_to_power_of_two(self):
+        """Test custom capacities are rounded up to a power of two."""
+        assert OpenAddressingHashMap(initial_capacity=20).capacity == 32
+        assert OpenAddressingHashMap(initial_capacity=1).capacity == 8
+
+    def test_put_and_get(self):
+        """Test inserting and retrieving several pairs."""
+        hm = OpenAddressingHashMap()
+
+        hm.put("apple", 5)
+        hm.put("banana", 3)
+        hm.put("cherry", 7)
+
+        assert len(hm) == 3
+        assert hm.get("apple") == 5
+        assert hm.get("banana") == 3
+        assert hm.get("cherry") == 7
+
+    def test_put_updates_existing_key(self):
+        """Test that putting an existing key updates its value."""
+        hm = OpenAddressingHashMap()
+
+        hm.put("key", "old")
+        hm.put("key", "new")
+
+        assert len(hm) == 1
+        assert hm.get("key") == "new"
+
+    def test_get_nonexistent_key_raises_keyerror(self):
+        """Test that getting a missing key raises KeyError."""
+        hm = OpenAddressingHashMap()
+
+        with pytest.raises(KeyError, match="Key 'missing' not found"):
+            hm.get("missing")
+
+    def test_remove_existing_key(self):
+        """Test removing a key returns its value."""
+        hm = OpenAddressingHashMap()
+        hm.put("a", 1)
+        hm.put("b", 2)
+
+        assert hm.remove("a") == 1
+        assert len(hm) == 1
+        assert not hm.contains("a")
+        assert hm.get("b") == 2
+
+    def test_remove_nonexistent_key_raises_keyerror(self):
+        """Test that removing a missing key raises KeyError."""
+        hm = OpenAddressingHashMap()
+
+        with pytest.raises(KeyError):
+            hm.remove("missing")
+
+    def test_contains(self):
+        """Test membership checks."""
+        hm = OpenAddressingHashMap()
+        hm.put(0, "zero")
+
+        assert hm.contains(0)
+        assert not hm.contains(1)
+
+    def test_none_and_falsy_values(self):
+        """Test that None and falsy values are stored like any other."""
+        hm = OpenAddressingHashMap()
+        hm.put("none", None)
+        hm.put("", 0)
+
+        assert hm.contains("none")
+        assert hm.get("none") is None
+        assert hm.get("") == 0
+
+
+class TestOpenAddressingCollections:
+    """Test keys, values and items."""
+
+    def test_empty_map(self):
+        """Test collections of an empty map."""
+        hm = OpenAddressingHashMap()
+
+        assert hm.keys() == []
+        assert hm.values() == []
+        assert hm.items() == []
+
+    def test_collections_skip_removed(self):
+        """Test that removed entries don't show up."""
+        hm = OpenAddressingHashMap()
+        for i in range(5):
+            hm.put(f"k{i}", i)
+        hm.remove("k2")
+
+        assert sorted(hm.keys()) == ["k0", "k1", "k3", "k4"]
+        assert sorted(hm.values()) == [0, 1, 3, 4]
+        assert set(hm.items()) == {("k0", 0), ("k1", 1), ("k3", 3), ("k4", 4)}
+
+
+class TestOpenAddressingProbing:
+    """Test collisions, tombstones and resizing."""
+
+    def test_colliding_keys(self):
+        """Test keys with identical hashes are kept apart."""
+        hm = OpenAddressingHashMap()
+        keys = [CollidingKey(i) for i in range(10)]
+        for i, key in enumerate(keys):
+            hm.put(key, i)
+
+        assert all(hm.get(CollidingKey(i)) == i for i in range(10))
+
+    def test_lookup_past_tombstone(self):
+        """Test that removing an earlier key keeps later ones on the run reachable."""
+        hm = OpenAddressingHashMap()
+        for i in range(4):
+            hm.put(CollidingKey(i), i)
+
+        hm.remove(CollidingKey(1))
+
+        assert hm.get(CollidingKey(3)) == 3
+        assert not hm.contains(CollidingKey(1))
+        assert hm.deleted == 1
+
+    def test_insert_reuses_tombstone(self):
+        """Test that an insert fills the first tombstone on its probe path."""
+        hm = OpenAddressingHashMap()
+        for i in range(4):
+            hm.put(CollidingKey(i), i)
+        hm.remove(CollidingKey(0))
+
+        hm.put(CollidingKey(9), 9)
+
+        assert hm.deleted == 0
+        assert len(hm) == 4
+        assert hm.get(CollidingKey(9)) == 9
+
+    def test_update_past_tombstone_does_not_duplicate(self):
+        """Test that updating a key behind a tombstone updates it in place."""
+        hm = OpenAddressingHashMap()
+        for i in range(3):
+            hm.put(CollidingKey(i), i)
+        hm.remove(CollidingKey(0))
+
+        hm.put(CollidingKey(2), "updated")
+
+        assert len(hm) == 2
+        assert hm.keys().count(CollidingKey(2)) == 1
+        assert hm.get(CollidingKey(2)) == "updated"
+
+    def test_resize_doubles_capacity(self):
+        """Test capacity doubles once the load factor is exceeded."""
+        hm = OpenAddressingHashMap(initial_capacity=8)
+
+        for i in range(10):
+            hm.put(f"key{i}", i)
+
+        assert hm.capacity == 16
+        assert all(hm.get(f"key{i}") == i for i in range(10))
+
+    def test_tombstones_cleared_without_growing(self):
+        """Test that churn rebuilds the table in place instead of growing it."""
+        hm = OpenAddressingHashMap(initial_capacity=16)
+
+        for i in range(1000):
+            hm.put(i, i)
+            hm.remove(i)
+
+        assert hm.capacity == 16
+        assert len(hm) == 0
+        assert hm.deleted < 16
+
+    def test_strided_int_keys(self):
+        """Test ints differing only above the mask still spread out."""
+        hm = OpenAddressingHashMap()
+        for i in range(200):
+            hm.put(i << 20, i)
+
+        assert all(hm.get(i << 20) == i for i in range(200))
+
+    def test_matches_dict(self):
+        """Test a random mix of operations against a dict."""
+        rng = random.Random(0)
+        hm = OpenAddressingHashMap()
+        expected = {}
+
+        for _ in range(5000):
+            key = rng.randrange(300)
+            if rng.random() < 0.3 and key in expected:
+                assert hm.remove(key) == expected.pop(key)
+            else:
+                hm.put(key, rng.random())
+                expected[key] = hm.get(key)
+
+        assert len(hm) == len(expected)
+        assert dict(hm.items()) == expected
+
+
+class TestOpenAddressingStringRepresentations:
+    """Test string and repr methods."""
+
+    def test_str(self):
+        """Test string representation."""
+        hm = OpenAddressingHashMap()
+        assert str(hm) == "{}"
+
+        hm.put("a", 1)
+        assert str(hm) == "{'a': 1}"
+
+    def test_repr(self):
+        """Test repr includes contents, size and capacity."""
+        hm = OpenAddressingHashMap()
+        hm.put("key", "value")
+
+        assert repr(hm) == ("OpenAddressingHashMap({'key': 'value'}, "
+                            "size=1, capacity=16)")
@@ -165,6 +165,46 @@ class TestUnion:
             uf.union(0, 10)
 
 
+class TestAddAndCopy:
+    """Test growing and copying a UnionFind."""
+
+    def test_add_element(self):
+        """Test that add() appends a new singleton set."""
+        uf = UnionFind(2)
+        uf.union(0, 1)
+
+        assert uf.add() == 2
+        assert len(uf) == 3
+        assert uf.components == 2
+        assert not uf.connected(0, 2)
+
+        uf.union(1, 2)
+        assert uf.components == 1
+
+    def test_add_to_empty(self):
+        """Test growing an empty UnionFind."""
+        uf = UnionFind(0)
+
+        assert uf.add() == 0
+        assert uf.find(0) == 0
+        assert uf.components == 1
+
+    def test_copy_is_independent(self):
+        """Test that a copy does not share state with the original."""
+        uf = UnionFind(4)
+        uf.union(0, 1)
+        clone = uf.copy()
+
+        clone.union(2, 3)
+        clone.add()
+
+        assert uf.components == 3
+        assert len(uf) == 4
+        assert not uf.connected(2, 3)
+        assert clone.components == 3
+        assert clone.connected(0, 1)
+
+
 class TestConnected:
     """Test connected operation."""
 
@@ -12,6 +12,31 @@ class UnionFind:
         self._components: int = n
         self._n: int = n  # Cache size for O(1) access
 
+    def add(self) -> int:
+        """
+        Add a new element in its own set and return its index.
+        Time complexity: O(1) amortized
+        """
+        self.parent.append(self._n)
+        self.rank.append(0)
+        self._components += 1
+        self._n += 1
+
+        return self._n - 1
+
+    def copy(self) -> 'UnionFind':
+        """
+        Return an independent copy of the structure.
+        Time complexity: O(n)
+        """
+        clone = UnionFind(0)
+        clone.parent = self.parent.copy()
+        clone.rank = self.rank.copy()
+        clone._components = self._components
+        clone._n = self._n
+
+        return clone
+
     def find(self, x: int) -> int:
         """
         Find the root of the set containing x with path compression.